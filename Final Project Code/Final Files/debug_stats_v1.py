@@ -0,0 +1,7 @@
+# Malik F (mhf68) & Hetao Y (hy668)
+# Debug Stats v1
+# One switch for the counters every game prints on exit (quality governor, caches, pools, pipeline occupancy).
+# Off by default so the launcher's output only shows game events. Turn it on when tuning.
+# October 19, 2026
+
+DEBUG_STATS = False
@@ -0,0 +1,163 @@
+# Malik F (mhf68) & Hetao Y (hy668)
+# Drone Sprite Cache v1
+# Pre-renders the 2D drone at quantized yaw angles for every propeller phase, so a frame is one blit instead of 15 draw calls.
+# Collision uses a pixel mask of the drone (arms, propeller discs, body) cached per yaw step, tested only after a box check.
+# Moves can be swept, so a fast drone or a slow frame rate cannot jump over thin obstacles.
+# October 19, 2026
+
+import math
+import pygame
+
+# Quantization settings
+YAW_STEPS = 72        # 5 degrees per sprite
+PROP_PHASES = 3       # Matches (frame_count % 3) propeller animation
+SWEEP_STEP = 4        # Pixels between mask tests along a swept move
+
+# Drone geometry (motor offsets before rotation)
+ARM_OFFSETS = [(-30, -30), (30, -30), (30, 30), (-30, 30)]   # fl, fr, br, bl
+PROP_RADIUS = 12
+
+# Sprite is big enough for a rotated arm plus the largest propeller ring
+SPRITE_HALF = int(math.ceil(30 * math.sqrt(2))) + PROP_RADIUS + (PROP_PHASES - 1) * 2 + 2
+SPRITE_SIZE = SPRITE_HALF * 2
+
+# Caches shared by all games (kept across game switches)
+_sprites = {}
+_point_table = []
+_masks = {}           # yaw index -> (mask, tight box inside the sprite)
+_circle_masks = {}    # radius -> filled circle mask
+
+
+# Map any yaw in degrees to its sprite index
+def yaw_index(angle):
+    return int(round(angle * YAW_STEPS / 360.0)) % YAW_STEPS
+
+# Motor offsets for every yaw index
+def _build_point_table():
+    for i in range(YAW_STEPS):
+        rad = math.radians(i * 360.0 / YAW_STEPS)
+        c, s = math.cos(rad), math.sin(rad)
+        # Rounded so int() of exact angles (90, 180...) lands on the same pixel as the sprite
+        _point_table.append(tuple((round(px * c - py * s, 6), round(px * s + py * c, 6)) for px, py in ARM_OFFSETS))
+
+# Return (center, fl, fr, br, bl) for the drone at (cx, cy)
+def get_drone_points(cx, cy, angle):
+    if not _point_table:
+        _build_point_table()
+    (a, b), (c, d), (e, f), (g, h) = _point_table[yaw_index(angle)]
+    return ((cx, cy), (cx + a, cy + b), (cx + c, cy + d), (cx + e, cy + f), (cx + g, cy + h))
+
+# Draw body, arms, and motors with primitives (used to fill the cache)
+def draw_drone_primitives(surface, points, prop_phase):
+    center, fl, fr, br, bl = points
+    pygame.draw.line(surface, (50, 50, 50), fl, br, 6)
+    pygame.draw.line(surface, (50, 50, 50), fr, bl, 6)
+
+    # Animation effect for propellers.
+    prop_offset = prop_phase * 2
+
+    for i, (mx, my) in enumerate((fl, fr, br, bl)):
+        pygame.draw.circle(surface, (30, 30, 30), (int(mx), int(my)), 6)
+        pygame.draw.circle(surface, (255, 255, 255), (int(mx), int(my)), PROP_RADIUS + prop_offset, 1)
+        led_color = (255, 50, 50) if i < 2 else (50, 255, 50)
+        pygame.draw.circle(surface, led_color, (int(mx), int(my)), 3)
+
+    cx, cy = center
+    pygame.draw.circle(surface, (80, 100, 140), (int(cx), int(cy)), 8)
+
+# Render one cached sprite, in display format if a display is set
+def _render_sprite(index, phase):
+    sprite = pygame.Surface((SPRITE_SIZE, SPRITE_SIZE), pygame.SRCALPHA)
+    points = get_drone_points(SPRITE_HALF, SPRITE_HALF, index * 360.0 / YAW_STEPS)
+    draw_drone_primitives(sprite, points, phase)
+    if pygame.display.get_surface():
+        sprite = sprite.convert_alpha()
+    return sprite
+
+# Pre-render every yaw/phase combination (only done once per run)
+def build_drone_sprites():
+    if len(_sprites) == YAW_STEPS * PROP_PHASES:
+        return
+    for index in range(YAW_STEPS):
+        for phase in range(PROP_PHASES):
+            if (index, phase) not in _sprites:
+                _sprites[(index, phase)] = _render_sprite(index, phase)
+
+# Blit the cached drone centered at (cx, cy)
+def draw_drone(surface, cx, cy, angle, frame_count):
+    key = (yaw_index(angle), frame_count % PROP_PHASES)
+    sprite = _sprites.get(key)
+    if sprite is None:
+        sprite = _sprites[key] = _render_sprite(*key)
+    surface.blit(sprite, (int(cx) - SPRITE_HALF, int(cy) - SPRITE_HALF))
+
+# Collision silhouette for one yaw step: propeller discs count as solid, the spinning ring is not needed
+def _render_mask(index):
+    surface = pygame.Surface((SPRITE_SIZE, SPRITE_SIZE), pygame.SRCALPHA)
+    center, fl, fr, br, bl = get_drone_points(SPRITE_HALF, SPRITE_HALF, index * 360.0 / YAW_STEPS)
+    pygame.draw.line(surface, (255, 255, 255), fl, br, 6)
+    pygame.draw.line(surface, (255, 255, 255), fr, bl, 6)
+    for mx, my in (fl, fr, br, bl):
+        pygame.draw.circle(surface, (255, 255, 255), (int(mx), int(my)), PROP_RADIUS)
+    pygame.draw.circle(surface, (255, 255, 255), (int(center[0]), int(center[1])), 8)
+    mask = pygame.mask.from_surface(surface)
+    rects = mask.get_bounding_rects()
+    return mask, rects[0].unionall(rects)
+
+# Cached (mask, box) for a yaw angle
+def get_drone_mask(angle):
+    index = yaw_index(angle)
+    entry = _masks.get(index)
+    if entry is None:
+        entry = _masks[index] = _render_mask(index)
+    return entry
+
+# Tight bounding box of the drone at (cx, cy), placed like draw_drone
+def drone_hit_box(cx, cy, angle):
+    return get_drone_mask(angle)[1].move(int(cx) - SPRITE_HALF, int(cy) - SPRITE_HALF)
+
+# Pixel test against a rect (x, y, w, h), the mask is only used if the boxes overlap
+def drone_hits_rect(cx, cy, angle, rect):
+    mask, box = get_drone_mask(angle)
+    ox, oy = int(cx) - SPRITE_HALF, int(cy) - SPRITE_HALF
+    clip = box.move(ox, oy).clip(rect)
+    if not clip.w or not clip.h:
+        return False
+    return mask.overlap(pygame.mask.Mask(clip.size, fill=True), (clip.x - ox, clip.y - oy)) is not None
+
+# Pixel test against a ball, circle masks are cached per radius
+def drone_hits_circle(cx, cy, angle, bx, by, radius):
+    mask, box = get_drone_mask(angle)
+    ox, oy = int(cx) - SPRITE_HALF, int(cy) - SPRITE_HALF
+    r = int(radius)
+    left, top = int(bx) - r, int(by) - r
+    if not box.move(ox, oy).colliderect((left, top, 2 * r + 1, 2 * r + 1)):
+        return False
+    circle = _circle_masks.get(r)
+    if circle is None:
+        surface = pygame.Surface((2 * r + 1, 2 * r + 1), pygame.SRCALPHA)
+        pygame.draw.circle(surface, (255, 255, 255), (r, r), r)
+        circle = _circle_masks[r] = pygame.mask.from_surface(surface)
+    return mask.overlap(circle, (left - ox, top - oy)) is not None
+
+# Box covering the whole move from (x0, y0) to (x1, y1)
+def drone_sweep_box(x0, y0, x1, y1, angle):
+    return drone_hit_box(x0, y0, angle).union(drone_hit_box(x1, y1, angle))
+
+# Positions along a move, SWEEP_STEP apart (only the end position for short moves)
+def _sweep_positions(x0, y0, x1, y1):
+    steps = int(math.ceil(max(abs(x1 - x0), abs(y1 - y0)) / SWEEP_STEP)) or 1
+    return [(x0 + (x1 - x0) * i / steps, y0 + (y1 - y0) * i / steps) for i in range(1, steps + 1)]
+
+# Swept test against a rect at its end position. Start at (x0, y0) plus how far the rect moved, so its motion counts too.
+def drone_sweep_hits_rect(x0, y0, x1, y1, angle, rect):
+    if not drone_sweep_box(x0, y0, x1, y1, angle).colliderect(rect):
+        return False
+    return any(drone_hits_rect(px, py, angle, rect) for px, py in _sweep_positions(x0, y0, x1, y1))
+
+# Swept test against a ball at its end position (same relative start as for rects)
+def drone_sweep_hits_circle(x0, y0, x1, y1, angle, bx, by, radius):
+    r = int(radius)
+    if not drone_sweep_box(x0, y0, x1, y1, angle).colliderect((int(bx) - r, int(by) - r, 2 * r + 1, 2 * r + 1)):
+        return False
+    return any(drone_hits_circle(px, py, angle, bx, by, radius) for px, py in _sweep_positions(x0, y0, x1, y1))
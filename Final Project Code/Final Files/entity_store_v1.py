@@ -0,0 +1,362 @@
+# Malik F (mhf68) & Hetao Y (hy668)
+# Entity Store v1
+# Balls and obstacles kept as structure-of-arrays (one NumPy array per field), so moving, wall bounces, ball-vs-rect pushes
+# and removing despawned entities are whole-array operations instead of Python code per entity. Used by the EXTREME minigame.
+# Balls can also bounce off each other, with a sweep-and-prune on x instead of testing every pair.
+# Broad phase for ball-vs-rect and the drone checks: entities are binned by the grid cell of their center (argsort of the
+# cell keys), so a query only looks at the index ranges of the cells it touches (searchsorted) instead of every entity.
+# Run this file to benchmark how many balls fit in a 16 ms frame against the old dict-based loop.
+# October 19, 2026
+
+import math
+import random
+import time
+import numpy as np
+
+START_CAPACITY = 64    # Arrays double when full
+GRID_CELL = 64         # Broad phase cell size in pixels (same as spatial_hash_v1)
+_KEY_SPAN = 1 << 20    # Cell key = (row + offset) * span + (col + offset), so one cell row is one key range
+_KEY_OFFSET = 1 << 19
+
+
+# Shared storage: every field is an array of `capacity`, the first `count` entries are live
+class _Store:
+    FIELDS = ()
+
+    def __init__(self, capacity=START_CAPACITY):
+        self.count = 0
+        self.capacity = capacity
+        for name in self.FIELDS:
+            setattr(self, name, np.zeros(capacity, dtype=float))
+        self.color = np.zeros((capacity, 3), dtype=np.uint8)
+        self.grid_order = None       # Entity indices sorted by cell key, None when positions changed
+        self.grid_keys = None
+        self.stats = {'grows': 0, 'removed': 0, 'added': 0, 'reused': 0, 'high_water': 0, 'queries': 0, 'candidates': 0}
+
+    def clear(self):
+        self.count = 0
+        self.grid_order = None
+
+    # Bin every live entity by the cell of its center (cx, cy arrays)
+    def _build_grid(self, cx, cy):
+        col = np.floor(cx / GRID_CELL).astype(np.int64)
+        row = np.floor(cy / GRID_CELL).astype(np.int64)
+        keys = (row + _KEY_OFFSET) * _KEY_SPAN + col + _KEY_OFFSET
+        self.grid_order = np.argsort(keys, kind='stable')
+        self.grid_keys = keys[self.grid_order]
+
+    # Indices of entities whose center cell touches box (left, top, right, bottom), one key range per cell row
+    def _near(self, left, top, right, bottom):
+        c0, c1 = math.floor(left / GRID_CELL) + _KEY_OFFSET, math.floor(right / GRID_CELL) + _KEY_OFFSET
+        rows = (np.arange(math.floor(top / GRID_CELL), math.floor(bottom / GRID_CELL) + 1) + _KEY_OFFSET) * _KEY_SPAN
+        start = np.searchsorted(self.grid_keys, rows + c0, side='left').tolist()
+        end = np.searchsorted(self.grid_keys, rows + c1, side='right').tolist()
+        order = self.grid_order
+        ids = np.concatenate([order[a:b] for a, b in zip(start, end)])
+        self.stats['queries'] += 1
+        self.stats['candidates'] += len(ids)
+        return ids
+
+    # Index for a new entity, doubling the arrays if they are full (slots below the high-water mark are reused)
+    def _slot(self):
+        if self.count == self.capacity:
+            self.capacity *= 2
+            for name in self.FIELDS + ('color',):
+                old = getattr(self, name)
+                new = np.zeros((self.capacity,) + old.shape[1:], dtype=old.dtype)
+                new[:self.count] = old[:self.count]
+                setattr(self, name, new)
+            self.stats['grows'] += 1
+        self.stats['added'] += 1
+        self.grid_order = None
+        if self.count < self.stats['high_water']: self.stats['reused'] += 1
+        self.count += 1
+        if self.count > self.stats['high_water']: self.stats['high_water'] = self.count
+        return self.count - 1
+
+    # Keep only entities where keep is True (in place, order kept), returns how many were removed
+    def compact(self, keep):
+        idx = np.flatnonzero(keep)
+        removed = self.count - len(idx)
+        if removed:
+            for name in self.FIELDS + ('color',):
+                arr = getattr(self, name)
+                arr[:len(idx)] = arr[idx]
+            self.count = len(idx)
+            self.stats['removed'] += removed
+            self.grid_order = None
+        return removed
+
+    # Fraction of adds that landed in an already used slot
+    def reuse_rate(self):
+        return round(self.stats['reused'] / max(self.stats['added'], 1), 3)
+
+
+# Bouncing balls
+class BallStore(_Store):
+    FIELDS = ('x', 'y', 'prev_x', 'prev_y', 'vx', 'vy', 'radius')
+
+    def __init__(self, capacity=START_CAPACITY):
+        super().__init__(capacity)
+        self.order = np.zeros(0, dtype=np.int64)   # Ball indices sorted by left edge, kept between steps
+        self.stats.update({'pairs': 0, 'bounces': 0})
+
+    def add(self, x, y, vx, vy, radius, color):
+        self.order = np.zeros(0, dtype=np.int64)
+        i = self._slot()
+        self.x[i] = self.prev_x[i] = x
+        self.y[i] = self.prev_y[i] = y
+        self.vx[i], self.vy[i], self.radius[i] = vx, vy, radius
+        self.color[i] = color
+
+    # Move every ball by k frames of velocity
+    def integrate(self, k):
+        n = self.count
+        self.prev_x[:n] = self.x[:n]
+        self.prev_y[:n] = self.y[:n]
+        self.x[:n] += self.vx[:n] * k
+        self.y[:n] += self.vy[:n] * k
+        self.grid_order = None
+
+    # Reflect off the screen edges (same order of checks as the old per-ball code)
+    def bounce_walls(self, width, height):
+        n = self.count
+        r = self.radius[:n]
+        for pos, vel, limit in ((self.x[:n], self.vx[:n], width), (self.y[:n], self.vy[:n], height)):
+            low = pos - r < 0
+            pos[low] = r[low]
+            vel[low] *= -1
+            high = pos + r > limit
+            pos[high] = limit - r[high]
+            vel[high] *= -1
+
+    # Ball grid for this step (balls only move a little more before the next rebuild, see _reach)
+    def build_grid(self):
+        n = self.count
+        self._build_grid(self.x[:n], self.y[:n])
+
+    # Largest distance from a ball's binned center to its edge: radius, plus up to one radius of rect pushes since binning
+    def _reach(self):
+        return 2.0 * float(self.radius[:self.count].max()) if self.count else 0.0
+
+    # Push balls out of every rect and flip the velocity on the hit side. Loops over the few rects, and only over the
+    # balls in the grid cells around each one.
+    def collide_rects(self, rects):
+        n = self.count
+        if n == 0:
+            return
+        self.build_grid()
+        reach = self._reach()
+        x, y, vx, vy, r = self.x[:n], self.y[:n], self.vx[:n], self.vy[:n], self.radius[:n]
+        for left, top, right, bottom in rects.bounds():
+            near = self._near(left - reach, top - reach, right + reach, bottom + reach)
+            if not len(near):
+                continue
+            dist_x = x[near] - np.clip(x[near], left, right)
+            dist_y = y[near] - np.clip(y[near], top, bottom)
+            dist_sq = dist_x * dist_x + dist_y * dist_y
+            hit = np.flatnonzero(dist_sq < r[near] ** 2)
+            if not len(hit):
+                continue
+            ids = near[hit]
+            dist_x, dist_y = dist_x[hit], dist_y[hit]
+            distance = np.sqrt(dist_sq[hit])
+            overlap = r[ids] - distance
+            distance[distance == 0] = 0.1
+            nx = dist_x / distance
+            ny = dist_y / distance
+            x[ids] += nx * overlap
+            y[ids] += ny * overlap
+            side = np.abs(nx) > np.abs(ny)
+            vx[ids[side]] *= -1
+            vy[ids[~side]] *= -1
+
+    # Candidate pairs from sweep-and-prune on x: re-sorting last step's order is almost linear, since balls move little
+    def _sweep_pairs(self):
+        n = self.count
+        x, r = self.x[:n], self.radius[:n]
+        if len(self.order) != n:
+            self.order = np.arange(n)
+        lo = x - r
+        self.order = self.order[np.argsort(lo[self.order], kind='stable')]
+        lo_sorted, hi_sorted = lo[self.order], (x + r)[self.order]
+
+        # Every ball pairs with the following balls whose left edge starts before its right edge
+        counts = np.searchsorted(lo_sorted, hi_sorted, side='left') - np.arange(n) - 1
+        total = int(counts.sum())
+        first = np.repeat(np.arange(n), counts)
+        second = first + 1 + np.arange(total) - np.repeat(np.cumsum(counts) - counts, counts)
+        return self.order[first], self.order[second]
+
+    # Elastic ball-to-ball collisions (mass goes with radius squared). Only the few touching pairs are resolved one by one,
+    # so a ball hit twice in one step sees the first bounce.
+    def collide_balls(self):
+        if self.count < 2:
+            return
+        a, b = self._sweep_pairs()
+        self.stats['pairs'] += len(a)
+        n = self.count
+        x, y, r = self.x[:n], self.y[:n], self.radius[:n]
+        dx, dy = x[b] - x[a], y[b] - y[a]
+        reach = r[a] + r[b]
+        hit = dx * dx + dy * dy < reach * reach
+
+        x, y, vx, vy = self.x, self.y, self.vx, self.vy
+        for i, j in zip(a[hit].tolist(), b[hit].tolist()):
+            nx, ny = x[j] - x[i], y[j] - y[i]
+            distance = math.hypot(nx, ny)
+            if distance == 0: nx, ny, distance = 1.0, 0.0, 1.0
+            nx /= distance; ny /= distance
+            mass_i, mass_j = r[i] * r[i], r[j] * r[j]
+            share_i, share_j = mass_j / (mass_i + mass_j), mass_i / (mass_i + mass_j)
+
+            # Separate along the normal, heavier ball moves less
+            overlap = r[i] + r[j] - distance
+            if overlap > 0:
+                x[i] -= nx * overlap * share_i; y[i] -= ny * overlap * share_i
+                x[j] += nx * overlap * share_j; y[j] += ny * overlap * share_j
+
+            # Exchange momentum along the normal if they are moving together
+            closing = (vx[i] - vx[j]) * nx + (vy[i] - vy[j]) * ny
+            if closing > 0:
+                vx[i] -= 2 * closing * share_i * nx; vy[i] -= 2 * closing * share_i * ny
+                vx[j] += 2 * closing * share_j * nx; vy[j] += 2 * closing * share_j * ny
+                self.stats['bounces'] += 1
+
+    # (x, y, radius, dx, dy of the last step) of balls whose bounding box overlaps box (x, y, w, h)
+    def overlapping(self, box):
+        n = self.count
+        if n == 0:
+            return zip()
+        if self.grid_order is None:
+            self.build_grid()
+        left, top, w, h = box
+        reach = self._reach()
+        near = self._near(left - reach, top - reach, left + w + reach, top + h + reach)
+        x, y, r = self.x[near], self.y[near], self.radius[near]
+        ids = near[(x + r >= left) & (x - r < left + w) & (y + r >= top) & (y - r < top + h)]
+        x, y, r = self.x, self.y, self.radius
+        return zip(x[ids].tolist(), y[ids].tolist(), r[ids].tolist(), (x[ids] - self.prev_x[ids]).tolist(),
+                   (y[ids] - self.prev_y[ids]).tolist())
+
+    # (center, radius, color) per ball, between the last two steps
+    def draw_list(self, alpha):
+        n = self.count
+        cx = (self.prev_x[:n] + (self.x[:n] - self.prev_x[:n]) * alpha).astype(int)
+        cy = (self.prev_y[:n] + (self.y[:n] - self.prev_y[:n]) * alpha).astype(int)
+        return zip(zip(cx.tolist(), cy.tolist()), self.radius[:n].tolist(), self.color[:n].tolist())
+
+
+# Falling obstacles (rect top is int(y), like pygame.Rect.y)
+class RectStore(_Store):
+    FIELDS = ('left', 'y', 'prev_y', 'w', 'h')
+
+    def add(self, left, y, w, h, color):
+        i = self._slot()
+        self.left[i], self.w[i], self.h[i] = left, w, h
+        self.y[i] = self.prev_y[i] = y
+        self.color[i] = color
+
+    # Move every rect down by dy
+    def move(self, dy):
+        n = self.count
+        self.prev_y[:n] = self.y[:n]
+        self.y[:n] += dy
+        self.grid_order = None
+
+    # Integer tops of the live rects
+    def tops(self):
+        return np.trunc(self.y[:self.count])
+
+    # (left, top, right, bottom) per rect
+    def bounds(self):
+        n = self.count
+        top = self.tops()
+        return zip(self.left[:n].tolist(), top.tolist(), (self.left[:n] + self.w[:n]).tolist(), (top + self.h[:n]).tolist())
+
+    # ((x, y, w, h), fall of the last step) of rects that overlap box (x, y, w, h), from the rects binned near it
+    def overlapping(self, box):
+        n = self.count
+        if n == 0:
+            return zip()
+        tops = self.tops()
+        if self.grid_order is None:
+            self._build_grid(self.left[:n] + self.w[:n] / 2, tops + self.h[:n] / 2)
+        left, top, w, h = box
+        half_w, half_h = float(self.w[:n].max()) / 2, float(self.h[:n].max()) / 2
+        near = self._near(left - half_w, top - half_h, left + w + half_w, top + h + half_h)
+        rl, rt, rw, rh = self.left[near], tops[near], self.w[near], self.h[near]
+        ids = near[(rl < left + w) & (rl + rw > left) & (rt < top + h) & (rt + rh > top)]
+        rl, rt, rw, rh = self.left, tops, self.w, self.h
+        rects = zip(rl[ids].astype(int).tolist(), rt[ids].astype(int).tolist(), rw[ids].astype(int).tolist(),
+                    rh[ids].astype(int).tolist())
+        return zip(rects, (self.y[ids] - self.prev_y[ids]).tolist())
+
+    # ((x, y, w, h), color) per rect, between the last two steps
+    def draw_list(self, alpha):
+        n = self.count
+        top = np.trunc(self.prev_y[:n] + (self.y[:n] - self.prev_y[:n]) * alpha).astype(int)
+        rects = zip(self.left[:n].astype(int).tolist(), top.tolist(), self.w[:n].astype(int).tolist(),
+                    self.h[:n].astype(int).tolist())
+        return zip(rects, self.color[:n].tolist())
+
+
+# Old dict-based ball step, kept for the benchmark
+def _dict_step(balls, obstacles, k, width, height):
+    for b in balls:
+        b['x'] += b['vx'] * k; b['y'] += b['vy'] * k
+        if b['x'] - b['radius'] < 0: b['x'] = b['radius']; b['vx'] *= -1
+        if b['x'] + b['radius'] > width: b['x'] = width - b['radius']; b['vx'] *= -1
+        if b['y'] - b['radius'] < 0: b['y'] = b['radius']; b['vy'] *= -1
+        if b['y'] + b['radius'] > height: b['y'] = height - b['radius']; b['vy'] *= -1
+        for left, top, right, bottom in obstacles:
+            dist_x = b['x'] - max(left, min(b['x'], right))
+            dist_y = b['y'] - max(top, min(b['y'], bottom))
+            distance = math.sqrt(dist_x**2 + dist_y**2)
+            if distance < b['radius']:
+                overlap = b['radius'] - distance
+                if distance == 0: distance = 0.1
+                nx = dist_x / distance; ny = dist_y / distance
+                b['x'] += nx * overlap; b['y'] += ny * overlap
+                if abs(nx) > abs(ny): b['vx'] *= -1
+                else: b['vy'] *= -1
+
+# Average ms per frame (two 120 Hz steps) for n balls and a screen of obstacles
+def _frame_ms(n, use_store, frames=30, width=800, height=480, obstacle_count=6):
+    rng = random.Random(n)
+    rects = RectStore()
+    for j in range(obstacle_count):
+        rects.add(rng.randint(0, width - 150), j * 80 - 60, rng.randint(40, 150), 60, (255, 50, 50))
+    balls = [{'x': rng.uniform(20, width - 20), 'y': rng.uniform(20, height - 20), 'vx': rng.choice([-3, 3]),
+              'vy': rng.choice([-3, 3]), 'radius': 14} for _ in range(n)]
+    store = BallStore()
+    for b in balls:
+        store.add(b['x'], b['y'], b['vx'], b['vy'], b['radius'], (191, 0, 255))
+    bounds = list(rects.bounds())
+
+    start = time.perf_counter()
+    for _ in range(frames * 2):
+        if use_store:
+            store.integrate(0.5)
+            store.bounce_walls(width, height)
+            store.collide_rects(rects)
+        else:
+            _dict_step(balls, bounds, 0.5, width, height)
+    return (time.perf_counter() - start) * 1000.0 / frames
+
+# Largest ball count (doubling, then bisecting) whose physics fits in one 60 fps frame
+def benchmark(budget_ms=16.0):
+    for name, use_store in (("dict per ball", False), ("entity store", True)):
+        low, high = 0, 8
+        while _frame_ms(high, use_store) < budget_ms:
+            low, high = high, high * 2
+        while high - low > max(8, low // 20):
+            mid = (low + high) // 2
+            if _frame_ms(mid, use_store) < budget_ms: low = mid
+            else: high = mid
+        print(f"{name:15s} ~{low:6d} balls in {budget_ms:.0f} ms ({_frame_ms(64, use_store):6.3f} ms for 64 balls)")
+
+
+# Start Benchmark
+if __name__ == "__main__":
+    benchmark()
@@ -0,0 +1,52 @@
+# Malik F (mhf68) & Hetao Y (hy668)
+# Fixed Timestep v1
+# Game physics runs at a fixed rate no matter how fast frames are drawn. Real time goes into an accumulator, whole steps
+# are taken out of it, and the leftover fraction (alpha) is used to draw between the last two simulated states.
+# October 19, 2026
+
+import time
+
+# Simulation settings
+SIM_HZ = 120
+MAX_FRAME_TIME = 0.25   # Longer gaps (button sleeps, loading) are clamped so the game does not jump ahead
+
+
+# Accumulator for one game loop
+class FixedStep:
+    # reference_fps is the frame rate the per-frame constants (speeds, friction) were tuned at
+    def __init__(self, reference_fps, hz=SIM_HZ):
+        self.dt = 1.0 / hz
+        self.k = reference_fps / float(hz)   # Fraction of a reference frame covered by one step
+        self.accumulator = 0.0
+        self.alpha = 0.0
+        self.last = None
+        self.steps_total = 0
+
+    # Forget pending time (call when the game starts or restarts)
+    def reset(self):
+        self.accumulator = 0.0
+        self.alpha = 0.0
+        self.last = None
+
+    # Add the real time since the last call, returns how many steps to simulate this frame
+    def advance(self, now=None):
+        now = time.perf_counter() if now is None else now
+        if self.last is None:
+            self.last = now
+        self.accumulator += min(now - self.last, MAX_FRAME_TIME)
+        self.last = now
+
+        steps = int(self.accumulator / self.dt)
+        self.accumulator -= steps * self.dt
+        self.alpha = self.accumulator / self.dt
+        self.steps_total += steps
+        return steps
+
+    # Per-step version of a per-frame friction factor
+    def friction(self, per_frame):
+        return per_frame ** self.k
+
+
+# Blend between the previous and current simulated value
+def lerp(a, b, alpha):
+    return a + (b - a) * alpha
@@ -0,0 +1,168 @@
+# Malik F (mhf68) & Hetao Y (hy668)
+# Frame Pipeline v1
+# Optional (off by default): the MPU6050 is read on its own thread (SMBus waits release the GIL) and samples go through a
+# small bounded queue, so the I2C read is taken off the main thread's frame time. Only the sensor read is pipelined: the
+# simulation, drawing, flip and cockpit hand-off still run one after another on the main thread, so this saves at most one
+# I2C read per frame. The reader is paused outside PLAYING and holds a lock around each read, which recalibration takes too.
+# Every stage's busy time is measured so the occupancy shows the bottleneck.
+# October 19, 2026
+
+import queue
+import threading
+import time
+
+USE_PIPELINE = False
+QUEUE_DEPTH = 2           # Samples held between the sensor and the game (oldest is dropped when full)
+FIRST_SAMPLE_WAIT = 0.5   # Seconds to wait for the sensor thread's first sample before assuming level
+PAUSE_POLL = 0.05         # Seconds a paused sensor thread sleeps between checks
+
+
+# Sensor thread plus per-stage timing for one game loop
+class FramePipeline:
+    # read_sensor is mpu.get_mpu_orientation, sensor_hz keeps the read rate the same as the game's frame rate
+    def __init__(self, read_sensor, sensor_hz, threaded=None, depth=QUEUE_DEPTH):
+        self.read_sensor = read_sensor
+        self.period = 1.0 / sensor_hz
+        self.threaded = USE_PIPELINE if threaded is None else threaded
+        self.samples = queue.Queue(maxsize=depth)
+        self.last_sample = None
+        self.busy = {}            # Seconds spent in each stage
+        self.dropped = 0          # Samples replaced before the game used them
+        self.stale = 0            # Frames that reused the previous sample
+        self.frames = 0
+        self.running = False
+        self.reading = threading.Event()   # Set while the game uses samples (PLAYING), the thread idles otherwise
+        self.sensor_lock = threading.Lock()  # Held around every sensor read and around recalibration
+        self.thread = None
+        self.start_time = time.perf_counter()
+        self.mark = self.start_time
+
+    # Start the sensor thread (does nothing when not threaded). It starts paused, see resume().
+    # A thread that outlived stop()'s join just carries on, a new one is only made once the old one has exited.
+    def start(self):
+        if not self.threaded:
+            return
+        self.running = True
+        if self.thread is None or not self.thread.is_alive():
+            self.thread = threading.Thread(target=self._sensor_loop, name="mpu-sensor", daemon=True)
+            self.thread.start()
+
+    # Stop and wait for the sensor thread, samples read so far are thrown away
+    def stop(self):
+        self.running = False
+        if self.thread:
+            self.thread.join(1.0)
+            if not self.thread.is_alive():
+                self.thread = None
+        self._flush()
+
+    # Run setup (mpu.mpu_setup_once) with no sensor read in flight, even if a reader outlived stop()'s join
+    def recalibrate(self, setup):
+        self.stop()
+        with self.sensor_lock:
+            setup()
+        self.start()
+
+    # Let the sensor thread read (entering PLAYING), anything queued before is thrown away
+    def resume(self):
+        self._flush()
+        self.reading.set()
+
+    # Stop reading without ending the thread (title and game over screens use no samples)
+    def pause(self):
+        self.reading.clear()
+        self._flush()
+
+    def _flush(self):
+        while True:
+            try:
+                self.samples.get_nowait()
+            except queue.Empty:
+                break
+        self.last_sample = None
+
+    # Sensor stage: read at a steady rate and keep only the newest samples
+    def _sensor_loop(self):
+        next_read = time.perf_counter()
+        while self.running:
+            if not self.reading.is_set():
+                self.reading.wait(PAUSE_POLL)
+                next_read = time.perf_counter()
+                continue
+            with self.sensor_lock:
+                if not self.running:
+                    break
+                t0 = time.perf_counter()
+                sample = self.read_sensor()
+            self._add_busy('sensor', time.perf_counter() - t0)
+            try:
+                self.samples.put_nowait(sample)
+            except queue.Full:
+                try:
+                    self.samples.get_nowait()
+                    self.dropped += 1
+                except queue.Empty:
+                    pass
+                self.samples.put_nowait(sample)
+
+            next_read += self.period
+            delay = next_read - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+            else:
+                next_read = time.perf_counter()
+
+    # Newest orientation for this frame (roll, pitch, yaw)
+    def latest(self):
+        # Unthreaded: read in place, charged to the sensor stage instead of the surrounding lap
+        if not self.threaded:
+            t0 = time.perf_counter()
+            self.last_sample = self.read_sensor()
+            elapsed = time.perf_counter() - t0
+            self._add_busy('sensor', elapsed)
+            self.mark += elapsed
+            return self.last_sample
+
+        # The old thread may have exited just as start() found it still alive
+        if self.running and not self.thread.is_alive():
+            self.start()
+
+        sample = None
+        while True:
+            try:
+                sample = self.samples.get_nowait()
+            except queue.Empty:
+                break
+        if sample is None:
+            if self.last_sample is not None:
+                self.stale += 1
+                return self.last_sample
+            try:
+                sample = self.samples.get(timeout=FIRST_SAMPLE_WAIT)
+            except queue.Empty:
+                return (0.0, 0.0, 0.0)
+        self.last_sample = sample
+        return sample
+
+    # Main thread stages: charge the time since the previous lap to this stage
+    def lap(self, stage):
+        now = time.perf_counter()
+        self._add_busy(stage, now - self.mark)
+        self.mark = now
+        if stage == 'idle':
+            self.frames += 1
+
+    def _add_busy(self, stage, seconds):
+        self.busy[stage] = self.busy.get(stage, 0.0) + seconds
+
+    # Fraction of wall time each stage was busy (sensor is on its own thread when threaded)
+    def occupancy(self):
+        wall = max(time.perf_counter() - self.start_time, 1e-6)
+        return {stage: round(seconds / wall, 3) for stage, seconds in self.busy.items()}
+
+    # Occupancy, busiest stage and queue counters
+    def summary(self):
+        occ = self.occupancy()
+        work = {stage: value for stage, value in occ.items() if stage != 'idle'}
+        return {'threaded': self.threaded, 'occupancy': occ, 'bottleneck': max(work, key=work.get) if work else None,
+                'frames': self.frames, 'dropped': self.dropped, 'stale': self.stale}
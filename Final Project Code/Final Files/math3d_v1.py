@@ -0,0 +1,53 @@
+# Malik F (mhf68) & Hetao Y (hy668)
+# 3D Math Helpers v1
+# NumPy versions of rotate_y, rotate_3d and project from the 3D free roam.
+# The rotation matrix is built once per frame and every point is transformed in one array operation.
+# October 19, 2026
+
+import math
+import numpy as np
+
+
+# Rotation matrix matching rotate_3d: yaw about y, then pitch about x, then roll about z (radians)
+def rotation_matrix(r, p, yw):
+    cy, sy = math.cos(yw), math.sin(yw)
+    cp, sp = math.cos(p), math.sin(p)
+    cr, sr = math.cos(r), math.sin(r)
+
+    m_yaw = np.array([[cy, 0.0, sy], [0.0, 1.0, 0.0], [-sy, 0.0, cy]])
+    m_pitch = np.array([[1.0, 0.0, 0.0], [0.0, cp, -sp], [0.0, sp, cp]])
+    m_roll = np.array([[cr, -sr, 0.0], [sr, cr, 0.0], [0.0, 0.0, 1.0]])
+    return m_roll @ m_pitch @ m_yaw
+
+# Rotate an (N, 3) array of points by a 3x3 matrix
+def rotate_points(points, matrix):
+    return points @ matrix.T
+
+# Array version of rotate_y for x/z arrays
+def rotate_y_batch(x, z, angle_rad):
+    c = math.cos(angle_rad); s = math.sin(angle_rad)
+    return x*c - z*s, x*s + z*c
+
+# Array version of project. Returns integer screen x/y and a mask of points in front of the camera.
+# If bounds=(w, h) is given, the mask also drops points outside the screen.
+# zoom scales the image without changing the perspective (for rendering into a smaller surface).
+# roll (degrees) turns the image about (cx, cy), counterclockwise on screen like pygame.transform.rotate.
+def project_batch(x, y, z, cx, cy, fov, near=1.0, bounds=None, zoom=1.0, roll=0.0):
+    visible = z > near
+    z = np.maximum(z, 1.0)
+    scale = fov * zoom / (fov + z)
+    if roll:
+        c, s = math.cos(math.radians(roll)), math.sin(math.radians(roll))
+        dx, dy = x * scale, -y * scale
+        sx = (dx * c + dy * s + cx).astype(np.int32)
+        sy = (dy * c - dx * s + cy).astype(np.int32)
+    else:
+        sx = (x * scale + cx).astype(np.int32)
+        sy = (-y * scale + cy).astype(np.int32)
+    if bounds:
+        visible &= (sx > 0) & (sx < bounds[0]) & (sy >= 0) & (sy < bounds[1])
+    return sx, sy, visible
+
+# Project an (N, 3) array, returns (sx, sy, visible)
+def project_points(points, cx, cy, fov, near=1.0, bounds=None, zoom=1.0, roll=0.0):
+    return project_batch(points[:, 0], points[:, 1], points[:, 2], cx, cy, fov, near, bounds, zoom, roll)
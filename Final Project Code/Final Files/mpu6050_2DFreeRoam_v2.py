@@ -11,6 +11,16 @@ import os
 import sys
 import RPi.GPIO as GPIO
 import mpu6050_calibrate_v4 as mpu 
+import tft_cockpit_v1 as tft
+import tft_process_v1 as tftproc
+import drone_sprites_v1 as sprites
+import overlay_pool_v1 as overlays
+import quality_governor_v1 as quality
+import fixed_step_v1 as fixed
+import frame_pipeline_v1 as pipeline
+import debug_stats_v1 as debug
+import track_sdf_v1 as tracks
+import tile_world_v1 as tiles
 
 # Display Initialize
 WIDTH, HEIGHT = 800, 480
@@ -63,8 +73,16 @@ title_font = None
 arrow_font = None
 cockpit_status_font = None
 
+# Quality governor (created in run_game)
+QUALITY_KNOBS = ('grid_lines', 'overlays', 'propellers', 'cockpit_hz')
+governor = None
+
+# Sensor thread and per-stage timing (created in run_game)
+frame_pipe = None
+
 # Physics initial variables
 x, y = WIDTH // 2, HEIGHT // 2
+prev_x, prev_y = x, y
 vx, vy = 0, 0
 
 ACCEL_FACTOR = 0.08    
@@ -73,118 +91,56 @@ MAX_SPEED = 6.0
 DEADZONE = 3.0         
 SPEED_SCALAR = 0.3     
 
+# Fixed timestep simulation (speeds above are per 60 fps frame, created in run_game)
+sim = None
+
+# Free roam world larger than the screen, camera follows the drone (tiles created in run_game)
+WORLD_SEED = 2025
+world = None
+
+# Time trial (walls come from the track's distance field, loaded in run_game)
+TRACK_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'track_island_v1.trk')
+DRONE_RADIUS = 30       # Drone body and motors, props may brush a wall
+WALL_BOUNCE = 0.5       # Speed kept off a wall, same as the screen edges
+WARN_DISTANCE = 30      # Clearance that shows the proximity warning
+track = None
+next_gate = 0
+lap_start = None
+last_lap = None
+best_lap = None
+wall_hits = 0
+
 # Game state variables
 game_state = "TITLE" 
-
-# Cockpit generate function for piTFT
-def render_cockpit_game(surface, d_roll, d_pitch, d_yaw):
-    surface.fill((0, 0, 0))
-    cx, cy = TFT_W // 2, TFT_H // 2
-    
-    # Map mpu inputs with movement
-    input_forward = d_pitch 
-    input_strafe = d_roll
-    mag = math.hypot(input_forward, input_strafe)
-    
-    # Check if movement is greater than deadzone
-    if mag > 3.0: 
-        angle = math.atan2(input_strafe, input_forward) 
-        arrow_len = min(60, mag * 5)
-        tip_x = cx + math.sin(angle) * arrow_len
-        tip_y = cy - math.cos(angle) * arrow_len
-        
-        # Draw the direction arrow
-        pygame.draw.line(surface, (0, 255, 0), (cx, cy), (tip_x, tip_y), 6)
-        pygame.draw.circle(surface, (0, 255, 0), (cx, cy), 8)
-        
-        # Draw the arrow tip
-        head_size = 15
-        p1 = (tip_x + math.sin(angle + 2.6)*head_size, tip_y - math.cos(angle + 2.6)*head_size)
-        p2 = (tip_x + math.sin(angle - 2.6)*head_size, tip_y - math.cos(angle - 2.6)*head_size)
-        pygame.draw.polygon(surface, (0, 255, 0), [(tip_x, tip_y), p1, p2])
-    else:
-        # draw center circle when not moving
-        pygame.draw.circle(surface, (50, 50, 50), (cx, cy), 10)
-        pygame.draw.circle(surface, (100, 100, 100), (cx, cy), 10, 2)
-
-    # Determine text status based on input
-    status_text = "HOVERING"
-    if mag > 3.0:
-        dirs = []
-        if input_forward > 3: dirs.append("FORWARD")
-        elif input_forward < -3: dirs.append("BACKWARD")
-        if input_strafe > 3: dirs.append("RIGHT")
-        elif input_strafe < -3: dirs.append("LEFT")
-        if dirs: status_text = "-".join(dirs)
-    
-    # Display text on screen
-    if cockpit_status_font:
-        txt_surf = cockpit_status_font.render(f"{status_text}", True, (255, 255, 255))
-        txt_rect = txt_surf.get_rect(center=(cx, TFT_H - 30))
-        surface.blit(txt_surf, txt_rect)
-    
-    # Show raw values on display
-    if arrow_font:
-        surface.blit(arrow_font.render(f"P: {d_pitch:.0f}", True, (150, 150, 150)), (10, 10))
-        surface.blit(arrow_font.render(f"R: {d_roll:.0f}", True, (150, 150, 150)), (10, 35))
-        surface.blit(arrow_font.render(f"Y: {d_yaw:.0f}°", True, (50, 200, 255)), (TFT_W - 90, 10))
-
+game_mode = "FREE"      # "FREE" or "TRIAL"
 
 # Reset drone position variables
 def reset_drone_position():
-    global x, y, vx, vy, game_state
+    global x, y, prev_x, prev_y, vx, vy, game_state, next_gate, lap_start, last_lap, wall_hits
     
     # Recalibrate sensor again on reset
     print("Recalibrating sensor...")
-    mpu.mpu_setup_once()
+    if frame_pipe: frame_pipe.recalibrate(mpu.mpu_setup_once) # Waits out any sensor read still in flight
+    else: mpu.mpu_setup_once()
     
-    x, y = WIDTH // 2, HEIGHT // 2
+    x, y = track.start if game_mode == "TRIAL" else (WIDTH // 2, HEIGHT // 2)
+    prev_x, prev_y = x, y
     vx, vy = 0, 0
 
-    game_state = "PLAYING"
-    print("Free Roam Reset!")
-
-# Calculate drone corner points based on rotation.
-def get_drone_points(cx, cy, angle):
-    rad = math.radians(angle)
-    def rot(px, py):
-        rx = px * math.cos(rad) - py * math.sin(rad)
-        ry = px * math.sin(rad) + py * math.cos(rad)
-        return (cx + rx, cy + ry)
-
-    points = {
-        'center': (cx, cy),
-        'fl': rot(-30, -30), 'fr': rot(30, -30),
-        'br': rot(30, 30),   'bl': rot(-30, 30) 
-    }
-    return points
-
-# Draw drone body, arms, and motors
-def draw_polished_drone(surface, points, frame_count):
-    p = points
-    pygame.draw.line(surface, (50, 50, 50), p['fl'], p['br'], 6)
-    pygame.draw.line(surface, (50, 50, 50), p['fr'], p['bl'], 6)
-
-    # Animation effect for propellers.
-    prop_offset = (frame_count % 3) * 2
-    motor_keys = ['fl', 'fr', 'br', 'bl']
-    
-    for i, key in enumerate(motor_keys):
-        mx, my = p[key]
-        pygame.draw.circle(surface, (30, 30, 30), (int(mx), int(my)), 6)
-        pygame.draw.circle(surface, (255, 255, 255), (int(mx), int(my)), 12 + prop_offset, 1)
-        led_color = (255, 50, 50) if i < 2 else (50, 255, 50) 
-        pygame.draw.circle(surface, led_color, (int(mx), int(my)), 3)
+    # Lap timer starts at the first pass through the start gate
+    next_gate = 0
+    lap_start = last_lap = None
+    wall_hits = 0
 
-    cx, cy = p['center']
-    pygame.draw.circle(surface, (80, 100, 140), (int(cx), int(cy)), 8)
+    game_state = "PLAYING"
+    if frame_pipe: frame_pipe.resume() # Sensor thread only reads while playing
+    if sim: sim.reset()
+    print("Time Trial Reset!" if game_mode == "TRIAL" else "Free Roam Reset!")
 
 # Draw background for telemetry data
 def draw_hud_telemetry(surface, roll, pitch):
-    s = pygame.Surface((180, 60))
-    s.set_alpha(150)
-    s.fill((0, 0, 0))
-    surface.blit(s, (5, 5))
+    if governor is None or governor.get('overlays'):
+        surface.blit(overlays.get_overlay((180, 60), 150), (5, 5))
 
     r_col = (50, 255, 50) if abs(roll) > DEADZONE else (255, 255, 255)
     p_col = (50, 255, 50) if abs(pitch) > DEADZONE else (255, 255, 255)
@@ -195,11 +151,81 @@ def draw_hud_telemetry(surface, roll, pitch):
         surface.blit(text1, (10, 10))
         surface.blit(text2, (10, 35))
 
+# One fixed physics step. k is the fraction of a 60 fps frame it covers, friction is FRICTION per step.
+def step_simulation(eff_roll, eff_pitch, yaw, k, friction):
+    global x, y, prev_x, prev_y, vx, vy
+
+    thrust_forward = (eff_pitch * ACCEL_FACTOR) * SPEED_SCALAR
+    thrust_strafe  = (eff_roll  * ACCEL_FACTOR) * SPEED_SCALAR
+
+    rad_yaw = math.radians(yaw)
+    acc_x = thrust_forward * math.sin(rad_yaw) + thrust_strafe * math.cos(rad_yaw)
+    acc_y = thrust_forward * -math.cos(rad_yaw) + thrust_strafe * math.sin(rad_yaw)
+
+    prev_x, prev_y = x, y
+    vx += acc_x * k; vy += acc_y * k
+    vx *= friction; vy *= friction
+    speed = math.hypot(vx, vy)
+    if speed > MAX_SPEED: vx *= MAX_SPEED / speed; vy *= MAX_SPEED / speed
+    x += vx * k; y += vy * k
+
+    # Free roam has no edges, the time trial track is one screen
+    if game_mode == "FREE":
+        return
+
+    # Keep drone within screen bounds
+    if x < 0: x = 0; vx = -vx * 0.5
+    if x > WIDTH: x = WIDTH; vx = -vx * 0.5
+    if y < 0: y = 0; vy = -vy * 0.5
+    if y > HEIGHT: y = HEIGHT; vy = -vy * 0.5
+
+    step_track()
+
+# Time trial step: push the drone out of walls (one field lookup) and advance through the gates in order
+def step_track():
+    global x, y, vx, vy, next_gate, lap_start, last_lap, best_lap, wall_hits
+
+    depth = DRONE_RADIUS - track.distance(x, y)
+    if depth > 0:
+        nx, ny = track.normal(x, y)
+        x += nx * depth; y += ny * depth
+        v_in = vx * nx + vy * ny
+        if v_in < 0:
+            vx -= (1 + WALL_BOUNCE) * v_in * nx; vy -= (1 + WALL_BOUNCE) * v_in * ny
+            wall_hits += 1
+
+    if track.crosses_gate(next_gate, prev_x, prev_y, x, y):
+        now = time.time()
+        if next_gate == 0:
+            if lap_start is not None:
+                last_lap = now - lap_start
+                if best_lap is None or last_lap < best_lap: best_lap = last_lap
+            lap_start = now
+        next_gate = (next_gate + 1) % len(track.gates)
+
+# Lap timer, best lap and the wall proximity warning
+def draw_trial_hud(surface, draw_x, draw_y):
+    lap_time = time.time() - lap_start if lap_start is not None else 0.0
+    lines = [f"Lap  : {lap_time:6.2f}s", f"Last : {last_lap:6.2f}s" if last_lap else "Last :    --",
+             f"Best : {best_lap:6.2f}s" if best_lap else "Best :    --", f"Gate : {next_gate + 1}/{len(track.gates)}"]
+    if governor is None or governor.get('overlays'):
+        surface.blit(overlays.get_overlay((190, 110), 150), (WIDTH - 200, 5))
+    for i, line in enumerate(lines):
+        surface.blit(font.render(line, True, (255, 255, 255)), (WIDTH - 190, 10 + i * 25))
+
+    clearance = track.distance(draw_x, draw_y) - DRONE_RADIUS
+    if clearance < WARN_DISTANCE:
+        heat = 1.0 - max(clearance, 0.0) / WARN_DISTANCE
+        warn_color = (255, int(200 * (1 - heat)), 50)
+        pygame.draw.circle(surface, warn_color, (int(draw_x), int(draw_y)), DRONE_RADIUS + 12, 2)
+        warn_txt = font.render("WALL!", True, warn_color)
+        surface.blit(warn_txt, warn_txt.get_rect(center=(WIDTH // 2, 20)))
+
 # WRAPPER FUNCTION
 def run_game(main_screen, main_pitft):
-    global x, y, vx, vy, game_state
+    global x, y, vx, vy, game_state, game_mode, track, best_lap, world
     global font, title_font, arrow_font, cockpit_status_font
-    global frame_count, menu_hold_timer # Define these locally/globally
+    global frame_count, menu_hold_timer, governor, sim, frame_pipe # Define these locally/globally
 
     # Use passed in surfaces
     screen = main_screen
@@ -211,16 +237,34 @@ def run_game(main_screen, main_pitft):
     arrow_font = pygame.font.SysFont("consolas", 20, bold=True)
     cockpit_status_font = pygame.font.SysFont("consolas", 28, bold=True)
 
+    # Cockpit drawn by the shared child process, or locally
     tft_file = None
-    try:
-        tft_file = open(TFT_DEVICE, 'wb')
-    except IOError:
-        print(f"Could not open {TFT_DEVICE}. TFT output disabled.")
-
-    screen_tft = pygame.Surface((TFT_W, TFT_H))
+    if tftproc.USE_COCKPIT_PROCESS:
+        cockpit = tftproc.start(TFT_DEVICE)
+    else:
+        try:
+            tft_file = open(TFT_DEVICE, 'wb')
+        except IOError:
+            print(f"Could not open {TFT_DEVICE}. TFT output disabled.")
+        screen_tft = pygame.Surface((TFT_W, TFT_H))
+        cockpit = tft.CockpitView(screen_tft, tft_file, cockpit_status_font, arrow_font)
+    sim = fixed.FixedStep(60)
+    governor = quality.QualityGovernor("2D Free Roam", 60, QUALITY_KNOBS)
     clock = pygame.time.Clock()
+
+    # Pre-render drone sprites (only built once per run)
+    sprites.build_drone_sprites()
+
+    # Time trial track (distance field is cached after the first build)
+    track = tracks.load_track(TRACK_FILE, WIDTH, HEIGHT)
+    best_lap = None
+
+    # Free roam ground tiles are drawn the first time they come into view
+    world = tiles.TileWorld(WORLD_SEED)
     
     mpu.mpu_setup_once() 
+    frame_pipe = pipeline.FramePipeline(mpu.get_mpu_orientation, 60)
+    frame_pipe.start()
 
     # Reset vars
     x, y = WIDTH // 2, HEIGHT // 2
@@ -232,6 +276,9 @@ def run_game(main_screen, main_pitft):
 
     try:
         while running:
+            # Propellers only spin when the governor allows it
+            prop_frame = frame_count if governor.get('propellers') else 0
+
             # Event handling
             for event in pygame.event.get():
                 if event.type == pygame.QUIT:
@@ -242,7 +289,9 @@ def run_game(main_screen, main_pitft):
             # Return to title screen if both buttons pressed
             if GPIO.input(START_BTN_PIN) == GPIO.HIGH and GPIO.input(RESTART_BTN_PIN) == GPIO.HIGH:
                 game_state = "TITLE"
+                frame_pipe.pause()
                 time.sleep(0.5) 
+                governor.skip_next()
 
             # Hold blue button to return to launcher
             if GPIO.input(START_BTN_PIN) == GPIO.HIGH:
@@ -254,6 +303,7 @@ def run_game(main_screen, main_pitft):
                     running = False
             else:
                 menu_hold_timer = 0
+            frame_pipe.lap('input')
 
             # Title screen state
             if game_state == "TITLE":
@@ -264,71 +314,67 @@ def run_game(main_screen, main_pitft):
 
                 # Blink effect for start button
                 if (frame_count // 30) % 2 == 0:
-                    start_txt = font.render(" Press the Blue button to Fly ", True, (50, 255, 50))
+                    start_txt = font.render(" Blue: Free Roam   Yellow: Time Trial ", True, (50, 255, 50))
                     start_rect = start_txt.get_rect(center=(WIDTH//2, HEIGHT//2 + 80))
                     pygame.draw.rect(screen, (255, 255, 255), start_rect.inflate(20, 20), 2)
                     screen.blit(start_txt, start_rect)
                 
                 # Draw fake drone for title screen
-                fake_points = get_drone_points(WIDTH//2, HEIGHT//2 - 140, frame_count)
-                draw_polished_drone(screen, fake_points, frame_count)
+                sprites.draw_drone(screen, WIDTH//2, HEIGHT//2 - 140, frame_count, prop_frame)
                 
-                # piTFT waiting screen if on title menu
-                if tft_file and frame_count % 30 == 0:
-                    screen_tft.fill((0,0,0))
-                    t_wait = cockpit_status_font.render("WAITING", True, (50, 50, 50))
-                    screen_tft.blit(t_wait, t_wait.get_rect(center=(TFT_W//2, TFT_H//2)))
-                    tft_file.seek(0)
-                    tft_file.write(screen_tft.convert(16, 0).get_buffer())
-
-                # start game when blue button is pressed
+                # piTFT waiting screen if on title menu (only written once)
+                cockpit.show_waiting()
+
+                # start free roam when blue button is pressed, time trial when yellow is pressed
                 if GPIO.input(START_BTN_PIN) == GPIO.HIGH and GPIO.input(RESTART_BTN_PIN) == GPIO.LOW:
+                    game_mode = "FREE"
                     reset_drone_position()
                     time.sleep(0.2)
+                    governor.skip_next()
+                elif GPIO.input(RESTART_BTN_PIN) == GPIO.HIGH and GPIO.input(START_BTN_PIN) == GPIO.LOW:
+                    game_mode = "TRIAL"
+                    reset_drone_position()
+                    time.sleep(0.2)
+                    governor.skip_next()
 
             # Playing state
             elif game_state == "PLAYING":
-                roll, pitch, yaw = mpu.get_mpu_orientation()
+                roll, pitch, yaw = frame_pipe.latest()
                 yaw = -yaw 
 
-                # Update cockpit view on piTFT
-                render_cockpit_game(screen_tft, roll, pitch, yaw)
-                if tft_file:
-                    tft_file.seek(0)
-                    tft_file.write(screen_tft.convert(16, 0).get_buffer())
+                # Update cockpit view on piTFT (skipped when nothing visible changed)
+                cockpit.update(roll, pitch, yaw)
+                frame_pipe.lap('cockpit')
 
                 # Physics and acceleration based on mpu input
                 eff_pitch = pitch if abs(pitch) > DEADZONE else 0
                 eff_roll  = roll  if abs(roll)  > DEADZONE else 0
 
-                thrust_forward = (eff_pitch * ACCEL_FACTOR) * SPEED_SCALAR
-                thrust_strafe  = (eff_roll  * ACCEL_FACTOR) * SPEED_SCALAR
-
-                rad_yaw = math.radians(yaw)
-                acc_x = thrust_forward * math.sin(rad_yaw) + thrust_strafe * math.cos(rad_yaw)
-                acc_y = thrust_forward * -math.cos(rad_yaw) + thrust_strafe * math.sin(rad_yaw)
-
-                vx += acc_x; vy += acc_y
-                vx *= FRICTION; vy *= FRICTION
-                x += vx; y += vy
-
-                # Keep drone within screen bounds
-                if x < 0: x = 0; vx = -vx * 0.5
-                if x > WIDTH: x = WIDTH; vx = -vx * 0.5
-                if y < 0: y = 0; vy = -vy * 0.5
-                if y > HEIGHT: y = HEIGHT; vy = -vy * 0.5
-
-                current_points = get_drone_points(x, y, yaw)
-
-                # Draw background
-                screen.fill((30, 30, 35))
+                # Fixed 120 Hz physics steps for the time that passed
+                friction = sim.friction(FRICTION)
+                for _ in range(sim.advance()):
+                    step_simulation(eff_roll, eff_pitch, yaw, sim.k, friction)
+                frame_pipe.lap('simulate')
+
+                # Draw background (time trial track is pre-drawn, free roam scrolls the tiles under the camera)
+                draw_x, draw_y = fixed.lerp(prev_x, x, sim.alpha), fixed.lerp(prev_y, y, sim.alpha)
+                if game_mode == "TRIAL":
+                    cam_x, cam_y = 0, 0
+                    screen.blit(track.background(), (0, 0))
+                    track.draw_gates(screen, next_gate)
+                else:
+                    cam_x, cam_y = int(round(draw_x)) - WIDTH // 2, int(round(draw_y)) - HEIGHT // 2
+                    world.draw(screen, cam_x, cam_y)
                 
-                # Draw infinite grid effect *
-                for i in range(0, WIDTH, 50): pygame.draw.line(screen, (45, 45, 55), (i, 0), (i, HEIGHT), 1)
-                for i in range(0, HEIGHT, 50): pygame.draw.line(screen, (45, 45, 55), (0, i), (WIDTH, i), 1)
+                # Draw infinite grid effect (lines fixed to the world, so they scroll with the camera) *
+                if game_mode == "FREE" and governor.get('grid_lines'):
+                    for i in range(-(cam_x % 50), WIDTH, 50): pygame.draw.line(screen, (45, 45, 55), (i, 0), (i, HEIGHT), 1)
+                    for i in range(-(cam_y % 50), HEIGHT, 50): pygame.draw.line(screen, (45, 45, 55), (0, i), (WIDTH, i), 1)
 
-                draw_polished_drone(screen, current_points, frame_count)
+                sprites.draw_drone(screen, draw_x - cam_x, draw_y - cam_y, yaw, prop_frame)
                 draw_hud_telemetry(screen, roll, pitch)
+                if game_mode == "TRIAL":
+                    draw_trial_hud(screen, draw_x, draw_y)
                 
                 # Instructions on screen
                 help_txt = font.render("Press Yellow button to Reset Pos", True, (100, 100, 100))
@@ -338,16 +384,31 @@ def run_game(main_screen, main_pitft):
                 if GPIO.input(RESTART_BTN_PIN) == GPIO.HIGH and GPIO.input(START_BTN_PIN) == GPIO.LOW:
                     reset_drone_position()
                     time.sleep(0.2)
+                    governor.skip_next()
 
+            frame_pipe.lap('render')
             pygame.display.flip()
+            frame_pipe.lap('present')
             clock.tick(60)
+            frame_pipe.lap('idle')
             frame_count += 1
 
+            # Adjust quality from how long this frame took (without the tick delay)
+            if governor.update(clock.get_rawtime()):
+                cockpit.set_refresh_hz(governor.get('cockpit_hz'))
+
     # exit and cleanup
     except KeyboardInterrupt:
         pass
     finally:
         print("Cleaning up local game resources...")
+        frame_pipe.stop()
+        if debug.DEBUG_STATS:
+            print(f"Overlay surfaces: {overlays.overlay_stats()}")
+            print(f"Quality: {governor.summary()}")
+            print(f"Time trial: best lap {best_lap}, wall hits {wall_hits}")
+            print(f"Tile world: {world.summary()}")
+            print(f"Pipeline: {frame_pipe.summary()}")
         if tft_file: tft_file.close()
         # GPIO.cleanup()
         # pygame.quit()
@@ -12,6 +12,17 @@ import sys
 import random
 import RPi.GPIO as GPIO
 import mpu6050_calibrate_v4 as mpu  
+import tft_cockpit_v1 as tft
+import tft_process_v1 as tftproc
+import drone_sprites_v1 as sprites
+import overlay_pool_v1 as overlays
+import quality_governor_v1 as quality
+import fixed_step_v1 as fixed
+import frame_pipeline_v1 as pipeline
+import debug_stats_v1 as debug
+import spatial_hash_v1 as spatial
+import obstacle_pool_v1 as pool
+import particles_v1 as particles
 
 # Display Initialize
 WIDTH, HEIGHT = 800, 480
@@ -62,8 +73,16 @@ title_font = None
 arrow_font = None
 cockpit_status_font = None
 
+# Quality governor (created in run_game)
+QUALITY_KNOBS = ('grid_lines', 'overlays', 'propellers', 'cockpit_hz')
+governor = None
+
+# Sensor thread and per-stage timing (created in run_game)
+frame_pipe = None
+
 # Physics initial variables
 x, y = WIDTH // 2, HEIGHT // 2
+prev_x, prev_y = x, y
 vx, vy = 0, 0
 ACCEL_FACTOR = 0.08    
 FRICTION = 0.95        
@@ -71,87 +90,54 @@ MAX_SPEED = 6.0
 DEADZONE = 3.0         
 SPEED_SCALAR = 0.3     
 
-# Obstacle and ball variables
-obstacles = [] 
+# Obstacle and ball variables (obstacles come from a pool and are the pool's active list)
+obstacle_pool = pool.ObstaclePool()
+obstacles = obstacle_pool.active
 balls = []
+BALL_COUNT = 2
+SWEEP_MARGIN = 16     # Farthest an obstacle or ball moves in one physics step
 OBSTACLE_SPEED = 2.0   
 SPAWN_TIMER = 0
 SPAWN_RATE = 60        
 
+# Broad phase grids for obstacles and balls (cleared on reset, updated every step)
+obstacle_grid = spatial.SpatialHash()
+ball_grid = spatial.SpatialHash()
+
+# Prop wash and crash particles (one budget for both, follows the frame time)
+effects = particles.ParticleSystem()
+CRASH_PARTICLES = 400
+WASH_RATE = 3           # Particles per motor per frame at full tilt
+WASH_FULL_TILT = 40.0   # Degrees of roll + pitch for the most wash
+
+# Fixed timestep simulation (speeds above are per 60 fps frame, created in run_game)
+sim = None
+
 # Game state variables
 game_state = "TITLE" 
 start_time = time.time()
 final_time = 0.0
 
-# Cockpit generate function for piTFT
-def render_cockpit_game(surface, d_roll, d_pitch, d_yaw):
-    surface.fill((0, 0, 0))
-    cx, cy = TFT_W // 2, TFT_H // 2
-    
-    # Map mpu inputs with movement
-    input_forward = d_pitch 
-    input_strafe = d_roll
-    mag = math.hypot(input_forward, input_strafe)
-    
-    # Check if movement is greater than deadzone
-    if mag > 3.0: 
-        angle = math.atan2(input_strafe, input_forward) 
-        arrow_len = min(60, mag * 5)
-        tip_x = cx + math.sin(angle) * arrow_len
-        tip_y = cy - math.cos(angle) * arrow_len
-        
-        # Draw the direction arrow
-        pygame.draw.line(surface, (0, 255, 0), (cx, cy), (tip_x, tip_y), 6)
-        pygame.draw.circle(surface, (0, 255, 0), (cx, cy), 8)
-        
-        # Draw the arrow tip
-        head_size = 15
-        p1 = (tip_x + math.sin(angle + 2.6)*head_size, tip_y - math.cos(angle + 2.6)*head_size)
-        p2 = (tip_x + math.sin(angle - 2.6)*head_size, tip_y - math.cos(angle - 2.6)*head_size)
-        pygame.draw.polygon(surface, (0, 255, 0), [(tip_x, tip_y), p1, p2])
-    else:
-        # draw center circle when not moving
-        pygame.draw.circle(surface, (50, 50, 50), (cx, cy), 10)
-        pygame.draw.circle(surface, (100, 100, 100), (cx, cy), 10, 2)
-
-    # Determine text status based on input
-    status_text = "HOVERING"
-    if mag > 3.0:
-        dirs = []
-        if input_forward > 3: dirs.append("FORWARD")
-        elif input_forward < -3: dirs.append("BACKWARD")
-        if input_strafe > 3: dirs.append("RIGHT")
-        elif input_strafe < -3: dirs.append("LEFT")
-        if dirs: status_text = "-".join(dirs)
-    
-    # Display text on screen but first check if initialized
-    if cockpit_status_font:
-        txt_surf = cockpit_status_font.render(f"{status_text}", True, (255, 255, 255))
-        txt_rect = txt_surf.get_rect(center=(cx, TFT_H - 30))
-        surface.blit(txt_surf, txt_rect)
-    
-    if arrow_font:
-        # Show raw values on display
-        surface.blit(arrow_font.render(f"P: {d_pitch:.0f}", True, (150, 150, 150)), (10, 10))
-        surface.blit(arrow_font.render(f"R: {d_roll:.0f}", True, (150, 150, 150)), (10, 35))
-        surface.blit(arrow_font.render(f"Y: {d_yaw:.0f}°", True, (50, 200, 255)), (TFT_W - 90, 10))
-
-
 # Reset game state and variables
 def reset_game():
-    global x, y, vx, vy, obstacles, balls, game_state, start_time
+    global x, y, prev_x, prev_y, vx, vy, balls, game_state, start_time
     
     # Recalibrate sensor again on reset
     print("Recalibrating sensor...")
-    mpu.mpu_setup_once()
+    if frame_pipe: frame_pipe.recalibrate(mpu.mpu_setup_once) # Waits out any sensor read still in flight
+    else: mpu.mpu_setup_once()
     
     x, y = WIDTH // 2, HEIGHT // 2
+    prev_x, prev_y = x, y
     vx, vy = 0, 0
-    obstacles = []
+    obstacle_pool.clear()
     balls = []
+    effects.clear()
+    obstacle_grid.clear()
+    ball_grid.clear()
     
     # Initialize bouncing balls with random velocities
-    for _ in range(2):
+    for _ in range(BALL_COUNT):
         balls.append({
             'x': random.randint(50, WIDTH-50),
             'y': random.randint(50, HEIGHT-50),
@@ -160,68 +146,34 @@ def reset_game():
             'color': (191, 0, 255), 
             'radius': 14 
         })
+        balls[-1]['prev_x'], balls[-1]['prev_y'] = balls[-1]['x'], balls[-1]['y']
 
     game_state = "PLAYING"
+    if frame_pipe: frame_pipe.resume() # Sensor thread only reads while playing
     start_time = time.time()
+    if sim: sim.reset()
     print("Game Started/Reset!")
 
-# Calculate drone corner points based on rotation.
-def get_drone_points(cx, cy, angle):
-    rad = math.radians(angle)
-    def rot(px, py):
-        rx = px * math.cos(rad) - py * math.sin(rad)
-        ry = px * math.sin(rad) + py * math.cos(rad)
-        return (cx + rx, cy + ry)
-
-    points = {
-        'center': (cx, cy),
-        'fl': rot(-30, -30), 'fr': rot(30, -30),
-        'br': rot(30, 30),   'bl': rot(-30, 30) 
-    }
-    return points
-
-# Draw drone body, arms, and motors
-def draw_polished_drone(surface, points, frame_count):
-    p = points
-    pygame.draw.line(surface, (50, 50, 50), p['fl'], p['br'], 6)
-    pygame.draw.line(surface, (50, 50, 50), p['fr'], p['bl'], 6)
-
-    # Animation effect for propellers.
-    prop_offset = (frame_count % 3) * 2
-    motor_keys = ['fl', 'fr', 'br', 'bl']
-    
-    for i, key in enumerate(motor_keys):
-        mx, my = p[key]
-        pygame.draw.circle(surface, (30, 30, 30), (int(mx), int(my)), 6)
-        pygame.draw.circle(surface, (255, 255, 255), (int(mx), int(my)), 12 + prop_offset, 1)
-        led_color = (255, 50, 50) if i < 2 else (50, 255, 50) 
-        pygame.draw.circle(surface, led_color, (int(mx), int(my)), 3)
-
-    cx, cy = p['center']
-    pygame.draw.circle(surface, (80, 100, 140), (int(cx), int(cy)), 8)
-
-# Check if drone hits any obstacles or balls
-def check_drone_collision(drone_points, obstacle_list, ball_list):
-    check_points = list(drone_points.values())
+# Obstacles still worth keeping (not yet fallen off the bottom)
+def on_screen(obs):
+    return obs['rect'].y < HEIGHT + 50
+
+# Check if the drone's move from (x0, y0) to (x1, y1) hits any obstacles or balls (swept pixel masks, after a box check)
+def check_drone_collision(x0, y0, x1, y1, yaw, obstacle_list, ball_list):
     for obs in obstacle_list:
-        obs_rect = obs['rect']
-        for px, py in check_points:
-            if obs_rect.collidepoint(px, py): return True
+        fall = obs['y'] - obs['prev_y']
+        if sprites.drone_sweep_hits_rect(x0, y0 + fall, x1, y1, yaw, obs['rect']): return True
     
-    # Check distance between drone and balls
-    cx, cy = drone_points['center']
-    drone_hit_rad = 25 
+    # Check drone against balls (relative to the ball's own move)
     for b in ball_list:
-        dist = math.sqrt((b['x'] - cx)**2 + (b['y'] - cy)**2)
-        if dist < (b['radius'] + drone_hit_rad): return True
+        bx0, by0 = x0 + b['x'] - b['prev_x'], y0 + b['y'] - b['prev_y']
+        if sprites.drone_sweep_hits_circle(bx0, by0, x1, y1, yaw, b['x'], b['y'], b['radius']): return True
     return False
 
 # Draw background for telemetry data
 def draw_hud_telemetry(surface, roll, pitch):
-    s = pygame.Surface((180, 60))
-    s.set_alpha(150)
-    s.fill((0, 0, 0))
-    surface.blit(s, (5, 5))
+    if governor is None or governor.get('overlays'):
+        surface.blit(overlays.get_overlay((180, 60), 150), (5, 5))
 
     r_col = (50, 255, 50) if abs(roll) > DEADZONE else (255, 255, 255)
     p_col = (50, 255, 50) if abs(pitch) > DEADZONE else (255, 255, 255)
@@ -232,10 +184,100 @@ def draw_hud_telemetry(surface, roll, pitch):
         surface.blit(text1, (10, 10))
         surface.blit(text2, (10, 35))
 
+# Prop wash from the four motors, more with more tilt
+def emit_prop_wash(eff_roll, eff_pitch, yaw):
+    n = int(WASH_RATE * min((abs(eff_roll) + abs(eff_pitch)) / WASH_FULL_TILT, 1.0))
+    if n == 0: return
+    for mx, my in sprites.get_drone_points(x, y, yaw)[1:]:
+        effects.emit(mx, my, n, 40.0, 0.4, 'wash', drift=(-vx * 20, -vy * 20), spread=3)
+
+# One fixed physics step. k is the fraction of a 60 fps frame it covers, friction is FRICTION per step.
+def step_simulation(eff_roll, eff_pitch, yaw, k, friction):
+    global x, y, prev_x, prev_y, vx, vy, game_state, final_time, SPAWN_TIMER
+
+    # Physics and acceleration based on mpu input
+    thrust_forward = (eff_pitch * ACCEL_FACTOR) * SPEED_SCALAR
+    thrust_strafe  = (eff_roll  * ACCEL_FACTOR) * SPEED_SCALAR
+
+    rad_yaw = math.radians(yaw)
+    acc_x = thrust_forward * math.sin(rad_yaw) + thrust_strafe * math.cos(rad_yaw)
+    acc_y = thrust_forward * -math.cos(rad_yaw) + thrust_strafe * math.sin(rad_yaw)
+
+    prev_x, prev_y = x, y
+    vx += acc_x * k; vy += acc_y * k
+    vx *= friction; vy *= friction
+    speed = math.hypot(vx, vy)
+    if speed > MAX_SPEED: vx *= MAX_SPEED / speed; vy *= MAX_SPEED / speed
+    x += vx * k; y += vy * k
+
+    # Keep drone within screen bounds
+    if x < 0: x = 0; vx = -vx * 0.5
+    if x > WIDTH: x = WIDTH; vx = -vx * 0.5
+    if y < 0: y = 0; vy = -vy * 0.5
+    if y > HEIGHT: y = HEIGHT; vy = -vy * 0.5
+    
+    # Spawn new obstacles at set times.
+    SPAWN_TIMER += k
+    if SPAWN_TIMER > SPAWN_RATE:
+        SPAWN_TIMER = 0
+        obs_w = random.randint(40, 150)
+        obs_x = random.randint(0, WIDTH - obs_w)
+        obs_color = (50, 255, 50) if obs_w < 70 else (50, 100, 255) if obs_w < 110 else (255, 50, 50) 
+        obstacle_pool.spawn(obs_x, -60, obs_w, 60, obs_color)
+
+    # Move obstacles and remove off screen ones (grid cells follow the rects)
+    for obs in obstacles:
+        obs['prev_y'] = obs['y']
+        obs['y'] += OBSTACLE_SPEED * k
+        r = obs['rect']
+        r.y = int(obs['y'])
+        if r.y < HEIGHT + 50: obstacle_grid.update(obs, r.left, r.top, r.right, r.bottom)
+        else: obstacle_grid.remove(obs)
+    obstacle_pool.compact(on_screen)
+
+    # Ball logic (update positions and collision handling)
+    for b in balls:
+        b['prev_x'], b['prev_y'] = b['x'], b['y']
+        b['x'] += b['vx'] * k; b['y'] += b['vy'] * k
+        if b['x'] - b['radius'] < 0: b['x'] = b['radius']; b['vx'] *= -1
+        if b['x'] + b['radius'] > WIDTH: b['x'] = WIDTH - b['radius']; b['vx'] *= -1
+        if b['y'] - b['radius'] < 0: b['y'] = b['radius']; b['vy'] *= -1
+        if b['y'] + b['radius'] > HEIGHT: b['y'] = HEIGHT - b['radius']; b['vy'] *= -1
+
+        # Check for collision between balls and nearby obstacles (sqrt only once they touch)
+        rad = b['radius']
+        for obs in obstacle_grid.query(b['x'] - rad, b['y'] - rad, b['x'] + rad, b['y'] + rad):
+            r = obs['rect']
+            closest_x = max(r.left, min(b['x'], r.right))
+            closest_y = max(r.top, min(b['y'], r.bottom))
+            dist_x = b['x'] - closest_x
+            dist_y = b['y'] - closest_y
+            dist_sq = dist_x * dist_x + dist_y * dist_y
+            
+            if dist_sq < rad * rad:
+                distance = math.sqrt(dist_sq)
+                overlap = rad - distance
+                if distance == 0: distance = 0.1
+                nx = dist_x / distance; ny = dist_y / distance
+                b['x'] += nx * overlap; b['y'] += ny * overlap
+                if abs(nx) > abs(ny): b['vx'] *= -1
+                else: b['vy'] *= -1
+        ball_grid.update(b, b['x'] - rad, b['y'] - rad, b['x'] + rad, b['y'] + rad)
+
+    # Check for game over condition against what is near the drone's whole move
+    box = sprites.drone_sweep_box(prev_x, prev_y, x, y, yaw).inflate(SWEEP_MARGIN * 2, SWEEP_MARGIN * 2)
+    near_obstacles = obstacle_grid.query(box.left, box.top, box.right, box.bottom)
+    near_balls = ball_grid.query(box.left, box.top, box.right, box.bottom)
+    if check_drone_collision(prev_x, prev_y, x, y, yaw, near_obstacles, near_balls):
+        game_state = "GAMEOVER"
+        frame_pipe.pause()
+        final_time = time.time() - start_time
+        effects.emit(x, y, CRASH_PARTICLES, 320.0, 1.2, 'crash')
+
 # Wrap Function for main file
 def run_game(main_screen, main_pitft):
-    global x, y, vx, vy, obstacles, balls, game_state, start_time, final_time
-    global frame_count, menu_hold_timer
+    global x, y, vx, vy, balls, game_state, start_time, final_time
+    global frame_count, menu_hold_timer, governor, sim, frame_pipe
     global font, big_font, title_font, arrow_font, cockpit_status_font
     global SPAWN_TIMER # reset global timer
 
@@ -250,22 +292,33 @@ def run_game(main_screen, main_pitft):
     arrow_font = pygame.font.SysFont("consolas", 20, bold=True)
     cockpit_status_font = pygame.font.SysFont("consolas", 28, bold=True)
 
+    # Cockpit drawn by the shared child process, or locally
     tft_file = None
-    try:
-        tft_file = open(TFT_DEVICE, 'wb')
-    except IOError:
-        print(f"Could not open {TFT_DEVICE}. TFT output disabled.")
-
-    screen_tft = pygame.Surface((TFT_W, TFT_H))
+    if tftproc.USE_COCKPIT_PROCESS:
+        cockpit = tftproc.start(TFT_DEVICE)
+    else:
+        try:
+            tft_file = open(TFT_DEVICE, 'wb')
+        except IOError:
+            print(f"Could not open {TFT_DEVICE}. TFT output disabled.")
+        screen_tft = pygame.Surface((TFT_W, TFT_H))
+        cockpit = tft.CockpitView(screen_tft, tft_file, cockpit_status_font, arrow_font)
+    sim = fixed.FixedStep(60)
+    governor = quality.QualityGovernor("2D Minigame", 60, QUALITY_KNOBS)
     clock = pygame.time.Clock()
+
+    # Pre-render drone sprites (only built once per run)
+    sprites.build_drone_sprites()
     
     # Run calibration
     mpu.mpu_setup_once() 
+    frame_pipe = pipeline.FramePipeline(mpu.get_mpu_orientation, 60)
+    frame_pipe.start()
 
     # Reset variables
     x, y = WIDTH // 2, HEIGHT // 2
     vx, vy = 0, 0
-    obstacles = []
+    obstacle_pool.clear()
     balls = []
     game_state = "TITLE"
     start_time = time.time()
@@ -277,6 +330,9 @@ def run_game(main_screen, main_pitft):
 
     try:
         while running:
+            # Propellers only spin when the governor allows it
+            prop_frame = frame_count if governor.get('propellers') else 0
+
             # Event Handling
             for event in pygame.event.get():
                 if event.type == pygame.QUIT:
@@ -287,7 +343,9 @@ def run_game(main_screen, main_pitft):
             # Return to title screen if both buttons pressed
             if GPIO.input(START_BTN_PIN) == GPIO.HIGH and GPIO.input(RESTART_BTN_PIN) == GPIO.HIGH:
                 game_state = "TITLE"
+                frame_pipe.pause()
                 time.sleep(0.5) 
+                governor.skip_next()
 
             # Hold blue button to return to launcher
             if GPIO.input(START_BTN_PIN) == GPIO.HIGH:
@@ -298,6 +356,7 @@ def run_game(main_screen, main_pitft):
                     running = False
             else:
                 menu_hold_timer = 0
+            frame_pipe.lap('input')
                 
             # Title screen state
             if game_state == "TITLE":
@@ -314,119 +373,74 @@ def run_game(main_screen, main_pitft):
                     screen.blit(start_txt, start_rect)
                 
                 # Draw fake drone for title screen
-                fake_points = get_drone_points(WIDTH//2, HEIGHT//2 - 140, frame_count)
-                draw_polished_drone(screen, fake_points, frame_count)
+                sprites.draw_drone(screen, WIDTH//2, HEIGHT//2 - 140, frame_count, prop_frame)
                 
-                # piTFT waiting screen if on title menu
-                if tft_file and frame_count % 30 == 0:
-                    screen_tft.fill((0,0,0))
-                    t_wait = cockpit_status_font.render("WAITING", True, (50, 50, 50))
-                    screen_tft.blit(t_wait, t_wait.get_rect(center=(TFT_W//2, TFT_H//2)))
-                    tft_file.seek(0)
-                    tft_file.write(screen_tft.convert(16, 0).get_buffer())
+                # piTFT waiting screen if on title menu (only written once)
+                cockpit.show_waiting()
 
                 # start game when blue button is pressed
                 if GPIO.input(START_BTN_PIN) == GPIO.HIGH and GPIO.input(RESTART_BTN_PIN) == GPIO.LOW:
                     reset_game()
                     time.sleep(0.2)
+                    governor.skip_next()
 
             # Playing state
             elif game_state == "PLAYING":
-                roll, pitch, yaw = mpu.get_mpu_orientation()
+                roll, pitch, yaw = frame_pipe.latest()
                 yaw = -yaw 
 
-                # Update cockpit view on piTFT
-                render_cockpit_game(screen_tft, roll, pitch, yaw)
-                if tft_file:
-                    tft_file.seek(0)
-                    tft_file.write(screen_tft.convert(16, 0).get_buffer())
+                # Update cockpit view on piTFT (skipped when nothing visible changed)
+                cockpit.update(roll, pitch, yaw)
+                frame_pipe.lap('cockpit')
 
                 # Physics and acceleration based on mpu input
                 eff_pitch = pitch if abs(pitch) > DEADZONE else 0
                 eff_roll  = roll  if abs(roll)  > DEADZONE else 0
 
-                thrust_forward = (eff_pitch * ACCEL_FACTOR) * SPEED_SCALAR
-                thrust_strafe  = (eff_roll  * ACCEL_FACTOR) * SPEED_SCALAR
-
-                rad_yaw = math.radians(yaw)
-                acc_x = thrust_forward * math.sin(rad_yaw) + thrust_strafe * math.cos(rad_yaw)
-                acc_y = thrust_forward * -math.cos(rad_yaw) + thrust_strafe * math.sin(rad_yaw)
-
-                vx += acc_x; vy += acc_y
-                vx *= FRICTION; vy *= FRICTION
-                x += vx; y += vy
-
-                # Keep drone within screen bounds
-                if x < 0: x = 0; vx = -vx * 0.5
-                if x > WIDTH: x = WIDTH; vx = -vx * 0.5
-                if y < 0: y = 0; vy = -vy * 0.5
-                if y > HEIGHT: y = HEIGHT; vy = -vy * 0.5
-                
-                # Spawn new obstacles at set times.
-                SPAWN_TIMER += 1
-                if SPAWN_TIMER > SPAWN_RATE:
-                    SPAWN_TIMER = 0
-                    obs_w = random.randint(40, 150)
-                    obs_x = random.randint(0, WIDTH - obs_w)
-                    obs_color = (50, 255, 50) if obs_w < 70 else (50, 100, 255) if obs_w < 110 else (255, 50, 50) 
-                    obstacles.append({'rect': pygame.Rect(obs_x, -60, obs_w, 60), 'color': obs_color})
-
-                # Move obstacles and remove off screen ones
-                for obs in obstacles: obs['rect'].y += OBSTACLE_SPEED
-                obstacles = [o for o in obstacles if o['rect'].y < HEIGHT + 50]
-
-                # Ball logic (update positions and collision handling)
-                for b in balls:
-                    b['x'] += b['vx']; b['y'] += b['vy']
-                    if b['x'] - b['radius'] < 0: b['x'] = b['radius']; b['vx'] *= -1
-                    if b['x'] + b['radius'] > WIDTH: b['x'] = WIDTH - b['radius']; b['vx'] *= -1
-                    if b['y'] - b['radius'] < 0: b['y'] = b['radius']; b['vy'] *= -1
-                    if b['y'] + b['radius'] > HEIGHT: b['y'] = HEIGHT - b['radius']; b['vy'] *= -1
-
-                    # Check for collision between balls and obstacles
-                    for obs in obstacles:
-                        r = obs['rect']
-                        closest_x = max(r.left, min(b['x'], r.right))
-                        closest_y = max(r.top, min(b['y'], r.bottom))
-                        dist_x = b['x'] - closest_x
-                        dist_y = b['y'] - closest_y
-                        distance = math.sqrt(dist_x**2 + dist_y**2)
-                        
-                        if distance < b['radius']:
-                            overlap = b['radius'] - distance
-                            if distance == 0: distance = 0.1
-                            nx = dist_x / distance; ny = dist_y / distance
-                            b['x'] += nx * overlap; b['y'] += ny * overlap
-                            if abs(nx) > abs(ny): b['vx'] *= -1
-                            else: b['vy'] *= -1
-
-                # Check for game over condition
-                current_points = get_drone_points(x, y, yaw)
-                if check_drone_collision(current_points, obstacles, balls):
-                    game_state = "GAMEOVER"
-                    final_time = time.time() - start_time
+                # Fixed 120 Hz physics steps for the time that passed, stop at game over
+                friction = sim.friction(FRICTION)
+                for _ in range(sim.advance()):
+                    step_simulation(eff_roll, eff_pitch, yaw, sim.k, friction)
+                    if game_state != "PLAYING":
+                        break
+                if game_state == "PLAYING": emit_prop_wash(eff_roll, eff_pitch, yaw)
+                effects.update(min(clock.get_time(), 100) / 1000.0)
+                frame_pipe.lap('simulate')
 
                 # Draw background and game objects
                 screen.fill((30, 30, 35))
-                for i in range(0, WIDTH, 50): pygame.draw.line(screen, (45, 45, 55), (i, 0), (i, HEIGHT), 1)
-                for i in range(0, HEIGHT, 50): pygame.draw.line(screen, (45, 45, 55), (0, i), (WIDTH, i), 1)
+                if governor.get('grid_lines'):
+                    for i in range(0, WIDTH, 50): pygame.draw.line(screen, (45, 45, 55), (i, 0), (i, HEIGHT), 1)
+                    for i in range(0, HEIGHT, 50): pygame.draw.line(screen, (45, 45, 55), (0, i), (WIDTH, i), 1)
 
+                # Everything is drawn between the last two physics steps
+                alpha = sim.alpha
                 for obs in obstacles:
-                    pygame.draw.rect(screen, obs['color'], obs['rect'])
-                    pygame.draw.rect(screen, (255, 255, 255), obs['rect'], 2)
+                    r = obs['rect']
+                    draw_rect = pygame.Rect(r.x, int(fixed.lerp(obs['prev_y'], obs['y'], alpha)), r.w, r.h)
+                    pygame.draw.rect(screen, obs['color'], draw_rect)
+                    pygame.draw.rect(screen, (255, 255, 255), draw_rect, 2)
 
                 for b in balls:
-                    pygame.draw.circle(screen, b['color'], (int(b['x']), int(b['y'])), b['radius'])
-                    pygame.draw.circle(screen, (255, 255, 255), (int(b['x']), int(b['y'])), b['radius'], 1)
+                    center = (int(fixed.lerp(b['prev_x'], b['x'], alpha)), int(fixed.lerp(b['prev_y'], b['y'], alpha)))
+                    pygame.draw.circle(screen, b['color'], center, b['radius'])
+                    pygame.draw.circle(screen, (255, 255, 255), center, b['radius'], 1)
 
-                draw_polished_drone(screen, current_points, frame_count)
+                effects.draw(screen)
+                sprites.draw_drone(screen, fixed.lerp(prev_x, x, alpha), fixed.lerp(prev_y, y, alpha), yaw, prop_frame)
                 draw_hud_telemetry(screen, roll, pitch)
                 screen.blit(font.render(f"TIME: {time.time() - start_time:.1f}s", True, (255, 255, 255)), (WIDTH - 150, 20))
 
             # Game over state
             elif game_state == "GAMEOVER":
-                s = pygame.Surface((WIDTH, HEIGHT)); s.set_alpha(200); s.fill((0, 0, 0))
-                screen.blit(s, (0, 0))
+                if governor.get('overlays'):
+                    screen.blit(overlays.get_overlay((WIDTH, HEIGHT), 200), (0, 0))
+                else:
+                    screen.fill((0, 0, 0))
+
+                # Crash sparks keep flying over the fading last frame
+                effects.update(min(clock.get_time(), 100) / 1000.0)
+                effects.draw(screen)
                 
                 screen.blit(big_font.render("GAME OVER", True, (255, 50, 50)), (WIDTH//2 - 140, HEIGHT//2 - 40))
                 screen.blit(font.render(f"SURVIVED: {final_time:.2f}s", True, (255, 255, 255)), (WIDTH//2 - 80, HEIGHT//2 + 20))
@@ -436,16 +450,33 @@ def run_game(main_screen, main_pitft):
                 if GPIO.input(RESTART_BTN_PIN) == GPIO.HIGH and GPIO.input(START_BTN_PIN) == GPIO.LOW:
                     reset_game()
                     time.sleep(0.2)
+                    governor.skip_next()
 
+            frame_pipe.lap('render')
             pygame.display.flip()
+            frame_pipe.lap('present')
             clock.tick(60)
+            frame_pipe.lap('idle')
             frame_count += 1
 
+            # Adjust quality from how long this frame took (without the tick delay)
+            if governor.update(clock.get_rawtime()):
+                cockpit.set_refresh_hz(governor.get('cockpit_hz'))
+            effects.adjust(governor.frame_ms, governor.budget_ms)
+
     # exit and cleanup
     except KeyboardInterrupt:
         pass
     finally:
         print("Cleaning up local game resources...")
+        frame_pipe.stop()
+        if debug.DEBUG_STATS:
+            print(f"Overlay surfaces: {overlays.overlay_stats()}")
+            print(f"Quality: {governor.summary()}")
+            print(f"Spatial hash: obstacles {obstacle_grid.stats}, balls {ball_grid.stats}")
+            print(f"Particles: {effects.summary()}")
+            print(f"Obstacle pool: {obstacle_pool.capacity} made, reuse {obstacle_pool.reuse_rate()} {obstacle_pool.stats}")
+            print(f"Pipeline: {frame_pipe.summary()}")
         if tft_file: tft_file.close()
         
         # if 'pitft' in globals():
@@ -12,6 +12,19 @@ import time
 import random
 import RPi.GPIO as GPIO
 import mpu6050_calibrate_v4 as mpu
+import tft_cockpit_v1 as tft
+import tft_process_v1 as tftproc
+import math3d_v1 as m3d
+import scene3d_v1 as scene3d
+import world_chunks_v1 as chunks
+import sky_panorama_v1 as skypano
+import terrain_v1 as terrain3d
+import render_scale_v1 as rscale
+import quality_governor_v1 as quality
+import fixed_step_v1 as fixed
+import frame_pipeline_v1 as pipeline
+import debug_stats_v1 as debug
+import numpy as np
 
 # Display Initialize
 MONITOR_W, MONITOR_H = 800, 480
@@ -25,6 +38,10 @@ SPEED_SCALAR = 0.4
 ACCEL_FACTOR = 0.15 
 FRICTION = 0.96     
 
+# Fixed timestep simulation (speeds above are per 30 fps frame, created in run_game)
+sim = None
+prev_cam = (0.0, 0.0, 0.0)   # Camera position before the last physics step
+
 # GPIO setup
 # GPIO.setmode(GPIO.BCM)
 # GPIO.setup(START_BTN_PIN, GPIO.IN, pull_up_down=GPIO.PUD_UP)
@@ -68,210 +85,295 @@ subtitle_font = None
 arrow_font = None
 big_font = None
 
-# 3D math helper functions
-def rotate_y(x, z, angle_rad):
-    c = math.cos(angle_rad); s = math.sin(angle_rad)
-    return x*c - z*s, x*s + z*c
-
-def rotate_3d(x, y, z, r, p, yw):
-    rx = x * math.cos(yw) + z * math.sin(yw)
-    rz = z * math.cos(yw) - x * math.sin(yw)
-    x, z = rx, rz
-    ry = y * math.cos(p) - z * math.sin(p)
-    rz = y * math.sin(p) + z * math.cos(p)
-    y, z = ry, rz
-    rx = x * math.cos(r) - y * math.sin(r)
-    ry = x * math.sin(r) + y * math.cos(r)
-    x, y = rx, ry
-    return x, y, z
-
-# Convert 3D coordinates to 2D screen points
-def project(x, y, z, cx, cy, fov):
-    if z < 1: z = 1 
-    scale = fov / (fov + z)
-    return int(x * scale + cx), int(-y * scale + cy)
-
 # Define 3D drone model vertices
-drone_verts = [(-10, -3, 15), (10, -3, 15), (10, 3, 15), (-10, 3, 15),(-10, -3, -15), (10, -3, -15), (10, 3, -15), (-10, 3, -15),
-               (-30, 0, 30), (30, 0, 30), (30, 0, -30), (-30, 0, -30)]
+drone_verts = np.array([(-10, -3, 15), (10, -3, 15), (10, 3, 15), (-10, 3, 15),(-10, -3, -15), (10, -3, -15), (10, 3, -15), (-10, 3, -15),
+                        (-30, 0, 30), (30, 0, 30), (30, 0, -30), (-30, 0, -30)], dtype=float)
+
+# Drone mesh: body box, arms and motors
+drone_mesh = scene3d.Mesh(drone_verts)
+body_outline = (200, 200, 200)
+drone_mesh.add_face((0, 4, 5, 1), (30, 100, 160), body_outline)   # Bottom
+drone_mesh.add_face((7, 3, 2, 6), (50, 130, 200), body_outline)   # Top
+drone_mesh.add_face((4, 7, 6, 5), (20, 80, 130), body_outline)    # Back
+drone_mesh.add_face((1, 2, 3, 0), (20, 80, 130), body_outline)    # Front
+drone_mesh.add_face((0, 3, 7, 4), (20, 80, 130), body_outline)    # Left
+drone_mesh.add_face((5, 6, 2, 1), (20, 80, 130), body_outline)    # Right
+for a, b in [(0, 8), (1, 9), (4, 11), (5, 10)]:
+    drone_mesh.add_edge(a, b, (80, 80, 80), 6)
+drone_mesh.add_point(8, (200, 50, 50), 8); drone_mesh.add_point(9, (200, 50, 50), 8)
+drone_mesh.add_point(10, (50, 200, 50), 8); drone_mesh.add_point(11, (50, 200, 50), 8)
+
+# Drone sits in front of the camera, so it is its own scene with an identity view
+DRONE_OFFSET = (0, 20, 180)
+drone_node = scene3d.Node(drone_mesh, position=DRONE_OFFSET)
+drone_scene = scene3d.Scene()
+drone_scene.add(drone_node)
+
+# World object meshes (shared by every instance)
+CAM_HEIGHT = 150   # Ground is at world y=0, camera flies this far above it
+tree_trunk = scene3d.box_mesh(20, 60, 20, (110, 80, 50))
+tree_trunk.lod_color = None   # Far trees are just the green canopy dot
+tree_top = scene3d.pyramid_mesh(90, 130, (30, 130, 40), (20, 90, 30))
+gate_post = scene3d.box_mesh(16, 150, 16, (220, 120, 40))
+gate_bar = scene3d.box_mesh(190, 20, 16, (220, 120, 40))
+
+# Heightmap terrain mode (picked on the title screen, the terrain is generated once on first use)
+TERRAIN_SEED = 2026
+CLIMB_RATE = 6          # Max camera climb or descent per frame while following the ground
+DRONE_CLEARANCE = 12    # Drone center to the bottom of its motors
+TERRAIN_BOUNCE = 0.4    # Velocity kept (reversed) after hitting the ground
+terrain_mode = False
+terrain = None
+crash_until = 0
+
+# Ground height under world x/z (always 0 on the flat map)
+def ground_height(x, z):
+    return terrain.height_at(x, z) if terrain_mode else 0.0
+
+# World position of the drone, which is drawn at DRONE_OFFSET from the camera
+def drone_world_pos(cam_x, cam_y, cam_z, d_yaw):
+    view_matrix = m3d.rotation_matrix(0, 0, math.radians(d_yaw))
+    return np.array([cam_x, cam_y, cam_z]) + view_matrix.T @ np.array(DRONE_OFFSET, dtype=float)
+
+# Build one world object node at ground position (x, z)
+def make_world_object(kind, x, z, rng):
+    root = scene3d.Node(position=(x, ground_height(x, z), z), rotation=(0, 0, rng.uniform(0, 3.14)))
+    if kind == "tree":
+        root.add(scene3d.Node(tree_trunk))
+        root.add(scene3d.Node(tree_top, position=(0, 60, 0)))
+    elif kind == "gate":
+        root.add(scene3d.Node(gate_post, position=(-87, 0, 0)))
+        root.add(scene3d.Node(gate_post, position=(87, 0, 0)))
+        root.add(scene3d.Node(gate_bar, position=(0, 150, 0)))
+    else:
+        w, h, d = rng.randint(80, 200), rng.randint(100, 300), rng.randint(80, 200)
+        root.add(scene3d.Node(scene3d.box_mesh(w, h, d, (150, 150, 160), (90, 90, 100), (120, 120, 130))))
+    return root
+
+# Scatter 0-2 world objects in a chunk (same seed always gives the same chunk)
+def populate_chunk(rng, x0, z0, size):
+    objects = []
+    for _ in range(rng.choice([0, 0, 1, 1, 2])):
+        kind = rng.choice(["tree", "tree", "gate", "building"])
+        objects.append(make_world_object(kind, x0 + rng.uniform(0, size), z0 + rng.uniform(0, size), rng))
+    return objects
 
-# Generate random grass patches
-grass_patches = []
-for _ in range(80):
-    grass_patches.append((random.randint(-1500, 1500), random.randint(-1500, 1500)))
+# Chunked world (grass and objects) streamed in around the camera
+WORLD_SEED = 5725
+world = chunks.ChunkWorld(WORLD_SEED, populate_chunk)
+
+# Grass further than this is under 1 px tall, so it is dropped before rotating
+GRASS_FAR = 800
+
+# Per-frame render counters (culled, drawn, transformed)
+render_stats = {}
 
 # Static cloud positions
 clouds = [(150, 50, 60), (450, 80, 80), (700, 40, 70), (50, 90, 50)]
 
+# Sky colors and the panoramas (built on first use, once the display exists)
+SKY_COLOR = (135, 206, 235)
+GROUND_COLOR = (34, 100, 34)
+SKY_ROLL_FACTOR = 0.5   # Horizon tilts against the drone's bank, half as far
+skies = {}   # One panorama per render scale
+
+# Adaptive render resolution: the world is drawn into a smaller surface when frames run over budget
+ADAPTIVE_RES = True
+SHOW_RENDER_DEBUG = False
+scaler = rscale.RenderScaler(MONITOR_W, MONITOR_H)
+
+# Quality governor (created in run_game). The render scale goes first, it is the knob that saves the most frame time here.
+QUALITY_KNOBS = ('render_scale', 'grass', 'cockpit_hz') if ADAPTIVE_RES else ('grass', 'cockpit_hz')
+governor = None
+
+# Sensor thread and per-stage timing (created in run_game)
+frame_pipe = None
+
+# Paint sun, clouds and mountains into the 360 degree sky strip (yaw 0 shows x 0-800, same as the old fixed layout)
+def paint_sky_strip(strip, horizon_row):
+    pano_w = strip.get_width()
+    rng = random.Random(WORLD_SEED)
+
+    # Sun drawing
+    pygame.draw.circle(strip, (255, 255, 0), (650, horizon_row - 150), 40)
+
+    # Clouds drawing (the original four, then more around the rest of the turn)
+    all_clouds = list(clouds)
+    for c_x in range(900, pano_w - 250, 220):
+        all_clouds.append((c_x + rng.randint(-60, 60), rng.randint(30, 90), rng.randint(40, 80)))
+    for c_x, c_y_off, size in all_clouds:
+        pygame.draw.ellipse(strip, (240, 240, 255), (c_x, horizon_row - 100 - c_y_off, size*2, size))
+
+    # Mountain drawing, the ridge ends at horizon height so the strip wraps without a seam
+    mnt_color = (60, 80, 100)
+    pts = [(0, horizon_row), (200, horizon_row - 100), (400, horizon_row - 50), (600, horizon_row - 150), (800, horizon_row)]
+    x = 800
+    while x < pano_w - 250:
+        x += rng.randint(120, 220)
+        pts.append((x, horizon_row - rng.randint(30, 160)))
+    pts.append((pano_w, horizon_row))
+    pygame.draw.polygon(strip, mnt_color, pts)
+
 # Draw the main menu and waiting text
-def render_title_screen(screen_hdmi, screen_tft, tft_file):
+def render_title_screen(screen_hdmi, cockpit):
     screen_hdmi.fill((10, 10, 20))
     
     # Title
     if title_font and subtitle_font:
         title_txt = title_font.render("Palm Pilot: 3D Free Roam (WIP)", True, (80, 160, 255))
         sub_txt = subtitle_font.render("Press START Button", True, (200, 200, 200))
+        mode_txt = font.render(f"Map: {'TERRAIN' if terrain_mode else 'FLAT'} (RESTART to switch)", True, (150, 150, 150))
         
         tr = title_txt.get_rect(center=(MONITOR_W//2, MONITOR_H//2 - 40))
         sr = sub_txt.get_rect(center=(MONITOR_W//2, MONITOR_H//2 + 40))
+        mr = mode_txt.get_rect(center=(MONITOR_W//2, MONITOR_H//2 + 90))
         
         screen_hdmi.blit(title_txt, tr)
         screen_hdmi.blit(sub_txt, sr)
+        screen_hdmi.blit(mode_txt, mr)
     
-    screen_tft.fill((0, 0, 0))
-    if subtitle_font:
-        t_small = subtitle_font.render("WAITING", True, (50, 50, 50))
-        tr_small = t_small.get_rect(center=(TFT_W//2, TFT_H//2))
-        screen_tft.blit(t_small, tr_small)
-
     pygame.display.flip()
-    if tft_file:
-        tft_file.seek(0)
-        tft_file.write(screen_tft.convert(16, 0).get_buffer())
+
+    # piTFT waiting screen (only written once)
+    cockpit.show_waiting(subtitle_font)
 
 
+# Sky panorama for a render scale, painted the first time that scale is used
+def get_sky(zoom):
+    if zoom not in skies:
+        skies[zoom] = skypano.SkyPanorama(int(MONITOR_W * zoom), int(MONITOR_H * zoom), 500, SKY_COLOR, GROUND_COLOR,
+                                          paint_sky_strip, zoom)
+    return skies[zoom]
+
 # Render the 3D world and drone
-def render_hdmi_game(surface, d_roll, d_pitch, d_yaw, cam_x, cam_z, v_speed):
+def render_hdmi_game(screen, d_roll, d_pitch, d_yaw, cam_x, cam_y, cam_z, v_speed):
+    # World goes into a smaller surface when the render scale is below 1, then gets scaled up to the screen
+    zoom = scaler.scale
+    surface = scaler.target(screen)
+    view_w, view_h = surface.get_size()
+
     # Calculate horizon line based on pitch
-    horizon_y = (MONITOR_H // 2) + int(d_pitch * 5)
-    
-    # Draw sky and ground
-    surface.fill((135, 206, 235), (0, 0, MONITOR_W, horizon_y)) 
-    # Ground
-    surface.fill((34, 100, 34), (0, horizon_y, MONITOR_W, MONITOR_H - horizon_y)) 
+    horizon_y = (view_h // 2) + int(d_pitch * 5 * zoom)
 
-    cx, cy = MONITOR_W // 2, MONITOR_H // 2
+    cx, cy = view_w // 2, view_h // 2
     fov = 500
-    
-    # Draw static background elements
-    
-    # Sun drawing
-    pygame.draw.circle(surface, (255, 255, 0), (650, horizon_y - 150), 40)
 
-    # Clouds drawing
-    for c_x, c_y_off, size in clouds:
-        pygame.draw.ellipse(surface, (240, 240, 255), (c_x, horizon_y - 100 - c_y_off, size*2, size))
+    # Sky, sun, clouds, mountains and ground: pre-rendered panorama scrolled by yaw, rolled from cached tiles.
+    # Terrain, grass and objects are projected with the same (quantized) roll so the world stays level with the horizon.
+    roll_angle = get_sky(zoom).draw(surface, d_yaw, horizon_y, d_roll * SKY_ROLL_FACTOR)
+    horizon_tilt = math.tan(math.radians(roll_angle))
+    view_matrix = m3d.rotation_matrix(0, 0, math.radians(d_yaw))
 
-    # Mountain drawing
-    mnt_color = (60, 80, 100)
-    pts = [
-        (0, horizon_y), 
-        (200, horizon_y - 100), 
-        (400, horizon_y - 50), 
-        (600, horizon_y - 150),
-        (800, horizon_y)
-    ]
-    pygame.draw.polygon(surface, mnt_color, pts)
+    # Heightmap terrain grid on top of the ground fill
+    if terrain_mode:
+        render_stats.update(terrain.render(surface, (cam_x, cam_y, cam_z), view_matrix, cx, cy, fov,
+                                           fade_color=GROUND_COLOR, zoom=zoom, roll=roll_angle))
+
+    # Stream in chunks around the camera (only does work when crossing a chunk border)
+    world.update(cam_x, cam_z)
 
     # Draw moving grass on ground
     world_yaw = math.radians(-d_yaw)
-    grid_size = 3000
-    
-    for gx, gz in grass_patches:
-        rel_x = (gx - cam_x) % grid_size - (grid_size // 2)
-        rel_z = (gz - cam_z) % grid_size - (grid_size // 2)
-        
-        if rel_z < 10: rel_z += grid_size
-        
-        rx, rz = rotate_y(rel_x, rel_z, world_yaw)
-        
-        if rz > 10:
-            px, py = project(rx, -150, rz, cx, cy, fov)
-            
-            if 0 < px < MONITOR_W and py > horizon_y:
-                g_height = int(800 / rz)
-                if g_height > 0:
-                    pygame.draw.line(surface, (50, 200, 50), (px, py), (px, py - g_height), 2)
+    grass_step = int(round(1 / governor.get('grass'))) if governor else 1
+    grass_x, grass_z = world.grass_x[::grass_step], world.grass_z[::grass_step]
+    rel_x = grass_x - cam_x
+    rel_z = grass_z - cam_z
+    near_grass = rel_x * rel_x + rel_z * rel_z < GRASS_FAR * GRASS_FAR
+
+    rx, rz = m3d.rotate_y_batch(rel_x[near_grass], rel_z[near_grass], world_yaw)
+    if terrain_mode:
+        gy = terrain.heights_at(grass_x[near_grass], grass_z[near_grass]) - cam_y
+    else:
+        gy = -cam_y
+    px, py, visible = m3d.project_batch(rx, gy, rz, cx, cy, fov, near=10, zoom=zoom, roll=roll_angle)
+
+    g_height = (800 * zoom / np.maximum(rz, 1)).astype(np.int32)
+    visible &= (px > 0) & (px < view_w) & (g_height > 0)
+    if not terrain_mode:
+        visible &= py > horizon_y - (px - cx) * horizon_tilt
+
+    # Only the blades that survived the mask cost a draw call (2 px wide vertical fill at full scale, a line when rolled)
+    grass_color = (50, 200, 50)
+    blade_w = max(1, int(round(2 * zoom)))
+    blades = zip(px[visible].tolist(), py[visible].tolist(), g_height[visible].tolist())
+    if roll_angle:
+        up_x, up_y = -math.sin(math.radians(roll_angle)), -math.cos(math.radians(roll_angle))
+        for gx, gy, gh in blades:
+            pygame.draw.line(surface, grass_color, (gx, gy), (gx + up_x * gh, gy + up_y * gh), blade_w)
+    else:
+        for gx, gy, gh in blades:
+            surface.fill(grass_color, (gx, gy - gh, blade_w, gh + 1))
+
+
+    # World objects (trees, gates, buildings): frustum culled, LOD, depth sorted and back-face culled
+    render_stats.update(world.scene.render(surface, (cam_x, cam_y, cam_z), view_matrix, cx, cy, fov, zoom=zoom,
+                                           roll=roll_angle))
+    render_stats['grass_total'] = len(grass_x)
+    render_stats['grass_drawn'] = int(visible.sum())
 
+    scaler.present(surface, screen)
 
-    # Rotate and project drone vertices
+    # Drone and text are drawn at full resolution on top of the scaled world
+    cx, cy = MONITOR_W // 2, MONITOR_H // 2
+
+    # Drone only recomputes its vertices when roll or pitch changed
     r_rad = math.radians(d_roll); p_rad = math.radians(d_pitch)
-    
-    drone_pts = []
-    for v in drone_verts:
-        x, y, z = v
-        x, y, z = rotate_3d(x, y, z, -r_rad, p_rad, 0)
-        # Original projection logic
-        drone_pts.append(project(x, y + 20, z + 180, cx, cy, fov))
-
-    # Connect vertices to draw drone frame
-    c_arm = (80, 80, 80)
-    # Arms
-    pygame.draw.line(surface, c_arm, drone_pts[0], drone_pts[8], 6)
-    pygame.draw.line(surface, c_arm, drone_pts[1], drone_pts[9], 6)
-    pygame.draw.line(surface, c_arm, drone_pts[4], drone_pts[11], 6)
-    pygame.draw.line(surface, c_arm, drone_pts[5], drone_pts[10], 6)
-    
-    # Motors
-    pygame.draw.circle(surface, (200, 50, 50), drone_pts[8], 8)
-    pygame.draw.circle(surface, (200, 50, 50), drone_pts[9], 8)
-    pygame.draw.circle(surface, (50, 200, 50), drone_pts[10], 8)
-    pygame.draw.circle(surface, (50, 200, 50), drone_pts[11], 8)
-    
-    # Body
-    body_poly = [drone_pts[0], drone_pts[1], drone_pts[5], drone_pts[4]]
-    pygame.draw.polygon(surface, (30, 100, 160), body_poly) 
-    pygame.draw.polygon(surface, (200, 200, 200), body_poly, 1) 
+    drone_node.set_transform(rotation=(-r_rad, p_rad, 0))
+    drone_scene.render(screen, (0, 0, 0), np.eye(3), cx, cy, fov, near=1.0)
 
+    # Warning after hitting the ground
+    if time.time() < crash_until and font:
+        warn_txt = font.render("TERRAIN! PULL UP", True, (255, 60, 60))
+        screen.blit(warn_txt, warn_txt.get_rect(center=(cx, 40)))
 
-# Cockpit generate function for piTFT
-def render_cockpit_game(surface, d_roll, d_pitch, d_yaw):
-    surface.fill((0, 0, 0))
-    cx, cy = TFT_W // 2, TFT_H // 2
-    
-    # Map mpu inputs with movement
-    input_forward = d_pitch 
-    input_strafe = d_roll
-    mag = math.hypot(input_forward, input_strafe)
+    # Render scale and frame time readout
+    if SHOW_RENDER_DEBUG and font:
+        scaler.draw_overlay(screen, font, governor.frame_ms if governor else 0.0)
+
+
+# One fixed physics step. k is the fraction of a 30 fps frame it covers, friction is FRICTION per step.
+def step_flight(dz_roll, dz_pitch, yaw, k, friction):
+    global cam_x, cam_y, cam_z, global_vx, global_vz, prev_cam, crash_until
+    prev_cam = (cam_x, cam_y, cam_z)
+
+    # Physics and acceleration based on mpu input
+    accel_fwd = (dz_pitch * ACCEL_FACTOR) * SPEED_SCALAR
+    accel_side = (dz_roll * ACCEL_FACTOR) * SPEED_SCALAR
     
-    # Check if movement is greater than deadzone
-    if mag > 3.0: 
-        angle = math.atan2(input_strafe, input_forward) 
-        arrow_len = min(60, mag * 5)
-        tip_x = cx + math.sin(angle) * arrow_len
-        tip_y = cy - math.cos(angle) * arrow_len
-        
-        # Draw the direction arrow
-        pygame.draw.line(surface, (0, 255, 0), (cx, cy), (tip_x, tip_y), 6)
-        pygame.draw.circle(surface, (0, 255, 0), (cx, cy), 8)
-        
-        # Draw the arrow tip
-        head_size = 15
-        p1 = (tip_x + math.sin(angle + 2.6)*head_size, tip_y - math.cos(angle + 2.6)*head_size)
-        p2 = (tip_x + math.sin(angle - 2.6)*head_size, tip_y - math.cos(angle - 2.6)*head_size)
-        pygame.draw.polygon(surface, (0, 255, 0), [(tip_x, tip_y), p1, p2])
-    else:
-        # Draw center circle when not moving
-        pygame.draw.circle(surface, (50, 50, 50), (cx, cy), 10)
-        pygame.draw.circle(surface, (100, 100, 100), (cx, cy), 10, 2)
-
-    # Determine text status based on input
-    status_text = "HOVERING"
-    if mag > 3.0:
-        dirs = []
-        if input_forward > 3: dirs.append("FORWARD")
-        elif input_forward < -3: dirs.append("BACKWARD")
-        if input_strafe > 3: dirs.append("RIGHT")
-        elif input_strafe < -3: dirs.append("LEFT")
-        if dirs: status_text = "-".join(dirs)
+    rad_yaw = math.radians(yaw)
+    global_acc_x = accel_fwd * math.sin(rad_yaw) + accel_side * math.cos(rad_yaw)
+    global_acc_z = accel_fwd * math.cos(rad_yaw) - accel_side * math.sin(rad_yaw)
     
-    # Display text on screen
-    if big_font:
-        txt_surf = big_font.render(f"{status_text}", True, (255, 255, 255))
-        txt_rect = txt_surf.get_rect(center=(cx, TFT_H - 30))
-        surface.blit(txt_surf, txt_rect)
+    global_vx += global_acc_x * k
+    global_vz += global_acc_z * k
+    global_vx *= friction
+    global_vz *= friction
     
-    # Show raw values on display
-    if arrow_font:
-        surface.blit(arrow_font.render(f"P: {d_pitch:.0f}", True, (150, 150, 150)), (10, 10))
-        surface.blit(arrow_font.render(f"R: {d_roll:.0f}", True, (150, 150, 150)), (10, 35))
-        surface.blit(arrow_font.render(f"Y: {d_yaw:.0f}°", True, (50, 200, 255)), (TFT_W - 90, 10))
+    cam_x += global_vx * k
+    cam_z += global_vz * k
+
+    # Follow the terrain at a limited climb rate, bounce off slopes too steep to climb
+    if terrain_mode:
+        drone_pos = drone_world_pos(cam_x, cam_y, cam_z, yaw)
+        ground = terrain.height_at(drone_pos[0], drone_pos[2])
+        target_y = max(terrain.height_at(cam_x, cam_z), ground) + CAM_HEIGHT
+        cam_y += max(-CLIMB_RATE * k, min(CLIMB_RATE * k, target_y - cam_y))
+
+        drone_bottom = cam_y + DRONE_OFFSET[1] - DRONE_CLEARANCE
+        if drone_bottom < ground:
+            cam_y += ground - drone_bottom
+            cam_x -= global_vx * k
+            cam_z -= global_vz * k
+            global_vx *= -TERRAIN_BOUNCE
+            global_vz *= -TERRAIN_BOUNCE
+            crash_until = time.time() + 0.8
 
 
 # WRAPPER FUNCTION
 def run_game(main_screen, main_pitft):
     global game_state, cam_x, cam_y, cam_z, global_vx, global_vz, menu_hold_timer
     global font, title_font, subtitle_font, arrow_font, big_font
+    global terrain_mode, terrain, crash_until, governor, sim, frame_pipe, prev_cam
     
     # Use passed in surfaces
     screen_hdmi = main_screen
@@ -284,20 +386,30 @@ def run_game(main_screen, main_pitft):
     arrow_font = pygame.font.SysFont("consolas", 20, bold=True)
     big_font = pygame.font.SysFont("consolas", 28, bold=True)
 
+    # Cockpit drawn by the shared child process, or locally
     tft_file = None
-    try:
-        tft_file = open(TFT_DEVICE, 'wb')
-    except IOError:
-        pass
-    
-    screen_tft = pygame.Surface((TFT_W, TFT_H))
+    if tftproc.USE_COCKPIT_PROCESS:
+        cockpit = tftproc.start(TFT_DEVICE)
+    else:
+        try:
+            tft_file = open(TFT_DEVICE, 'wb')
+        except IOError:
+            pass
+        screen_tft = pygame.Surface((TFT_W, TFT_H))
+        cockpit = tft.CockpitView(screen_tft, tft_file, big_font, arrow_font)
+    sim = fixed.FixedStep(30)
+    governor = quality.QualityGovernor("3D Free Roam", 30, QUALITY_KNOBS, order=QUALITY_KNOBS)
+    scaler.set_scale(1.0)
     clock = pygame.time.Clock()
     
     mpu.mpu_setup_once()
+    frame_pipe = pipeline.FramePipeline(mpu.get_mpu_orientation, 30)
+    frame_pipe.start()
 
     # Reset vars
     game_state = "TITLE"
-    cam_x, cam_y, cam_z = 0.0, -100.0, 0.0
+    cam_x, cam_y, cam_z = 0.0, CAM_HEIGHT, 0.0
+    prev_cam = (cam_x, cam_y, cam_z)
     global_vx = 0.0
     global_vz = 0.0
     menu_hold_timer = 0
@@ -315,10 +427,12 @@ def run_game(main_screen, main_pitft):
             # Return to title screen if both buttons pressed
             if GPIO.input(START_BTN_PIN) == GPIO.HIGH and GPIO.input(RESTART_BTN_PIN) == GPIO.HIGH:
                 game_state = "TITLE"
+                frame_pipe.pause()
 
                 # Stop movement when returning to title
                 global_vx, global_vz = 0.0, 0.0
                 time.sleep(0.5) 
+                governor.skip_next()
 
             # Hold blue button to return to Quit
             if GPIO.input(START_BTN_PIN) == GPIO.HIGH:
@@ -329,61 +443,88 @@ def run_game(main_screen, main_pitft):
                     running = False
             else:
                 menu_hold_timer = 0
+            frame_pipe.lap('input')
 
             # Title screen state
             if game_state == "TITLE":
-                render_title_screen(screen_hdmi, screen_tft, tft_file)
+                render_title_screen(screen_hdmi, cockpit)
+                frame_pipe.lap('render')
                 
                 # Start Game (Blue Button Only)
                 if GPIO.input(START_BTN_PIN) == GPIO.HIGH and GPIO.input(RESTART_BTN_PIN) == GPIO.LOW:
                     game_state = "PLAYING"
+                    frame_pipe.resume() # Sensor thread only reads while playing
+                    cam_y = ground_height(cam_x, cam_z) + CAM_HEIGHT
+                    prev_cam = (cam_x, cam_y, cam_z)
+                    sim.reset()
                     time.sleep(0.5) 
+                    governor.skip_next()
+
+                # Switch between the flat map and heightmap terrain (Yellow Button Only)
+                elif GPIO.input(RESTART_BTN_PIN) == GPIO.HIGH and GPIO.input(START_BTN_PIN) == GPIO.LOW:
+                    terrain_mode = not terrain_mode
+                    if terrain_mode and terrain is None:
+                        terrain = terrain3d.Terrain(TERRAIN_SEED)
+                    # Objects were placed on the old ground, so regenerate them
+                    world.reset()
+                    time.sleep(0.3)
+                    governor.skip_next()
 
             # Playing state
             elif game_state == "PLAYING":
                 # Update sensor readings
-                roll, pitch, yaw = mpu.get_mpu_orientation()
+                roll, pitch, yaw = frame_pipe.latest()
                 dz_roll = roll if abs(roll) > 2 else 0
                 dz_pitch = pitch if abs(pitch) > 2 else 0
 
-                # Physics and acceleration based on mpu input
-                accel_fwd = (dz_pitch * ACCEL_FACTOR) * SPEED_SCALAR
-                accel_side = (dz_roll * ACCEL_FACTOR) * SPEED_SCALAR
-                
-                rad_yaw = math.radians(yaw)
-                global_acc_x = accel_fwd * math.sin(rad_yaw) + accel_side * math.cos(rad_yaw)
-                global_acc_z = accel_fwd * math.cos(rad_yaw) - accel_side * math.sin(rad_yaw)
-                
-                global_vx += global_acc_x
-                global_vz += global_acc_z
-                global_vx *= FRICTION
-                global_vz *= FRICTION
-                
-                cam_x += global_vx
-                cam_z += global_vz
+                # Fixed 120 Hz physics steps for the time that passed
+                friction = sim.friction(FRICTION)
+                for _ in range(sim.advance()):
+                    step_flight(dz_roll, dz_pitch, yaw, sim.k, friction)
+                frame_pipe.lap('simulate')
 
                 # Render 3D world and cockpit
-                render_hdmi_game(screen_hdmi, roll, pitch, yaw, cam_x, cam_z, math.hypot(global_vx, global_vz))
-                render_cockpit_game(screen_tft, roll, pitch, yaw)
-                
-                pygame.display.flip() 
-                if tft_file:
-                    tft_file.seek(0)
-                    tft_file.write(screen_tft.convert(16, 0).get_buffer())
+                # Camera is drawn between the last two physics steps
+                draw_x, draw_y, draw_z = (fixed.lerp(p, c, sim.alpha) for p, c in zip(prev_cam, (cam_x, cam_y, cam_z)))
+                render_hdmi_game(screen_hdmi, roll, pitch, yaw, draw_x, draw_y, draw_z, math.hypot(global_vx, global_vz))
+                frame_pipe.lap('render')
+                pygame.display.flip()
+                frame_pipe.lap('present')
+
+                # Cockpit only writes to the piTFT when something visible changed
+                cockpit.update(roll, pitch, yaw)
+                frame_pipe.lap('cockpit')
                 
                 # Reset position when yellow button is pressed
                 if GPIO.input(RESTART_BTN_PIN) == GPIO.HIGH and GPIO.input(START_BTN_PIN) == GPIO.LOW:
                     cam_x, cam_z = 0.0, 0.0
+                    cam_y = ground_height(cam_x, cam_z) + CAM_HEIGHT
+                    prev_cam = (cam_x, cam_y, cam_z)
                     global_vx, global_vz = 0.0, 0.0
+                    sim.reset()
                     print("Position Reset!")
                     time.sleep(0.2)
+                    governor.skip_next()
 
             clock.tick(30)
+            frame_pipe.lap('idle')
+
+            # Adjust quality from how long this frame took (without the tick delay)
+            if governor.update(clock.get_rawtime()):
+                cockpit.set_refresh_hz(governor.get('cockpit_hz'))
+                if ADAPTIVE_RES:
+                    scaler.set_scale(governor.get('render_scale'))
 
     # exit and cleanup
     except KeyboardInterrupt:
         pass
     finally:
+        frame_pipe.stop()
+        if debug.DEBUG_STATS:
+            print(f"World chunks: {world.stats}")
+            print(f"Sky tiles: {[(zoom, sky.stats) for zoom, sky in skies.items()]}")
+            print(f"Quality: {governor.summary()}")
+            print(f"Pipeline: {frame_pipe.summary()}")
         if tft_file: tft_file.close()
         # GPIO.cleanup()
         # pygame.quit()
@@ -0,0 +1,63 @@
+# Malik F (mhf68) & Hetao Y (hy668)
+# Obstacle Pool v1
+# Obstacles (dict + pygame.Rect) are made once up front and handed out again from a free list, so spawning in the minigame
+# does not allocate and the garbage collector has nothing new to clean up during long runs. Despawned obstacles are
+# removed from the active list in place instead of building a new list every step.
+# October 19, 2026
+
+import pygame
+
+POOL_CAPACITY = 16    # More than the obstacles on screen at once (about 5 at the default spawn rate)
+
+
+# Fixed set of obstacle dicts, `active` is the list the game draws and updates
+class ObstaclePool:
+    def __init__(self, capacity=POOL_CAPACITY):
+        self.active = []
+        self.fresh = [self._new() for _ in range(capacity)]   # Made up front, never handed out yet
+        self.free = []                                        # Handed out before and returned
+        self.capacity = capacity
+        self.stats = {'spawned': 0, 'reused': 0, 'allocated': 0, 'high_water': 0}
+
+    def _new(self):
+        return {'rect': pygame.Rect(0, 0, 0, 0), 'y': 0.0, 'prev_y': 0.0, 'color': (0, 0, 0)}
+
+    # Obstacle at (left, top) of size w x h, returned ones first, then unused ones (a new one only if the pool ran dry)
+    def spawn(self, left, top, w, h, color):
+        if self.free:
+            obs = self.free.pop()
+            self.stats['reused'] += 1
+        elif self.fresh:
+            obs = self.fresh.pop()
+        else:
+            obs = self._new()
+            self.capacity += 1
+            self.stats['allocated'] += 1
+        obs['rect'].update(left, int(top), w, h)
+        obs['y'] = obs['prev_y'] = float(top)
+        obs['color'] = color
+        self.active.append(obs)
+        self.stats['spawned'] += 1
+        if len(self.active) > self.stats['high_water']: self.stats['high_water'] = len(self.active)
+        return obs
+
+    # Keep only obstacles where keep(obs) is True (in place, order kept), the rest go back on the free list
+    def compact(self, keep):
+        active = self.active
+        n = 0
+        for obs in active:
+            if keep(obs):
+                active[n] = obs
+                n += 1
+            else:
+                self.free.append(obs)
+        del active[n:]
+
+    # Return every active obstacle to the free list
+    def clear(self):
+        self.free.extend(self.active)
+        self.active.clear()
+
+    # Fraction of spawns that reused an obstacle returned earlier
+    def reuse_rate(self):
+        return round(self.stats['reused'] / max(self.stats['spawned'], 1), 3)
@@ -0,0 +1,40 @@
+# Malik F (mhf68) & Hetao Y (hy668)
+# Overlay Surface Pool v1
+# Translucent overlays (HUD background, game over fade) are created once in display format and reused every frame.
+# Allocation counters let us check that steady-state frames create no new surfaces.
+# October 19, 2026
+
+import pygame
+
+# Pool shared by all games, keyed by (size, alpha, color)
+_overlays = {}
+overlay_allocations = 0
+overlay_reuses = 0
+
+
+# Return a filled translucent surface, only created the first time it is asked for
+def get_overlay(size, alpha, color=(0, 0, 0)):
+    global overlay_allocations, overlay_reuses
+
+    key = (tuple(size), alpha, tuple(color))
+    surf = _overlays.get(key)
+    if surf is not None:
+        overlay_reuses += 1
+        return surf
+
+    surf = pygame.Surface(key[0])
+    surf.fill(key[2])
+    if pygame.display.get_surface():
+        surf = surf.convert()
+    surf.set_alpha(alpha)
+    _overlays[key] = surf
+    overlay_allocations += 1
+    return surf
+
+# Allocation counts for debugging
+def overlay_stats():
+    return {'allocations': overlay_allocations, 'reuses': overlay_reuses, 'cached': len(_overlays)}
+
+# Drop all cached overlays (e.g. after the display format changes)
+def clear_overlays():
+    _overlays.clear()
@@ -8,6 +8,7 @@ import pigame
 import os
 import sys
 import time
+import queue
 import RPi.GPIO as GPIO
 
 # Import all our games as modules
@@ -15,6 +16,7 @@ import mpu6050_2Dminigame_v2 as game_2d
 import mpu6050_2Dminigamehard_v2 as game_2d_hard
 import mpu6050_2DFreeRoam_v2 as game_2d_free
 import mpu6050_3DFreeRoam_v2 as game_3d_free
+import tft_process_v1 as tftproc
 
 # Display Initialize
 WIDTH, HEIGHT = 800, 480
@@ -56,69 +58,122 @@ title_font = pygame.font.SysFont("consolas", 80, bold=True)
 sub_font = pygame.font.SysFont("consolas", 30)
 item_font = pygame.font.SysFont("consolas", 40)
 
-# Draw menu interface
-def draw_menu(selection_index):
-    screen.fill((20, 20, 30)) # Dark background
+# Button events (edge callbacks from the GPIO library's thread, handled by the main loop)
+BUTTON_BOUNCE_MS = 200   # Edges closer together than this are switch bounce
+RELEASE_POLL = 0.02      # Seconds between checks while waiting for both buttons to be let go
+EVENT_WAIT = 0.25        # Seconds between checks for quit/escape while no button is pressed
+button_events = queue.Queue()
+
+# Runs on the GPIO thread, only hands the pin to the main loop
+def on_button(pin):
+    button_events.put(pin)
+
+# Watch both buttons for presses (rising edge, same as the old polling)
+def start_buttons():
+    for pin in (SELECT_BTN_PIN, CYCLE_BTN_PIN):
+        GPIO.add_event_detect(pin, GPIO.RISING, callback=on_button, bouncetime=BUTTON_BOUNCE_MS)
+
+# Wait until both buttons are released and have settled (a game is left by holding blue, and a bounce on release would
+# otherwise be seen as a new press once edge detection is back on)
+def wait_for_release():
+    while GPIO.input(SELECT_BTN_PIN) == GPIO.HIGH or GPIO.input(CYCLE_BTN_PIN) == GPIO.HIGH:
+        time.sleep(RELEASE_POLL)
+    time.sleep(BUTTON_BOUNCE_MS / 1000.0)
+
+# Stop watching while a game polls the buttons itself, and forget presses that were not handled
+def stop_buttons():
+    for pin in (SELECT_BTN_PIN, CYCLE_BTN_PIN):
+        GPIO.remove_event_detect(pin)
+    while not button_events.empty():
+        button_events.get_nowait()
+
+# Menu layout
+START_Y = 200
+SPACING = 60
+
+# Pre-rendered menu pieces (text is only rendered once)
+menu_background = None
+item_surfs = []   # (normal, highlighted) per mode
+
+# Render the title, instructions and every menu line in both colors
+def build_menu():
+    global menu_background
+    menu_background = pygame.Surface((WIDTH, HEIGHT))
+    menu_background.fill((20, 20, 30)) # Dark background
 
     # Title
     t_surf = title_font.render("Palm Pilot V1", True, (80, 160, 255))
     s_surf = sub_font.render("by Malik F & Hetao Y", True, (150, 150, 150))
     
-    screen.blit(t_surf, t_surf.get_rect(center=(WIDTH//2, 80)))
-    screen.blit(s_surf, s_surf.get_rect(center=(WIDTH//2, 130)))
+    menu_background.blit(t_surf, t_surf.get_rect(center=(WIDTH//2, 80)))
+    menu_background.blit(s_surf, s_surf.get_rect(center=(WIDTH//2, 130)))
 
-    # Menu Items
-    start_y = 200
-    spacing = 60
-    
-    for i, mode in enumerate(MODES):
-        color = (255, 255, 255)
-        prefix = "  "
+    # Instructions
+    inst = sub_font.render("YEL: Change Mode | BLUE: Select", True, (100, 100, 100))
+    menu_background.blit(inst, inst.get_rect(center=(WIDTH//2, HEIGHT - 30)))
+
+    # Menu Items (highlighted option is green with an arrow)
+    item_surfs.clear()
+    for mode in MODES:
+        item_surfs.append((item_font.render("  " + mode["name"], True, (255, 255, 255)),
+                           item_font.render("> " + mode["name"], True, (50, 255, 50))))
+
+# Draw menu interface
+def draw_menu(selection_index):
+    if menu_background is None:
+        build_menu()
+    screen.blit(menu_background, (0, 0))
+
+    for i, (normal, highlighted) in enumerate(item_surfs):
+        txt = normal
         
         # Highlight option
         if i == selection_index:
-            color = (50, 255, 50) # Green
-            prefix = "> "
+            txt = highlighted
             
             # Draw box around selection
-            rect = pygame.Rect(WIDTH//2 - 250, start_y + (i * spacing) - 10, 500, 50)
+            rect = pygame.Rect(WIDTH//2 - 250, START_Y + (i * SPACING) - 10, 500, 50)
             pygame.draw.rect(screen, (50, 50, 50), rect)
             pygame.draw.rect(screen, (100, 255, 100), rect, 2)
 
-        txt = item_font.render(prefix + mode["name"], True, color)
-        screen.blit(txt, txt.get_rect(center=(WIDTH//2, start_y + (i * spacing) + 15)))
-
-    # Instructions
-    inst = sub_font.render("YEL: Change Mode | BLUE: Select", True, (100, 100, 100))
-    screen.blit(inst, inst.get_rect(center=(WIDTH//2, HEIGHT - 30)))
+        screen.blit(txt, txt.get_rect(center=(WIDTH//2, START_Y + (i * SPACING) + 15)))
 
     pygame.display.flip()
 
 # Main Loop
 current_selection = 0
 running = True
-btn_cycle_prev = GPIO.HIGH
-btn_select_prev = GPIO.HIGH
+redraw = True
+start_buttons()
 
 try:
     while running:
 
-        # Input Handling
-        btn_cycle = GPIO.input(CYCLE_BTN_PIN)
-        btn_select = GPIO.input(SELECT_BTN_PIN)
+        # Draw only when the menu changed
+        if redraw:
+            draw_menu(current_selection)
+            redraw = False
+
+        # Sleep until a button is pressed (wakes now and then for quit/escape)
+        try:
+            pin = button_events.get(timeout=EVENT_WAIT)
+        except queue.Empty:
+            pin = None
 
         # Cycle (Yellow Button)
-        if btn_cycle == GPIO.HIGH and btn_cycle_prev == GPIO.LOW:
+        if pin == CYCLE_BTN_PIN:
             current_selection = (current_selection + 1) % len(MODES)
+            redraw = True
         
         # Select (Blue Button)
-        if btn_select == GPIO.HIGH and btn_select_prev == GPIO.LOW:
+        elif pin == SELECT_BTN_PIN:
             
             # Use function name defined above
             target_game_func = MODES[current_selection]["func"]
             
-            # Run the game which pauses this menu loop
+            # Run the game which pauses this menu loop (games poll the buttons themselves)
             print(f"Starting {MODES[current_selection]['name']}...")
+            stop_buttons()
             target_game_func(screen, pitft)
             
             # Clean up after finishing game
@@ -129,25 +184,16 @@ try:
             
             # Reset screen to menu size
             screen = pygame.display.set_mode((WIDTH, HEIGHT))
-            
-            # Debounce
-            btn_select_prev = GPIO.HIGH 
-            time.sleep(0.2) 
+            wait_for_release()
+            start_buttons()
+            redraw = True
 
-        btn_cycle_prev = btn_cycle
-        btn_select_prev = btn_select
-
-        # Draw
-        draw_menu(current_selection)
-        
         # event handling
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
                 running = False
             if event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
                 running = False
-                
-        time.sleep(0.05)
 
 # exit and cleanup (once globally)
 except KeyboardInterrupt:
@@ -156,6 +202,7 @@ finally:
     print("Shutting down Palm Pilot...")
     if 'pitft' in globals():
         del pitft
+    tftproc.stop() # Cockpit process is shared by all games, so it only stops here
     GPIO.cleanup()
     pygame.quit()
     sys.exit()
\ No newline at end of file
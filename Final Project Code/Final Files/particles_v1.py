@@ -0,0 +1,180 @@
+# Malik F (mhf68) & Hetao Y (hy668)
+# Particle System v1
+# Prop wash and crash sparks for the minigames. Particles live in preallocated NumPy arrays (no allocation per particle),
+# are moved and aged as whole arrays, and are drawn with one Surface.blits call from a few cached dot sprites.
+# One particle budget for every emitter follows the frame work time: it shrinks fast when frames run over and grows back
+# slowly with headroom, so the effects never pull the game under its frame rate.
+# Run this file to benchmark update and draw time against the particle count.
+# October 19, 2026
+
+import time
+import numpy as np
+import pygame
+
+# Particle settings
+CAPACITY = 3000         # Arrays are allocated once at this size
+START_BUDGET = 1500     # Live particles allowed before the first frame time is known
+MIN_BUDGET = 50
+DRAG = 0.15             # Fraction of speed kept after one second
+
+# Budget control (fractions of the frame budget, same idea as quality_governor_v1)
+DOWN_AT = 0.9
+UP_AT = 0.6
+DOWN_FRAMES = 10        # Slow frames in a row before shrinking
+UP_FRAMES = 30          # Fast frames in a row before growing
+SHRINK = 0.7            # Budget multiplier when frames stay slow
+GROW = 100              # Particles added back when frames stay fast
+
+# Palettes, young to old (each step is a cached sprite, size shrinks with age)
+PALETTES = {
+    'wash': [(200, 220, 255), (150, 170, 200), (100, 110, 130), (70, 75, 85)],
+    'crash': [(255, 255, 180), (255, 200, 60), (255, 110, 30), (200, 40, 20), (90, 80, 80)],
+}
+SIZES = (4, 3, 3, 2, 2)
+
+
+# Fixed-size particle store with a frame time driven budget
+class ParticleSystem:
+    FIELDS = ('x', 'y', 'vx', 'vy', 'life', 'max_life')
+
+    def __init__(self, capacity=CAPACITY):
+        self.capacity = capacity
+        self.count = 0
+        for name in self.FIELDS:
+            setattr(self, name, np.zeros(capacity, dtype=np.float32))
+        self.palette = np.zeros(capacity, dtype=np.int32)
+        self.budget = min(START_BUDGET, capacity)
+        self.slow = 0
+        self.fast = 0
+        self.palette_names = list(PALETTES)
+        self.sprites = None
+        self.steps = max(len(colors) for colors in PALETTES.values())
+        self.stats = {'emitted': 0, 'dropped': 0, 'trimmed': 0, 'budget_low': self.budget}
+
+    # Dot sprites for every palette and age step, indexed palette * steps + step
+    def _build_sprites(self):
+        self.sprites = []
+        half = []
+        for name in self.palette_names:
+            colors = PALETTES[name]
+            for step in range(self.steps):
+                color = colors[min(step, len(colors) - 1)]
+                size = SIZES[min(step, len(SIZES) - 1)]
+                dot = pygame.Surface((size * 2, size * 2))
+                dot.set_colorkey((0, 0, 0))
+                pygame.draw.circle(dot, color, (size, size), size)
+                if pygame.display.get_surface():
+                    dot = dot.convert()
+                self.sprites.append(dot)
+                half.append(size)
+        self.half = np.array(half, dtype=np.int32)
+
+    # Add n particles at (x, y) moving in random directions at speed (px/s), living `life` seconds, budget permitting.
+    # drift (px/s) is added to every particle's velocity.
+    def emit(self, x, y, n, speed, life, palette, drift=(0.0, 0.0), spread=0.0):
+        room = max(min(self.budget, self.capacity) - self.count, 0)
+        if n > room:
+            self.stats['dropped'] += n - room
+            n = room
+        if n <= 0:
+            return
+        s = slice(self.count, self.count + n)
+        angle = np.random.uniform(0.0, 2 * np.pi, n)
+        v = speed * np.random.uniform(0.3, 1.0, n)
+        self.x[s] = x + np.random.uniform(-spread, spread, n)
+        self.y[s] = y + np.random.uniform(-spread, spread, n)
+        self.vx[s] = np.cos(angle) * v + drift[0]
+        self.vy[s] = np.sin(angle) * v + drift[1]
+        self.life[s] = self.max_life[s] = life * np.random.uniform(0.6, 1.0, n)
+        self.palette[s] = self.palette_names.index(palette)
+        self.count += n
+        self.stats['emitted'] += n
+
+    # Move and age every particle by dt seconds, then drop the dead ones (in place, order kept)
+    def update(self, dt):
+        n = self.count
+        if n == 0:
+            return
+        drag = DRAG ** dt
+        self.vx[:n] *= drag
+        self.vy[:n] *= drag
+        self.x[:n] += self.vx[:n] * dt
+        self.y[:n] += self.vy[:n] * dt
+        self.life[:n] -= dt
+        self._keep(np.flatnonzero(self.life[:n] > 0))
+
+    def _keep(self, idx):
+        if len(idx) == self.count:
+            return
+        for name in self.FIELDS + ('palette',):
+            arr = getattr(self, name)
+            arr[:len(idx)] = arr[idx]
+        self.count = len(idx)
+
+    # One blits call for every live particle (sprite chosen by palette and age)
+    def draw(self, surface):
+        n = self.count
+        if n == 0:
+            return
+        if self.sprites is None:
+            self._build_sprites()
+        age = 1.0 - self.life[:n] / self.max_life[:n]
+        index = self.palette[:n] * self.steps + np.minimum((age * self.steps).astype(np.int32), self.steps - 1)
+        half = self.half[index]
+        px = (self.x[:n].astype(np.int32) - half).tolist()
+        py = (self.y[:n].astype(np.int32) - half).tolist()
+        sprites = self.sprites
+        surface.blits([(sprites[i], (a, b)) for i, a, b in zip(index.tolist(), px, py)], doreturn=False)
+
+    # Feed the smoothed frame work time (quality governor's average, which already skips deliberate waits).
+    # Shrink the budget (dropping the oldest particles) after DOWN_FRAMES slow frames, grow it after UP_FRAMES fast ones.
+    def adjust(self, frame_ms, budget_ms):
+        if frame_ms > budget_ms * DOWN_AT:
+            self.slow += 1; self.fast = 0
+        elif frame_ms < budget_ms * UP_AT:
+            self.fast += 1; self.slow = 0
+        else:
+            self.slow = self.fast = 0
+
+        if self.slow >= DOWN_FRAMES:
+            self.slow = 0
+            self.budget = max(int(self.budget * SHRINK), MIN_BUDGET)
+            self.stats['budget_low'] = min(self.stats['budget_low'], self.budget)
+            if self.count > self.budget:
+                self.stats['trimmed'] += self.count - self.budget
+                self._keep(np.arange(self.count - self.budget, self.count))
+        elif self.fast >= UP_FRAMES:
+            self.fast = 0
+            self.budget = min(self.budget + GROW, self.capacity)
+
+    # Drop every particle and start the slow/fast counts over (on restart)
+    def clear(self):
+        self.count = 0
+        self.slow = self.fast = 0
+
+    # Live particles, budget and counters
+    def summary(self):
+        return dict(self.stats, live=self.count, budget=self.budget)
+
+
+# Time update + draw for n particles on an 800x480 surface
+def _frame_ms(n, frames=30):
+    surface = pygame.Surface((800, 480))
+    ps = ParticleSystem(max(n, 1))
+    ps.budget = n
+    ps.emit(400, 240, n, 300.0, 100.0, 'crash', spread=200.0)
+    start = time.perf_counter()
+    for _ in range(frames):
+        ps.update(1 / 60.0)
+        ps.draw(surface)
+    return (time.perf_counter() - start) * 1000.0 / frames
+
+# Update + draw time per frame for growing particle counts
+def benchmark():
+    pygame.init()
+    for n in (100, 500, 1000, 2000, 3000, 6000):
+        print(f"{n:5d} particles: {_frame_ms(n):6.2f} ms per frame")
+
+
+if __name__ == "__main__":
+    benchmark()
@@ -0,0 +1,98 @@
+# Malik F (mhf68) & Hetao Y (hy668)
+# Quality Governor v1
+# Shared by all game modes. Watches the frame work time and steps quality knobs down when frames run over budget,
+# and back up (in reverse order) when there is clear headroom. Every step is kept (and printed with DEBUG_STATS) so the
+# order can be tuned.
+# Frames that wait on purpose (button debounce sleeps, sensor recalibration, loading) are skipped, not counted as slow.
+# October 19, 2026
+
+import time
+import debug_stats_v1 as debug
+
+# Knob levels, best quality first
+KNOBS = {
+    'grid_lines': (True, False),
+    'overlays': (True, False),            # Translucent HUD/fade, otherwise skipped or solid
+    'propellers': (True, False),          # Spinning props, otherwise a fixed frame
+    'cockpit_hz': (20, 10, 5),            # piTFT refresh rate
+    'grass': (1.0, 0.5, 0.25),            # Fraction of grass blades drawn
+    'render_scale': (1.0, 0.75, 0.5),     # 3D world render resolution
+}
+
+# First knob to give up quality when over budget (cheapest looking loss first)
+KNOB_ORDER = ('grid_lines', 'propellers', 'overlays', 'cockpit_hz', 'grass', 'render_scale')
+
+# Hysteresis settings
+DOWN_AT = 0.95              # Fraction of the frame budget that counts as too slow
+UP_AT = 0.55                # Fraction of the budget needed before raising quality
+DOWN_FRAMES = 10            # Slow frames in a row before lowering one knob
+UP_FRAMES = 90              # Fast frames in a row before raising one knob
+SMOOTHING = 0.1             # Weight of the newest frame in the average
+
+
+# Frame time driven quality control for one game
+class QualityGovernor:
+    def __init__(self, game_name, target_fps, knobs, order=KNOB_ORDER, enabled=True):
+        self.game_name = game_name
+        self.budget_ms = 1000.0 / target_fps
+        self.enabled = enabled
+        self.order = [name for name in order if name in knobs]
+        self.levels = {name: 0 for name in self.order}
+        self.frame_ms = 0.0
+        self.slow = 0
+        self.fast = 0
+        self.skip = True      # First frame includes loading
+        self.start = time.time()
+        self.decisions = []   # (seconds since start, 'down' or 'up', knob, new value, average frame ms)
+
+    # Current value of a knob
+    def get(self, name):
+        return KNOBS[name][self.levels[name]]
+
+    # The next update() ignores its frame (call after a deliberate wait in the game loop)
+    def skip_next(self):
+        self.skip = True
+
+    # Feed the work time of the last frame (not counting clock.tick sleep). Returns True if a knob changed.
+    def update(self, frame_ms):
+        if self.skip:
+            self.skip = False
+            return False
+        self.frame_ms += (frame_ms - self.frame_ms) * SMOOTHING
+        if not self.enabled:
+            return False
+
+        if self.frame_ms > self.budget_ms * DOWN_AT:
+            self.slow += 1; self.fast = 0
+        elif self.frame_ms < self.budget_ms * UP_AT:
+            self.fast += 1; self.slow = 0
+        else:
+            self.slow = self.fast = 0
+
+        if self.slow >= DOWN_FRAMES:
+            lower = [name for name in self.order if self.levels[name] < len(KNOBS[name]) - 1]
+            if lower:
+                return self._step(lower[0], 1)
+        elif self.fast >= UP_FRAMES:
+            raise_ = [name for name in self.order if self.levels[name] > 0]
+            if raise_:
+                return self._step(raise_[-1], -1)
+        return False
+
+    # Change one knob by one level and log it. The average restarts mid-band so one change is judged before the next.
+    def _step(self, name, direction):
+        self.levels[name] += direction
+        self.slow = self.fast = 0
+        decision = (round(time.time() - self.start, 1), 'down' if direction > 0 else 'up', name, self.get(name),
+                    round(self.frame_ms, 1))
+        self.decisions.append(decision)
+        if debug.DEBUG_STATS:
+            print(f"[Quality] {self.game_name} {decision[0]}s: {decision[4]} ms / {self.budget_ms:.1f} ms budget, "
+                  f"{decision[1]} {name} -> {decision[3]}")
+        self.frame_ms = self.budget_ms * (DOWN_AT + UP_AT) / 2
+        return True
+
+    # Current knob values and how many changes were made
+    def summary(self):
+        return {'knobs': {name: self.get(name) for name in self.order}, 'changes': len(self.decisions),
+                'frame_ms': round(self.frame_ms, 1)}
@@ -0,0 +1,49 @@
+# Malik F (mhf68) & Hetao Y (hy668)
+# Adaptive Render Scale v1
+# The 3D view can be rendered into a smaller off-screen surface and scaled up to the HDMI screen.
+# The scale is one of the quality governor's knobs, so it follows the measured frame times.
+# October 19, 2026
+
+import pygame
+import overlay_pool_v1 as overlays
+
+# Debug overlay position and size
+OVERLAY_POS = (6, 6)
+OVERLAY_SIZE = (210, 26)
+
+
+# Owns the off-screen surfaces for each render scale
+class RenderScaler:
+    def __init__(self, screen_w, screen_h):
+        self.screen_w, self.screen_h = screen_w, screen_h
+        self.scale = 1.0
+        self.changes = 0
+        self._surfaces = {}
+
+    # Scale for the next frames (1.0 = full resolution)
+    def set_scale(self, scale):
+        if scale != self.scale:
+            self.scale = scale
+            self.changes += 1
+
+    # Surface to render into at the current scale (the screen itself at full scale)
+    def target(self, screen):
+        if self.scale == 1.0:
+            return screen
+        size = (int(self.screen_w * self.scale), int(self.screen_h * self.scale))
+        surf = self._surfaces.get(size)
+        if surf is None:
+            surf = pygame.Surface(size).convert() if pygame.display.get_surface() else pygame.Surface(size)
+            self._surfaces[size] = surf
+        return surf
+
+    # Scale the off-screen render up onto the screen (nothing to do at full scale)
+    def present(self, surf, screen):
+        if surf is not screen:
+            pygame.transform.scale(surf, (self.screen_w, self.screen_h), screen)
+
+    # Debug readout of scale and frame time
+    def draw_overlay(self, screen, font, frame_ms):
+        text = font.render(f"Render {int(self.scale * 100)}%  {frame_ms:4.1f} ms", True, (255, 255, 255))
+        screen.blit(overlays.get_overlay(OVERLAY_SIZE, 150), OVERLAY_POS)
+        screen.blit(text, (OVERLAY_POS[0] + 5, OVERLAY_POS[1] + 4))
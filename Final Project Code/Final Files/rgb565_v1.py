@@ -0,0 +1,182 @@
+# Malik F (mhf68) & Hetao Y (hy668)
+# RGB565 Conversion v1
+# Packs surfaces (or just the dirty sub-rectangle) into a preallocated uint16 buffer for the piTFT (fb1).
+# Plain conversion blits the sub-rectangle into one RGB565 surface kept by the converter (pygame's C converter, same result
+# as convert(16, 0) without a new surface per band), which measured faster than NumPy at every band size.
+# The NumPy packer is only used for the optional 4x4 ordered dither, which pygame cannot do. Run this file to benchmark both.
+# October 19, 2026
+
+import os
+import time
+import numpy as np
+import pygame
+
+# 4x4 Bayer matrix, values 0..15
+BAYER_4X4 = np.array([[ 0,  8,  2, 10],
+                      [12,  4, 14,  6],
+                      [ 3, 11,  1,  9],
+                      [15,  7, 13,  5]], dtype=np.uint16)
+
+# Masks of a surface that is already RGB565
+RGB565_MASKS = (0xF800, 0x07E0, 0x001F, 0)
+
+
+# Converts a surface (or part of it) into a reusable RGB565 buffer
+class Rgb565Converter:
+    def __init__(self, width, height):
+        self.width, self.height = width, height
+
+        # Output is row-major like the framebuffer, so rows can be written directly
+        self.out = np.zeros((height, width), dtype=np.uint16)
+        self.tmp = np.empty((height, width), dtype=np.uint16)
+
+        # 16-bit surface that bands are blitted into (pygame packs to RGB565 in C while blitting)
+        self.packed = pygame.Surface((width, height), 0, 16)
+
+        # Dither thresholds tiled to screen size, so partial updates line up with full ones
+        reps = (height // 4 + 1, width // 4 + 1)
+        bayer = np.tile(BAYER_4X4, reps)[:height, :width]
+        self.dither_5 = bayer // 2   # 0..7 for 5-bit red/blue
+        self.dither_6 = bayer // 4   # 0..3 for 6-bit green
+
+    # Convert rect of surface into self.out, returns the written view of self.out
+    def convert(self, surface, rect=None, dither=False):
+        if rect is None:
+            x0, y0, w, h = 0, 0, self.width, self.height
+        else:
+            x0, y0, w, h = pygame.Rect(rect).clip(pygame.Rect(0, 0, self.width, self.height))
+        x1, y1 = x0 + w, y0 + h
+        out = self.out[y0:y1, x0:x1]
+        if w == 0 or h == 0:
+            return out
+
+        bits = surface.get_bitsize()
+        if bits == 16 and surface.get_masks() == RGB565_MASKS:
+            # Already RGB565, copy straight across
+            px = pygame.surfarray.pixels2d(surface)
+            out[:] = px[x0:x1, y0:y1].T
+            del px
+            return out
+        if not dither or bits not in (24, 32):
+            # pygame's C converter: blit just the sub-rectangle into the RGB565 surface, then copy it across
+            self.packed.blit(surface, (x0, y0), (x0, y0, w, h))
+            px = pygame.surfarray.pixels2d(self.packed)
+            out[:] = px[x0:x1, y0:y1].T
+            del px
+            return out
+        return self.pack_numpy(surface, (x0, y0, w, h), dither)
+
+    # NumPy packer (used for the dither), rect must already be clipped to the screen
+    def pack_numpy(self, surface, rect, dither=False):
+        x0, y0, w, h = rect
+        x1, y1 = x0 + w, y0 + h
+        out = self.out[y0:y1, x0:x1]
+        tmp = self.tmp[y0:y1, x0:x1]
+        d5 = self.dither_5[y0:y1, x0:x1]
+        d6 = self.dither_6[y0:y1, x0:x1]
+
+        # Red -> bits 15..11
+        px = pygame.surfarray.pixels_red(surface)
+        np.copyto(out, px[x0:x1, y0:y1].T)
+        del px
+        if dither:
+            np.add(out, d5, out=out)
+            np.minimum(out, 255, out=out)
+        np.right_shift(out, 3, out=out)
+        np.left_shift(out, 11, out=out)
+
+        # Green -> bits 10..5
+        px = pygame.surfarray.pixels_green(surface)
+        np.copyto(tmp, px[x0:x1, y0:y1].T)
+        del px
+        if dither:
+            np.add(tmp, d6, out=tmp)
+            np.minimum(tmp, 255, out=tmp)
+        np.right_shift(tmp, 2, out=tmp)
+        np.left_shift(tmp, 5, out=tmp)
+        np.bitwise_or(out, tmp, out=out)
+
+        # Blue -> bits 4..0
+        px = pygame.surfarray.pixels_blue(surface)
+        np.copyto(tmp, px[x0:x1, y0:y1].T)
+        del px
+        if dither:
+            np.add(tmp, d5, out=tmp)
+            np.minimum(tmp, 255, out=tmp)
+        np.right_shift(tmp, 3, out=tmp)
+        np.bitwise_or(out, tmp, out=out)
+
+        return out
+
+    # Write full rows [top, bottom) of the buffer to an open framebuffer file
+    def write_rows(self, fb_file, top, bottom):
+        top = max(0, top)
+        bottom = min(self.height, bottom)
+        if bottom <= top:
+            return
+        fb_file.seek(top * self.width * 2)
+        fb_file.write(memoryview(self.out[top:bottom]).cast('B'))
+
+    # Convert and write full rows [top, bottom) of surface. Without dither the band is blitted into the RGB565 surface
+    # and its rows are written straight from pygame's buffer (no copy, nothing allocated per band).
+    def write_band(self, fb_file, surface, top, bottom, dither=False):
+        top = max(0, top)
+        bottom = min(self.height, bottom)
+        if bottom <= top:
+            return
+        pitch = self.packed.get_pitch()
+        if dither or surface.get_bitsize() == 16 or pitch != self.width * 2:
+            self.convert(surface, (0, top, self.width, bottom - top), dither)
+            self.write_rows(fb_file, top, bottom)
+            return
+        self.packed.blit(surface, (0, top), (0, top, self.width, bottom - top))
+        buf = self.packed.get_buffer()
+        fb_file.seek(top * pitch)
+        fb_file.write(memoryview(buf)[top * pitch:bottom * pitch])
+        del buf
+
+
+# Time a function in ms per call
+def _time_ms(func, repeats):
+    func()
+    start = time.perf_counter()
+    for _ in range(repeats):
+        func()
+    return (time.perf_counter() - start) * 1000.0 / repeats
+
+# Compare the pygame path (used without dither) against the NumPy packer (used with dither, and slower without it too)
+def benchmark(sizes=((320, 240), (800, 480)), repeats=200):
+    os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+    pygame.init()
+    pygame.display.set_mode((1, 1))
+
+    for w, h in sizes:
+        surface = pygame.Surface((w, h), 0, 32)
+        noise = np.random.randint(0, 256, (w, h, 3), dtype=np.uint8)
+        pygame.surfarray.blit_array(surface, noise)
+        conv = Rgb565Converter(w, h)
+        band = (0, h // 4, w, h // 4)
+
+        results = [
+            ("convert(16, 0).get_buffer()", _time_ms(lambda: surface.convert(16, 0).get_buffer(), repeats)),
+            ("converter (pygame path)", _time_ms(lambda: conv.convert(surface), repeats)),
+            ("converter quarter band", _time_ms(lambda: conv.convert(surface, rect=band), repeats)),
+            ("numpy packer (no dither)", _time_ms(lambda: conv.pack_numpy(surface, (0, 0, w, h)), repeats)),
+            ("numpy packer quarter band", _time_ms(lambda: conv.pack_numpy(surface, band), repeats)),
+            ("numpy packer + dither", _time_ms(lambda: conv.convert(surface, dither=True), repeats)),
+            ("numpy packer + dither band", _time_ms(lambda: conv.convert(surface, rect=band, dither=True), repeats)),
+        ]
+
+        # Check that the converter output matches a full-frame convert(16, 0)
+        ref = np.frombuffer(surface.convert(16, 0).get_buffer().raw, dtype=np.uint16).reshape(h, -1)[:, :w]
+        match = (np.array_equal(ref, conv.convert(surface)) and np.array_equal(ref[h // 4:h // 2], conv.convert(surface, band))
+                 and np.array_equal(ref, conv.pack_numpy(surface, (0, 0, w, h))))
+
+        print(f"{w}x{h} (matches pygame: {match})")
+        for name, ms in results:
+            print(f"  {name:30s} {ms:7.3f} ms")
+
+
+# Start Benchmark
+if __name__ == "__main__":
+    benchmark()
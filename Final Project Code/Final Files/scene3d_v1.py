@@ -0,0 +1,311 @@
+# Malik F (mhf68) & Hetao Y (hy668)
+# 3D Scene Layer v1
+# Small retained-mode scene for the 3D free roam. Meshes are vertex/face arrays, nodes cache their world transform until moved,
+# faces are back-face culled and drawn far to near (painter's algorithm).
+# Objects are frustum culled in bulk by bounding sphere before any per-object work, and far objects drop to a dot (LOD).
+# October 19, 2026
+
+import math
+import numpy as np
+import pygame
+import math3d_v1 as m3d
+
+# Level of detail distances (view depth)
+LOD_FULL_DIST = 1200    # Closer than this gets full geometry
+LOD_SKIP_DIST = 2400    # Further than this is not drawn at all, in between is a dot
+
+
+# Vertex array plus faces (3 or 4 vertices), edges (lines) and points (circles)
+class Mesh:
+    def __init__(self, verts):
+        self.verts = np.asarray(verts, dtype=float)
+        self.faces = []    # (indices, color, outline, double_sided)
+        self.edges = []    # (i, j, color, width)
+        self.points = []   # (i, color, radius)
+        self.lod_color = None   # Dot color when far away (None = skip), defaults to the first face color
+        self._arrays = None
+
+    # Faces are wound clockwise on screen when seen from the front
+    def add_face(self, indices, color, outline=None, double_sided=False):
+        self.faces.append((tuple(indices), color, outline, double_sided))
+        if self.lod_color is None:
+            self.lod_color = color
+        self._arrays = None
+
+    def add_edge(self, i, j, color, width=1):
+        self.edges.append((i, j, color, width))
+        self._arrays = None
+
+    def add_point(self, i, color, radius=4):
+        self.points.append((i, color, radius))
+        self._arrays = None
+
+    # Index arrays for vectorized culling, rebuilt only after the mesh changes
+    def arrays(self):
+        if self._arrays is None:
+            # Triangles are padded to 4 indices by repeating the last vertex
+            face_idx = np.array([(f[0] + (f[0][-1],))[:4] for f in self.faces], dtype=np.int32).reshape(-1, 4)
+            face_double = np.array([f[3] for f in self.faces], dtype=bool)
+            edge_idx = np.array([e[:2] for e in self.edges], dtype=np.int32).reshape(-1, 2)
+            point_idx = np.array([p[0] for p in self.points], dtype=np.int32)
+            self._arrays = (face_idx, face_double, edge_idx, point_idx)
+        return self._arrays
+
+
+# Axis-aligned box centered on x/z with its base at y=0
+def box_mesh(w, h, d, color, outline=None, top_color=None):
+    x, z = w / 2.0, d / 2.0
+    mesh = Mesh([(-x, 0, -z), (x, 0, -z), (x, h, -z), (-x, h, -z),
+                 (-x, 0, z), (x, 0, z), (x, h, z), (-x, h, z)])
+    mesh.add_face((0, 3, 2, 1), color, outline)    # Near (-z)
+    mesh.add_face((5, 6, 7, 4), color, outline)    # Far (+z)
+    mesh.add_face((4, 7, 3, 0), color, outline)    # Left
+    mesh.add_face((1, 2, 6, 5), color, outline)    # Right
+    mesh.add_face((3, 7, 6, 2), top_color or color, outline)   # Top
+    mesh.add_face((4, 0, 1, 5), color, outline)    # Bottom
+    return mesh
+
+# Four sided pyramid with its base at y=0
+def pyramid_mesh(w, h, color, outline=None):
+    x = w / 2.0
+    mesh = Mesh([(-x, 0, -x), (x, 0, -x), (x, 0, x), (-x, 0, x), (0, h, 0)])
+    mesh.add_face((0, 4, 1), color, outline)
+    mesh.add_face((1, 4, 2), color, outline)
+    mesh.add_face((2, 4, 3), color, outline)
+    mesh.add_face((3, 4, 0), color, outline)
+    mesh.add_face((3, 0, 1, 2), color, outline)
+    return mesh
+
+
+# Transform holder. World vertices are cached until the node or a parent moves.
+class Node:
+    def __init__(self, mesh=None, position=(0, 0, 0), rotation=(0, 0, 0), scale=1.0):
+        self.mesh = mesh
+        self.children = []
+        self.parent = None
+        self._position = np.asarray(position, dtype=float)
+        self._rotation = tuple(rotation)    # (roll, pitch, yaw) in radians
+        self._scale = scale
+        self._world = None                  # (matrix, offset)
+        self._world_verts = None
+        self.version = 0                    # Bumped whenever the world transform changes
+        self.transform_updates = 0
+
+    def add(self, child):
+        child.parent = self
+        self.children.append(child)
+        child._mark_dirty()
+        return child
+
+    # Only invalidates the cache when something actually changed
+    def set_transform(self, position=None, rotation=None, scale=None):
+        changed = False
+        if position is not None and not np.array_equal(position, self._position):
+            self._position = np.asarray(position, dtype=float); changed = True
+        if rotation is not None and tuple(rotation) != self._rotation:
+            self._rotation = tuple(rotation); changed = True
+        if scale is not None and scale != self._scale:
+            self._scale = scale; changed = True
+        if changed:
+            self._mark_dirty()
+
+    def _mark_dirty(self):
+        self.version += 1
+        self._world = None
+        self._world_verts = None
+        for child in self.children:
+            child._mark_dirty()
+
+    # World transform as (3x3 matrix, offset)
+    def world_transform(self):
+        if self._world is None:
+            local = m3d.rotation_matrix(*self._rotation) * self._scale
+            if self.parent:
+                p_mat, p_off = self.parent.world_transform()
+                self._world = (p_mat @ local, p_mat @ self._position + p_off)
+            else:
+                self._world = (local, self._position)
+        return self._world
+
+    def world_verts(self):
+        if self._world_verts is None:
+            matrix, offset = self.world_transform()
+            self._world_verts = m3d.rotate_points(self.mesh.verts, matrix) + offset
+            self.transform_updates += 1
+        return self._world_verts
+
+    # This node and all descendants
+    def walk(self):
+        yield self
+        for child in self.children:
+            yield from child.walk()
+
+
+# Collection of nodes rendered together with one camera
+class Scene:
+    def __init__(self, lod_full=LOD_FULL_DIST, lod_skip=LOD_SKIP_DIST):
+        self.nodes = []
+        self.lod_full = lod_full
+        self.lod_skip = lod_skip
+        self.stats = {}
+        self._compiled = None
+        self._versions = None
+
+    def add(self, node):
+        self.nodes.append(node)
+        self._compiled = None
+        return node
+
+    # Replace all root nodes (used when streaming world chunks in and out)
+    def set_nodes(self, nodes):
+        self.nodes = list(nodes)
+        self._compiled = None
+
+    # Every node with a mesh, depth first
+    def mesh_nodes(self):
+        return [node for root in self.nodes for node in root.walk() if node.mesh is not None]
+
+    # Stack all world vertices and primitives into single arrays, plus one bounding sphere per node.
+    # Only rebuilt after a node moves or the node set changes.
+    def _compile(self, nodes):
+        verts, face_idx, face_double, faces, edge_idx, edges, point_idx, points = [], [], [], [], [], [], [], []
+        counts, centers, radii, lod_colors = [], [], [], []
+        base = 0
+        for node in nodes:
+            mesh = node.mesh
+            f_idx, f_double, e_idx, p_idx = mesh.arrays()
+            wv = node.world_verts()
+            verts.append(wv)
+            face_idx.append(f_idx + base); face_double.append(f_double); faces.extend(mesh.faces)
+            edge_idx.append(e_idx + base); edges.extend(mesh.edges)
+            point_idx.append(p_idx + base); points.extend(mesh.points)
+            counts.append((len(wv), len(f_idx), len(e_idx), len(p_idx)))
+
+            # Bounding sphere around the bounding box center
+            center = (wv.min(axis=0) + wv.max(axis=0)) / 2.0
+            centers.append(center)
+            radii.append(np.sqrt(((wv - center) ** 2).sum(axis=1).max()))
+            lod_colors.append(mesh.lod_color)
+            base += len(wv)
+
+        if not verts:
+            return None
+        counts = np.array(counts, dtype=np.int32)
+        return {
+            'verts': np.concatenate(verts), 'face_idx': np.concatenate(face_idx), 'face_double': np.concatenate(face_double),
+            'faces': faces, 'edge_idx': np.concatenate(edge_idx), 'edges': edges,
+            'point_idx': np.concatenate(point_idx), 'points': points,
+            'counts': counts, 'centers': np.array(centers), 'radii': np.array(radii), 'lod_colors': lod_colors,
+        }
+
+    # Bulk frustum test of bounding spheres in view space. Returns (visible, full detail) masks.
+    def _cull(self, centers_v, radii, cx, cy, fov, near):
+        x, y, z = centers_v[:, 0], centers_v[:, 1], centers_v[:, 2]
+        visible = (z + radii > near) & (z - radii < self.lod_skip)
+
+        # Side planes of project(): |x| * fov / (fov + z) < cx  ->  |x| - (cx / fov) * (fov + z) < 0
+        for k, coord in ((cx / fov, x), (cy / fov, y)):
+            dist = (np.abs(coord) - k * (fov + z)) / math.sqrt(1.0 + k * k)
+            visible &= dist < radii
+
+        return visible, visible & (z < self.lod_full)
+
+    # Camera looks down +z from cam_pos after view_matrix is applied (zoom < 1 renders into a smaller surface).
+    # roll (degrees) turns the projected image about (cx, cy) to match a rolled horizon.
+    def render(self, surface, cam_pos, view_matrix, cx, cy, fov, near=10.0, zoom=1.0, roll=0.0):
+        nodes = self.mesh_nodes()
+        versions = [node.version for node in nodes]
+        if self._compiled is None or versions != self._versions:
+            self._compiled = self._compile(nodes)
+            self._versions = versions
+        comp = self._compiled
+        if comp is None:
+            self.stats = {'objects': 0, 'culled': 0, 'lod_dots': 0, 'transformed': 0, 'backfaces': 0, 'drawn': 0}
+            return self.stats
+
+        cam_pos = np.asarray(cam_pos, dtype=float)
+        counts = comp['counts']
+        centers_v = m3d.rotate_points(comp['centers'] - cam_pos, view_matrix)
+        half_w, half_h = cx / zoom, cy / zoom
+        if roll:
+            # A rolled view reaches out to the screen corners in every direction
+            half_w = half_h = math.hypot(half_w, half_h)
+        visible, full = self._cull(centers_v, comp['radii'], half_w, half_h, fov, near)
+
+        # Only vertices of full detail objects get transformed
+        vmask = np.repeat(full, counts[:, 0])
+        verts = comp['verts']
+        view = np.zeros_like(verts)
+        view[vmask] = m3d.rotate_points(verts[vmask] - cam_pos, view_matrix)
+        sx, sy, vis = m3d.project_points(view, cx, cy, fov, near, zoom=zoom, roll=roll)
+        vis &= vmask
+        depth = view[:, 2]
+        draw_list = []
+
+        # Screen-space winding: clockwise (positive area with y down) faces the camera
+        face_sel = np.nonzero(np.repeat(full, counts[:, 1]))[0]
+        backfaces = 0
+        if len(face_sel):
+            face_idx = comp['face_idx'][face_sel]
+            x0, y0 = sx[face_idx[:, 0]], sy[face_idx[:, 0]]
+            area = ((sx[face_idx[:, 1]] - x0) * (sy[face_idx[:, 2]] - y0) -
+                    (sx[face_idx[:, 2]] - x0) * (sy[face_idx[:, 1]] - y0))
+            front = (area > 0) | comp['face_double'][face_sel]
+            keep = vis[face_idx].all(axis=1) & front
+            backfaces = len(face_sel) - int(front.sum())
+            face_depth = depth[face_idx].mean(axis=1)
+            for k in np.nonzero(keep)[0].tolist():
+                indices, color, outline, _ = comp['faces'][face_sel[k]]
+                poly = [(int(sx[i]), int(sy[i])) for i in face_idx[k, :len(indices)].tolist()]
+                draw_list.append((face_depth[k], 0, poly, color, outline))
+
+        edge_sel = np.nonzero(np.repeat(full, counts[:, 2]))[0]
+        if len(edge_sel):
+            edge_idx = comp['edge_idx'][edge_sel]
+            edge_depth = depth[edge_idx].mean(axis=1)
+            for k in np.nonzero(vis[edge_idx].all(axis=1))[0].tolist():
+                _, _, color, width = comp['edges'][edge_sel[k]]
+                i, j = edge_idx[k].tolist()
+                draw_list.append((edge_depth[k], 1, ((int(sx[i]), int(sy[i])), (int(sx[j]), int(sy[j]))), color, width))
+
+        point_sel = np.nonzero(np.repeat(full, counts[:, 3]))[0]
+        if len(point_sel):
+            point_idx = comp['point_idx'][point_sel]
+            for k in np.nonzero(vis[point_idx])[0].tolist():
+                _, color, radius = comp['points'][point_sel[k]]
+                i = int(point_idx[k])
+                draw_list.append((depth[i], 2, (int(sx[i]), int(sy[i])), color, radius))
+
+        # Far objects are a single dot at their center
+        dots = visible & ~full
+        dot_ids = np.nonzero(dots)[0]
+        if len(dot_ids):
+            dsx, dsy, _ = m3d.project_points(centers_v[dot_ids], cx, cy, fov, near, zoom=zoom, roll=roll)
+            for k, node_id in enumerate(dot_ids.tolist()):
+                color = comp['lod_colors'][node_id]
+                if color:
+                    draw_list.append((centers_v[node_id, 2], 3, (int(dsx[k]), int(dsy[k])), color, None))
+
+        # Painter's algorithm: far to near
+        draw_list.sort(key=lambda item: -item[0])
+        for _, kind, geom, color, extra in draw_list:
+            if kind == 0:
+                pygame.draw.polygon(surface, color, geom)
+                if extra:
+                    pygame.draw.polygon(surface, extra, geom, 1)
+            elif kind == 1:
+                pygame.draw.line(surface, color, geom[0], geom[1], extra)
+            elif kind == 2:
+                pygame.draw.circle(surface, color, geom, extra)
+            else:
+                surface.fill(color, (geom[0] - 1, geom[1] - 1, 3, 3))
+
+        self.stats = {
+            'objects': len(counts),
+            'culled': len(counts) - int(visible.sum()),
+            'lod_dots': len(dot_ids),
+            'transformed': int(vmask.sum()),
+            'backfaces': backfaces,
+            'drawn': len(draw_list),
+        }
+        return self.stats
@@ -0,0 +1,125 @@
+# Malik F (mhf68) & Hetao Y (hy668)
+# Sky Panorama v1
+# Sky, sun, clouds and mountains are painted once into a 360 degree strip. Each frame scrolls it by yaw and shifts it by pitch
+# (one or two blits). Roll uses pre-rotated tiles of the strip, cached per roll step.
+# October 19, 2026
+
+import math
+from collections import OrderedDict
+import pygame
+
+# Panorama settings
+BAND_ABOVE = 200      # Strip height above the horizon
+BAND_BELOW = 20       # Strip height below the horizon
+TILE_W = 256          # Width of the tiles that get pre-rotated for roll
+ROLL_STEP = 2         # Degrees per cached roll variant
+MAX_ROLL = 45
+TILE_PAD = 2           # Rotated tiles overlap by this much so no seams show between them
+MAX_ROTATED_TILES = 48
+
+
+# Scrolling, rolling sky background
+class SkyPanorama:
+    # paint(strip, horizon_row) draws the scenery into the strip once, always at full size.
+    # view_w/view_h is the surface drawn into; zoom < 1 scales the strip down to match a smaller render surface.
+    def __init__(self, view_w, view_h, fov, sky_color, ground_color, paint, zoom=1.0):
+        self.view_w, self.view_h = view_w, view_h
+        self.sky_color = sky_color
+        self.ground_color = ground_color
+        self.tile_w = int(TILE_W * zoom)
+        self.band_below = int(BAND_BELOW * zoom)
+
+        # One turn of yaw is 2*pi*fov pixels, so the center of the strip scrolls at the same speed as distant objects
+        tiles = int(round(2 * math.pi * fov / TILE_W))
+        full_w, full_h = tiles * TILE_W, BAND_ABOVE + BAND_BELOW
+        strip = pygame.Surface((full_w, full_h), pygame.SRCALPHA)
+        strip.fill(sky_color, (0, 0, full_w, BAND_ABOVE))
+        strip.fill(ground_color, (0, BAND_ABOVE, full_w, BAND_BELOW))
+        paint(strip, BAND_ABOVE)
+
+        self.pano_w = tiles * self.tile_w
+        self.band_h = int(BAND_ABOVE * zoom) + self.band_below
+        self.horizon_row = int(BAND_ABOVE * zoom)
+        if zoom != 1.0:
+            strip = pygame.transform.smoothscale(strip, (self.pano_w, self.band_h))
+
+        # Alpha copy for rotating, wrapped by TILE_PAD on both ends so every padded tile is one subsurface
+        padded = pygame.Surface((self.pano_w + 2 * TILE_PAD, self.band_h), pygame.SRCALPHA)
+        padded.blit(strip, (TILE_PAD, 0))
+        padded.blit(strip, (0, 0), (self.pano_w - TILE_PAD, 0, TILE_PAD, self.band_h))
+        padded.blit(strip, (self.pano_w + TILE_PAD, 0), (0, 0, TILE_PAD, self.band_h))
+
+        # Opaque copy for the common no-roll path
+        if pygame.display.get_surface():
+            self.strip = strip.convert()
+            self.strip_alpha = padded.convert_alpha()
+        else:
+            self.strip, self.strip_alpha = strip, padded
+
+        self.rotated = OrderedDict()
+        self.stats = {'rotations': 0, 'hits': 0}
+
+    # Strip x shown at the left screen edge for this yaw
+    def _scroll_x(self, yaw_deg):
+        return int(round(-yaw_deg / 360.0 * self.pano_w)) % self.pano_w
+
+    # Quantize roll to a cached variant
+    def quantize_roll(self, roll_deg):
+        roll_deg = max(-MAX_ROLL, min(MAX_ROLL, roll_deg))
+        return int(round(roll_deg / ROLL_STEP)) * ROLL_STEP
+
+    # Draw the background for this yaw, horizon height and roll. Returns the roll angle actually used.
+    def draw(self, surface, yaw_deg, horizon_y, roll_deg=0.0):
+        angle = self.quantize_roll(roll_deg)
+        start = self._scroll_x(yaw_deg)
+        top = horizon_y - self.horizon_row
+
+        if angle == 0:
+            # Flat sky and ground outside the band, then one or two blits for the band
+            surface.fill(self.sky_color, (0, 0, self.view_w, max(0, top)))
+            surface.fill(self.ground_color, (0, horizon_y + self.band_below, self.view_w, self.view_h))
+            first = min(self.view_w, self.pano_w - start)
+            surface.blit(self.strip, (0, top), (start, 0, first, self.band_h))
+            if first < self.view_w:
+                surface.blit(self.strip, (first, top), (0, 0, self.view_w - first, self.band_h))
+            return angle
+
+        # Rolled: sky fill, rotated ground half-plane, then the rotated tiles around the pivot
+        pivot_x, pivot_y = self.view_w / 2.0, horizon_y
+        rad = math.radians(angle)
+        c, s = math.cos(rad), math.sin(rad)
+        surface.fill(self.sky_color)
+        far = self.view_w + self.view_h
+        ground = [(pivot_x - c * far, pivot_y + s * far), (pivot_x + c * far, pivot_y - s * far)]
+        ground += [(ground[1][0] + s * far, ground[1][1] + c * far), (ground[0][0] + s * far, ground[0][1] + c * far)]
+        pygame.draw.polygon(surface, self.ground_color, ground)
+
+        # Tiles covering the screen once rotated (extra margin for the corners)
+        margin = int(abs(s) * self.view_h) + self.tile_w
+        first_tile = (start - margin) // self.tile_w
+        last_tile = (start + self.view_w + margin) // self.tile_w
+        band_cy = top + self.band_h / 2.0
+        for t in range(first_tile, last_tile + 1):
+            dx = t * self.tile_w - start + self.tile_w / 2.0 - pivot_x
+            dy = band_cy - pivot_y
+            tile = self._rotated_tile(t % (self.pano_w // self.tile_w), angle)
+            center = (pivot_x + dx * c + dy * s, pivot_y - dx * s + dy * c)
+            surface.blit(tile, tile.get_rect(center=(int(round(center[0])), int(round(center[1])))))
+        return angle
+
+    # Pre-rotated tile from the LRU cache
+    def _rotated_tile(self, index, angle):
+        key = (index, angle)
+        tile = self.rotated.get(key)
+        if tile is not None:
+            self.rotated.move_to_end(key)
+            self.stats['hits'] += 1
+            return tile
+
+        src = self.strip_alpha.subsurface((index * self.tile_w, 0, self.tile_w + 2 * TILE_PAD, self.band_h))
+        tile = pygame.transform.rotate(src, angle)
+        self.rotated[key] = tile
+        self.stats['rotations'] += 1
+        while len(self.rotated) > MAX_ROTATED_TILES:
+            self.rotated.popitem(last=False)
+        return tile
@@ -0,0 +1,76 @@
+# Malik F (mhf68) & Hetao Y (hy668)
+# Spatial Hash v1
+# Broad phase for the minigames: the screen is split into square cells and every obstacle/ball is listed in the cells its
+# bounding box touches. A collision check then only looks at the few items near it instead of every item on screen.
+# Items are updated in place each step and only change cells when their box crosses a cell border.
+# October 19, 2026
+
+# Cell size in pixels (about the size of an obstacle, a few balls per cell)
+CELL_SIZE = 64
+
+
+# Uniform grid of cells keyed by (column, row)
+class SpatialHash:
+    def __init__(self, cell_size=CELL_SIZE):
+        self.cell_size = cell_size
+        self.cells = {}      # (cx, cy) -> {item id: None}, dicts keep insertion order
+        self.spans = {}      # item id -> (cx0, cy0, cx1, cy1) cells it is listed in
+        self.items = {}      # item id -> item
+        self.stats = {'queries': 0, 'candidates': 0, 'moves': 0}
+
+    # Forget every item
+    def clear(self):
+        self.cells.clear()
+        self.spans.clear()
+        self.items.clear()
+
+    def _span(self, left, top, right, bottom):
+        cell = self.cell_size
+        return (int(left // cell), int(top // cell), int(right // cell), int(bottom // cell))
+
+    # Add or move an item (any object, kept by identity) with its bounding box
+    def update(self, item, left, top, right, bottom):
+        key = id(item)
+        span = self._span(left, top, right, bottom)
+        old = self.spans.get(key)
+        if old == span:
+            return
+        if old is not None:
+            self._unlink(key, old)
+            self.stats['moves'] += 1
+        self.items[key] = item
+        self.spans[key] = span
+        cx0, cy0, cx1, cy1 = span
+        for cx in range(cx0, cx1 + 1):
+            for cy in range(cy0, cy1 + 1):
+                self.cells.setdefault((cx, cy), {})[key] = None
+
+    # Drop an item (does nothing if it is not in the grid)
+    def remove(self, item):
+        key = id(item)
+        span = self.spans.pop(key, None)
+        if span is not None:
+            self._unlink(key, span)
+            del self.items[key]
+
+    def _unlink(self, key, span):
+        cx0, cy0, cx1, cy1 = span
+        for cx in range(cx0, cx1 + 1):
+            for cy in range(cy0, cy1 + 1):
+                cell = self.cells[(cx, cy)]
+                del cell[key]
+                if not cell:
+                    del self.cells[(cx, cy)]
+
+    # Items whose cells touch the box, each listed once
+    def query(self, left, top, right, bottom):
+        cx0, cy0, cx1, cy1 = self._span(left, top, right, bottom)
+        found = {}
+        for cx in range(cx0, cx1 + 1):
+            for cy in range(cy0, cy1 + 1):
+                cell = self.cells.get((cx, cy))
+                if cell:
+                    found.update(cell)
+        self.stats['queries'] += 1
+        self.stats['candidates'] += len(found)
+        return [self.items[key] for key in found]
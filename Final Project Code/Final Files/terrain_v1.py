@@ -0,0 +1,136 @@
+# Malik F (mhf68) & Hetao Y (hy668)
+# Heightmap Terrain v1
+# Terrain heights are generated once from a seed and stored as an int16 grid (512x512 is 512 KB) that wraps around.
+# Heights are sampled bilinearly, both for collision and for a grid laid out in view space (near rows small, far rows big),
+# so every quad drawn is in front of the camera and rows are already in far to near order.
+# October 19, 2026
+
+import math
+import numpy as np
+import pygame
+import math3d_v1 as m3d
+
+# Terrain settings
+TERRAIN_SIZE = 512     # Grid points per side (map wraps every TERRAIN_SIZE * CELL units)
+CELL = 80              # World units between grid points
+MAX_HEIGHT = 600       # Highest peak in world units
+ROUGHNESS = 2.2        # Higher is smoother (spectral falloff)
+
+# Projected grid: rows at growing depths in front of the camera, columns across the view
+GRID_ROWS = 24
+GRID_COLS = 32
+GRID_NEAR = 20
+GRID_FAR = 4000
+
+# Height bands (low to high) and the sun direction used for slope shading
+BAND_COLORS = np.array([(40, 120, 40), (70, 110, 50), (110, 100, 80), (235, 235, 240)], dtype=float)
+BAND_LIMITS = np.array([0.35, 0.6, 0.82])
+LIGHT_X, LIGHT_Z = 0.6, -0.8
+
+
+# Periodic fractal heightmap as int16 (filtered white noise, so the edges wrap seamlessly)
+def generate_heights(seed, size=TERRAIN_SIZE, max_height=MAX_HEIGHT, roughness=ROUGHNESS):
+    rng = np.random.default_rng(seed)
+    freq = np.fft.fftfreq(size)
+    k = np.sqrt(freq[:, None] ** 2 + freq[None, :] ** 2)
+    k[0, 0] = 1.0
+    spectrum = np.fft.fft2(rng.standard_normal((size, size))) / k ** roughness
+    spectrum[0, 0] = 0.0
+    h = np.real(np.fft.ifft2(spectrum))
+
+    # Normalize, then square so there are flat valleys between the peaks
+    h = (h - h.min()) / (h.max() - h.min())
+    return (h * h * max_height).astype(np.int16)
+
+
+# Heightmap terrain
+class Terrain:
+    def __init__(self, seed, size=TERRAIN_SIZE, cell=CELL, max_height=MAX_HEIGHT, rows=GRID_ROWS, cols=GRID_COLS):
+        self.size = size
+        self.cell = cell
+        self.max_height = max_height
+        self.heights = generate_heights(seed, size, max_height)
+        self.stats = {}
+
+        # Row depths grow geometrically, columns are fractions of the view width at that depth
+        self.depths = GRID_NEAR * (GRID_FAR / GRID_NEAR) ** (np.arange(rows + 1) / rows)
+        self.across = np.linspace(-1.0, 1.0, cols + 1)
+
+        # Quad corners in the (rows + 1) x (cols + 1) vertex grid: (i, j), (i, j+1), (i+1, j+1), (i+1, j)
+        n = cols + 1
+        i, j = np.meshgrid(np.arange(rows), np.arange(cols), indexing='ij')
+        base = (i * n + j).ravel()
+        self.quads = np.stack([base, base + 1, base + n + 1, base + n], axis=1)
+
+    # Bilinear height at world x/z (arrays or scalars)
+    def heights_at(self, x, z):
+        gx = np.asarray(x, dtype=float) / self.cell
+        gz = np.asarray(z, dtype=float) / self.cell
+        x0, z0 = np.floor(gx), np.floor(gz)
+        fx, fz = gx - x0, gz - z0
+        ix = x0.astype(np.int64) % self.size
+        iz = z0.astype(np.int64) % self.size
+        ix1, iz1 = (ix + 1) % self.size, (iz + 1) % self.size
+
+        h = self.heights
+        top = h[iz, ix] * (1 - fx) + h[iz, ix1] * fx
+        bottom = h[iz1, ix] * (1 - fx) + h[iz1, ix1] * fx
+        return top * (1 - fz) + bottom * fz
+
+    # Scalar version for collision checks
+    def height_at(self, x, z):
+        return float(self.heights_at(x, z))
+
+    # Draw the terrain for this camera (same convention as Scene.render, view_matrix is yaw only, roll in degrees)
+    def render(self, surface, cam_pos, view_matrix, cx, cy, fov, near=10.0, fade_color=(34, 100, 34), zoom=1.0, roll=0.0):
+        cam_x, cam_y, cam_z = cam_pos
+        width, height = surface.get_size()
+
+        # Grid in view space, slightly wider than the view so hill sides at the edges are covered
+        # (out to the screen corners when the view is rolled)
+        reach = math.hypot(cx, cy) if roll else cx
+        z = np.repeat(self.depths, len(self.across))
+        x = np.tile(self.across, len(self.depths)) * (reach / zoom / fov) * (fov + z) * 1.1
+
+        # Back to world x/z (inverse rotation), then bilinear heights
+        world_x = cam_x + view_matrix[0, 0] * x + view_matrix[2, 0] * z
+        world_z = cam_z + view_matrix[0, 2] * x + view_matrix[2, 2] * z
+        h = self.heights_at(world_x, world_z)
+        sx, sy, vis = m3d.project_batch(x, h - cam_y, z, cx, cy, fov, near, zoom=zoom, roll=roll)
+
+        # Quads on screen and facing the camera
+        q = self.quads
+        qx, qy = sx[q], sy[q]
+        keep = vis[q].all(axis=1)
+        keep &= (qy.max(axis=1) >= 0) & (qy.min(axis=1) < height)
+        area = ((qx[:, 2] - qx[:, 0]) * (qy[:, 3] - qy[:, 1]) - (qx[:, 3] - qx[:, 1]) * (qy[:, 2] - qy[:, 0]))
+        keep &= area < 0
+
+        # Color by height band, shade by slope, fade into the ground color with distance
+        qh = h[q]
+        band = np.searchsorted(BAND_LIMITS, qh.mean(axis=1) / self.max_height)
+        slope_x = (qh[:, 1] + qh[:, 2] - qh[:, 0] - qh[:, 3]) / (2 * (x[q[:, 1]] - x[q[:, 0]]))
+        slope_z = (qh[:, 2] + qh[:, 3] - qh[:, 0] - qh[:, 1]) / (2 * (z[q[:, 3]] - z[q[:, 0]]))
+        world_sx = view_matrix[0, 0] * slope_x + view_matrix[2, 0] * slope_z
+        world_sz = view_matrix[0, 2] * slope_x + view_matrix[2, 2] * slope_z
+        light = np.clip(0.85 - 0.6 * (world_sx * LIGHT_X + world_sz * LIGHT_Z), 0.45, 1.15)
+        fade = (z[q[:, 0]] / GRID_FAR)[:, None] ** 0.5
+        colors = BAND_COLORS[band] * light[:, None]
+        colors = np.clip(colors * (1 - fade) + np.array(fade_color, dtype=float) * fade, 0, 255).astype(np.uint8)
+
+        # Rows are generated near to far, so drawing in reverse is the painter's algorithm without a sort
+        ids = np.nonzero(keep)[0][::-1]
+        for px, py, color in zip(qx[ids].tolist(), qy[ids].tolist(), colors[ids].tolist()):
+            pygame.draw.polygon(surface, color, list(zip(px, py)))
+
+        # Skirt from the nearest row down past the bottom of the screen ("down" turns with the roll)
+        drop = width + height
+        down_x, down_y = math.sin(math.radians(roll)) * drop, math.cos(math.radians(roll)) * drop
+        near_row = np.arange(len(self.across) - 1)
+        for k in near_row[vis[q[near_row]].all(axis=1)].tolist():
+            (x0, x1), (y0, y1) = qx[k, :2].tolist(), qy[k, :2].tolist()
+            pygame.draw.polygon(surface, colors[k].tolist(),
+                                [(x0, y0), (x1, y1), (x1 + down_x, y1 + down_y), (x0 + down_x, y0 + down_y)])
+
+        self.stats = {'terrain_quads': len(q), 'terrain_drawn': len(ids)}
+        return self.stats
@@ -0,0 +1,196 @@
+# Malik F (mhf68) & Hetao Y (hy668)
+# piTFT Cockpit View v1
+# Shared cockpit for all games. Inputs are quantized to what is actually shown, so unchanged frames skip drawing and the fb1 write.
+# Only the regions that changed are redrawn and written, and the piTFT can run at its own lower refresh rate.
+# October 19, 2026
+
+import math
+import time
+import pygame
+import rgb565_v1 as rgb565
+
+# piTFT display (fb1) is RGB565, 2 bytes per pixel
+TFT_W, TFT_H = 320, 240
+TFT_DITHER = False    # Cockpit is flat colors, dithering only adds noise
+
+# Cockpit refresh and quantization settings
+TFT_REFRESH_HZ = 20   # piTFT does not need the game frame rate
+ANGLE_STEP = 5        # Degrees per arrow angle bucket
+LENGTH_STEP = 5       # Pixels per arrow length bucket
+MOVE_DEADZONE = 3.0
+
+# Fixed region for the arrow (max length 60 + line width)
+ARROW_RECT = pygame.Rect(TFT_W // 2 - 66, TFT_H // 2 - 66, 132, 132)
+
+# Text labels: (font key, color, anchor, position)
+TEXT_LABELS = {
+    'status': ('status', (255, 255, 255), 'center', (TFT_W // 2, TFT_H - 30)),
+    'pitch':  ('label', (150, 150, 150), 'topleft', (10, 10)),
+    'roll':   ('label', (150, 150, 150), 'topleft', (10, 35)),
+    'yaw':    ('label', (50, 200, 255), 'topleft', (TFT_W - 90, 10)),
+}
+
+
+# Reduce raw orientation to exactly what the cockpit displays
+def quantize_cockpit(d_roll, d_pitch, d_yaw):
+    # Map mpu inputs with movement
+    input_forward = d_pitch
+    input_strafe = d_roll
+    mag = math.hypot(input_forward, input_strafe)
+
+    arrow = None
+    status_text = "HOVERING"
+    if mag > MOVE_DEADZONE:
+        # Arrow as (angle bucket, length bucket)
+        angle = math.degrees(math.atan2(input_strafe, input_forward))
+        arrow_len = min(60, mag * 5)
+        arrow = (int(round(angle / ANGLE_STEP)) % (360 // ANGLE_STEP), int(round(arrow_len / LENGTH_STEP)))
+
+        dirs = []
+        if input_forward > 3: dirs.append("FORWARD")
+        elif input_forward < -3: dirs.append("BACKWARD")
+        if input_strafe > 3: dirs.append("RIGHT")
+        elif input_strafe < -3: dirs.append("LEFT")
+        if dirs: status_text = "-".join(dirs)
+
+    return {
+        'arrow': arrow,
+        'status': status_text,
+        'pitch': f"P: {d_pitch:.0f}",
+        'roll': f"R: {d_roll:.0f}",
+        'yaw': f"Y: {d_yaw:.0f}°",
+    }
+
+# Draw the direction arrow (or hover circle) inside ARROW_RECT
+def draw_arrow(surface, arrow):
+    surface.fill((0, 0, 0), ARROW_RECT)
+    cx, cy = ARROW_RECT.center
+
+    if arrow:
+        angle = math.radians(arrow[0] * ANGLE_STEP)
+        arrow_len = arrow[1] * LENGTH_STEP
+        tip_x = cx + math.sin(angle) * arrow_len
+        tip_y = cy - math.cos(angle) * arrow_len
+
+        # Draw the direction arrow
+        pygame.draw.line(surface, (0, 255, 0), (cx, cy), (tip_x, tip_y), 6)
+        pygame.draw.circle(surface, (0, 255, 0), (cx, cy), 8)
+
+        # Draw the arrow tip
+        head_size = 15
+        p1 = (tip_x + math.sin(angle + 2.6)*head_size, tip_y - math.cos(angle + 2.6)*head_size)
+        p2 = (tip_x + math.sin(angle - 2.6)*head_size, tip_y - math.cos(angle - 2.6)*head_size)
+        pygame.draw.polygon(surface, (0, 255, 0), [(tip_x, tip_y), p1, p2])
+    else:
+        # Draw center circle when not moving
+        pygame.draw.circle(surface, (50, 50, 50), (cx, cy), 10)
+        pygame.draw.circle(surface, (100, 100, 100), (cx, cy), 10, 2)
+
+# Merge dirty rects into full-width row bands, so each band is one seek and one write
+def merge_row_bands(dirty_rects):
+    bands = []
+    for r in sorted(dirty_rects, key=lambda r: r.top):
+        if bands and r.top <= bands[-1][1]:
+            bands[-1][1] = max(bands[-1][1], r.bottom)
+        else:
+            bands.append([r.top, r.bottom])
+    return bands
+
+
+# Change-driven cockpit for the piTFT
+class CockpitView:
+    def __init__(self, surface, tft_file, status_font, label_font, refresh_hz=TFT_REFRESH_HZ):
+        self.surface = surface
+        self.tft_file = tft_file
+        self.fonts = {'status': status_font, 'label': label_font}
+        self.converter = rgb565.Rgb565Converter(surface.get_width(), surface.get_height())
+        self.set_refresh_hz(refresh_hz)
+        self.last_push = 0.0
+        self.shown = None        # Quantized state currently on the display
+        self.text_rects = {}     # Last drawn rect for every text label
+        self.waiting = False
+        self.frames_pushed = 0
+        self.frames_skipped = 0
+
+    # Limit how often the piTFT is written (0 = every update)
+    def set_refresh_hz(self, refresh_hz):
+        self.refresh_hz = refresh_hz
+        self.min_interval = 1.0 / refresh_hz if refresh_hz else 0.0
+
+    # Force a full redraw on the next update
+    def invalidate(self):
+        self.shown = None
+        self.waiting = False
+        self.text_rects = {}
+
+    # Title screen placeholder, only drawn and written once
+    def show_waiting(self, font=None):
+        if self.waiting:
+            return
+        font = font or self.fonts['status']
+        self.surface.fill((0, 0, 0))
+        if font:
+            t_wait = font.render("WAITING", True, (50, 50, 50))
+            self.surface.blit(t_wait, t_wait.get_rect(center=(TFT_W // 2, TFT_H // 2)))
+        self.shown = None
+        self.text_rects = {}
+        self.waiting = True
+        self._flush([self.surface.get_rect()])
+
+    # Update from raw orientation, returns True if anything was written
+    def update(self, d_roll, d_pitch, d_yaw, now=None):
+        now = time.time() if now is None else now
+        if now - self.last_push < self.min_interval:
+            return False
+
+        state = quantize_cockpit(d_roll, d_pitch, d_yaw)
+        if state == self.shown:
+            self.frames_skipped += 1
+            return False
+
+        dirty = self._draw_changes(state)
+        self.shown = state
+        self.waiting = False
+        self.last_push = now
+        self.frames_pushed += 1
+        self._flush(dirty)
+        return True
+
+    # Redraw only what differs from the shown state
+    def _draw_changes(self, state):
+        full = self.shown is None
+        if full:
+            self.surface.fill((0, 0, 0))
+            self.text_rects = {}
+
+        dirty = []
+        if full or state['arrow'] != self.shown['arrow']:
+            draw_arrow(self.surface, state['arrow'])
+            dirty.append(ARROW_RECT)
+
+        for key, (font_key, color, anchor, pos) in TEXT_LABELS.items():
+            if not full and state[key] == self.shown[key]:
+                continue
+            font = self.fonts[font_key]
+            if not font:
+                continue
+
+            # Clear the old label, then draw the new one
+            old_rect = self.text_rects.get(key)
+            if old_rect:
+                self.surface.fill((0, 0, 0), old_rect)
+            txt_surf = font.render(state[key], True, color)
+            txt_rect = txt_surf.get_rect(**{anchor: pos})
+            self.surface.blit(txt_surf, txt_rect)
+            self.text_rects[key] = txt_rect
+            dirty.append(txt_rect.union(old_rect) if old_rect else txt_rect)
+
+        return [self.surface.get_rect()] if full else dirty
+
+    # Push dirty regions to fb1
+    def _flush(self, dirty):
+        if not self.tft_file:
+            return
+        for top, bottom in merge_row_bands(dirty):
+            self.converter.write_band(self.tft_file, self.surface, top, bottom, TFT_DITHER)
+        self.tft_file.flush()
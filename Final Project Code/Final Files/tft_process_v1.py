@@ -0,0 +1,153 @@
+# Malik F (mhf68) & Hetao Y (hy668)
+# Cockpit Process v1
+# Optional (off until it has been measured on the Pi): the piTFT cockpit is drawn and written to /dev/fb1 by a child
+# process, so it runs on another core.
+# Games only store roll, pitch, yaw and the cockpit mode in a small shared memory snapshot (a few float writes).
+# The child is started once, keeps running across game switches, and is stopped by the launcher on exit.
+# October 19, 2026
+
+import mmap
+import os
+import struct
+import subprocess
+import sys
+import tempfile
+import time
+import pygame
+import tft_cockpit_v1 as tft
+
+USE_COCKPIT_PROCESS = False
+
+# Snapshot layout (doubles). SEQ is odd while the game is writing, so the child never reads half an update.
+SEQ, STOP, ROLL, PITCH, YAW, MODE, REFRESH_HZ, INVALIDATE = range(8)
+SNAPSHOT_BYTES = 8 * 8
+MODE_WAITING, MODE_FLYING = 0.0, 1.0
+
+_process = None
+_cockpit = None
+
+
+# Game side of the cockpit: same calls as tft_cockpit_v1.CockpitView, but they only publish to shared memory
+class RemoteCockpit:
+    def __init__(self, path):
+        self.path = path
+        with open(path, 'r+b') as f:
+            self.mm = mmap.mmap(f.fileno(), SNAPSHOT_BYTES)
+        self.view = memoryview(self.mm).cast('d')
+        self.refresh_hz = tft.TFT_REFRESH_HZ
+
+    # Seqlock write of the orientation and mode
+    def _publish(self, mode, d_roll=0.0, d_pitch=0.0, d_yaw=0.0):
+        v = self.view
+        v[SEQ] += 1
+        v[ROLL], v[PITCH], v[YAW], v[MODE] = d_roll, d_pitch, d_yaw, mode
+        v[SEQ] += 1
+
+    def update(self, d_roll, d_pitch, d_yaw, now=None):
+        self._publish(MODE_FLYING, d_roll, d_pitch, d_yaw)
+        return True
+
+    # Font is chosen by the child process
+    def show_waiting(self, font=None):
+        self._publish(MODE_WAITING)
+
+    def set_refresh_hz(self, refresh_hz):
+        self.refresh_hz = refresh_hz
+        self.view[REFRESH_HZ] = refresh_hz
+
+    def invalidate(self):
+        self.view[INVALIDATE] += 1
+
+    def close(self):
+        self.view.release()
+        self.mm.close()
+
+
+# Start the cockpit process if it is not running yet, returns the shared RemoteCockpit
+def start(device='/dev/fb1'):
+    global _process, _cockpit
+    if _process is not None and _process.poll() is None:
+        return _cockpit
+
+    # Snapshot file lives in RAM (/dev/shm) when available
+    shm_dir = '/dev/shm' if os.path.isdir('/dev/shm') else None
+    fd, path = tempfile.mkstemp(prefix='palm_cockpit_', dir=shm_dir)
+    os.write(fd, struct.pack('8d', 0, 0, 0, 0, 0, MODE_WAITING, tft.TFT_REFRESH_HZ, 0))
+    os.close(fd)
+
+    _cockpit = RemoteCockpit(path)
+    _process = subprocess.Popen([sys.executable, os.path.abspath(__file__), path, device])
+    print(f"Cockpit process started (pid {_process.pid})")
+    return _cockpit
+
+# Ask the child to exit and remove the snapshot file (called once by the launcher)
+def stop(timeout=2.0):
+    global _process, _cockpit
+    if _process is None:
+        return
+    _cockpit.view[STOP] = 1
+    try:
+        _process.wait(timeout)
+    except subprocess.TimeoutExpired:
+        _process.kill()
+    _cockpit.close()
+    os.remove(_cockpit.path)
+    _process = _cockpit = None
+
+
+# Consistent copy of the snapshot, or None if the game was mid-write every try
+def read_snapshot(view):
+    for _ in range(3):
+        seq = view[SEQ]
+        if int(seq) % 2 == 0:
+            values = view[ROLL:INVALIDATE + 1].tolist()
+            if view[SEQ] == seq:
+                return values
+    return None
+
+# Child process: poll the snapshot and drive a normal CockpitView
+def run_child(path, device):
+    pygame.font.init()
+    status_font = pygame.font.SysFont("consolas", 28, bold=True)
+    label_font = pygame.font.SysFont("consolas", 20, bold=True)
+
+    tft_file = None
+    try:
+        tft_file = open(device, 'wb')
+    except IOError:
+        print(f"Could not open {device}. TFT output disabled.")
+
+    with open(path, 'r+b') as f:
+        mm = mmap.mmap(f.fileno(), SNAPSHOT_BYTES)
+    view = memoryview(mm).cast('d')
+    cockpit = tft.CockpitView(pygame.Surface((tft.TFT_W, tft.TFT_H)), tft_file, status_font, label_font)
+    parent = os.getppid()
+    invalidated = 0
+
+    # Exit when asked to, or when the launcher is gone (Ctrl+C reaches both processes)
+    try:
+        while view[STOP] == 0 and os.getppid() == parent:
+            snap = read_snapshot(view)
+            if snap:
+                d_roll, d_pitch, d_yaw, mode, refresh_hz, invalidate = snap
+                if refresh_hz != cockpit.refresh_hz:
+                    cockpit.set_refresh_hz(refresh_hz)
+                if invalidate != invalidated:
+                    invalidated = invalidate
+                    cockpit.invalidate()
+                if mode == MODE_WAITING:
+                    cockpit.show_waiting()
+                else:
+                    cockpit.update(d_roll, d_pitch, d_yaw)
+            time.sleep(0.5 / max(cockpit.refresh_hz, 1))
+    except KeyboardInterrupt:
+        pass
+
+    print(f"Cockpit process exiting ({cockpit.frames_pushed} frames pushed, {cockpit.frames_skipped} skipped)")
+    if tft_file: tft_file.close()
+    view.release()
+    mm.close()
+
+
+if __name__ == '__main__':
+    run_child(sys.argv[1], sys.argv[2])
@@ -0,0 +1,95 @@
+# Malik F (mhf68) & Hetao Y (hy668)
+# Tile World v1
+# Endless 2D world for the free roam. The ground is split into square tiles drawn from (seed, tile x, tile y) the first time
+# they come into view, then kept in a bounded LRU cache. Each frame only the tiles overlapping the camera are blitted.
+# Evicted tile surfaces are reused for new tiles, so memory stays flat however far the drone flies.
+# October 19, 2026
+
+import math
+import random
+import time
+from collections import OrderedDict
+import pygame
+
+# Tile settings
+TILE_SIZE = 256         # Pixels per tile side
+MAX_TILES = 24          # LRU capacity, more than the 5 x 3 tiles an 800x480 view can touch
+FEATURES_PER_TILE = 4
+
+# Ground colors
+FLOOR_COLOR = (30, 30, 35)
+PAD_COLORS = [(45, 60, 50), (55, 45, 45), (45, 50, 65)]
+CRATE_COLOR = (70, 60, 45)
+
+
+# Deterministic 32-bit seed for one tile
+def tile_seed(seed, tx, ty):
+    return (seed * 73856093 ^ tx * 19349663 ^ ty * 83492791) & 0xFFFFFFFF
+
+
+# Streams tiles around the camera
+class TileWorld:
+    def __init__(self, seed, tile_size=TILE_SIZE, max_tiles=MAX_TILES):
+        self.seed = seed
+        self.tile_size = tile_size
+        self.max_tiles = max_tiles
+        self.cache = OrderedDict()
+        self.stats = {'hits': 0, 'rendered': 0, 'evicted': 0, 'drawn': 0, 'render_ms_total': 0.0}
+
+    # Paint one tile into surf (landing pads, crates and a marker at the tile corner)
+    def _render(self, surf, tx, ty):
+        start = time.perf_counter()
+        rng = random.Random(tile_seed(self.seed, tx, ty))
+        size = self.tile_size
+        surf.fill(FLOOR_COLOR)
+        for _ in range(FEATURES_PER_TILE):
+            fx, fy = rng.randint(20, size - 20), rng.randint(20, size - 20)
+            if rng.random() < 0.5:
+                pygame.draw.circle(surf, rng.choice(PAD_COLORS), (fx, fy), rng.randint(12, 30))
+            else:
+                w, h = rng.randint(14, 40), rng.randint(14, 40)
+                pygame.draw.rect(surf, CRATE_COLOR, (fx - w // 2, fy - h // 2, w, h))
+        pygame.draw.circle(surf, (60, 60, 75), (0, 0), 6)
+
+        self.stats['rendered'] += 1
+        self.stats['render_ms_total'] += (time.perf_counter() - start) * 1000.0
+
+    # LRU lookup, renders on miss (into the evicted tile's surface once the cache is full)
+    def get_tile(self, tx, ty):
+        key = (tx, ty)
+        surf = self.cache.get(key)
+        if surf is not None:
+            self.cache.move_to_end(key)
+            self.stats['hits'] += 1
+            return surf
+
+        if len(self.cache) >= self.max_tiles:
+            _, surf = self.cache.popitem(last=False)
+            self.stats['evicted'] += 1
+        else:
+            surf = pygame.Surface((self.tile_size, self.tile_size))
+            if pygame.display.get_surface():
+                surf = surf.convert()
+        self._render(surf, tx, ty)
+        self.cache[key] = surf
+        return surf
+
+    # Blit the tiles overlapping the view whose top left corner is world (cam_x, cam_y)
+    def draw(self, surface, cam_x, cam_y):
+        size = self.tile_size
+        view_w, view_h = surface.get_size()
+        tx0, ty0 = int(math.floor(cam_x / size)), int(math.floor(cam_y / size))
+        tx1, ty1 = int(math.floor((cam_x + view_w - 1) / size)), int(math.floor((cam_y + view_h - 1) / size))
+        ox, oy = int(round(cam_x)), int(round(cam_y))
+        for ty in range(ty0, ty1 + 1):
+            for tx in range(tx0, tx1 + 1):
+                surface.blit(self.get_tile(tx, ty), (tx * size - ox, ty * size - oy))
+        self.stats['drawn'] = (tx1 - tx0 + 1) * (ty1 - ty0 + 1)
+
+    # Drop every cached tile
+    def reset(self):
+        self.cache.clear()
+
+    # Cache counters plus how many tiles are held
+    def summary(self):
+        return dict(self.stats, cached=len(self.cache), render_ms_total=round(self.stats['render_ms_total'], 1))
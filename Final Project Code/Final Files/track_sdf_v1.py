@@ -0,0 +1,173 @@
+# Malik F (mhf68) & Hetao Y (hy668)
+# Track SDF v1
+# Time trial courses for the 2D free roam. A track file lists walls (thick segments, circles, boxes), checkpoint gates and the
+# start point. The walls are rasterized once into a signed distance field (NumPy array, negative inside a wall), so wall
+# collision and the proximity warning are one array lookup per step no matter how many walls the track has.
+# Built fields are cached in memory and on disk (keyed by the file contents), so only the first load pays for the build.
+# October 19, 2026
+
+import hashlib
+import os
+import tempfile
+import time
+import numpy as np
+import pygame
+
+# Field settings
+SDF_SCALE = 2           # Screen pixels per field cell
+OUTSIDE = 1000.0        # Distance used where there are no walls at all
+CACHE_DIR = tempfile.gettempdir()
+
+# Drawing colors
+FLOOR_COLOR = (30, 30, 35)
+WALL_COLOR = (70, 70, 95)
+EDGE_COLOR = (150, 150, 200)
+GATE_COLOR = (60, 60, 70)
+NEXT_GATE_COLOR = (50, 255, 50)
+
+# Tracks already loaded this run, path -> Track
+_tracks = {}
+
+
+# Parse a track file: one item per line, '#' starts a comment
+#   name <text>
+#   wall x0 y0 x1 y1 thickness     thick line segment with round ends
+#   post x y radius
+#   block x y w h
+#   gate x0 y0 x1 y1               checkpoints in lap order, the first one is start/finish
+#   start x y
+def parse_track(text):
+    track = {'name': 'Track', 'walls': [], 'posts': [], 'blocks': [], 'gates': [], 'start': (0.0, 0.0)}
+    for line_no, line in enumerate(text.splitlines(), 1):
+        words = line.split('#', 1)[0].split()
+        if not words:
+            continue
+        kind, args = words[0], words[1:]
+        try:
+            if kind == 'name':
+                track['name'] = ' '.join(args)
+            elif kind == 'start':
+                track['start'] = tuple(float(a) for a in args[:2])
+            elif kind in ('wall', 'post', 'block', 'gate'):
+                sizes = {'wall': 5, 'post': 3, 'block': 4, 'gate': 4}
+                if len(args) != sizes[kind]:
+                    raise ValueError(f"{kind} needs {sizes[kind]} numbers")
+                track[kind + 's'].append(tuple(float(a) for a in args))
+            else:
+                raise ValueError(f"unknown item '{kind}'")
+        except ValueError as e:
+            raise ValueError(f"Track line {line_no}: {e}")
+    if not track['gates']:
+        raise ValueError("Track needs at least one gate")
+    return track
+
+# Signed distance from every cell center to the nearest wall (negative inside), shape (rows, cols)
+def build_sdf(track, width, height, scale=SDF_SCALE):
+    px = (np.arange(width // scale) + 0.5) * scale
+    py = (np.arange(height // scale) + 0.5) * scale
+    X, Y = np.meshgrid(px, py)
+    sdf = np.full(X.shape, OUTSIDE)
+
+    for x0, y0, x1, y1, thickness in track['walls']:
+        dx, dy = x1 - x0, y1 - y0
+        t = np.clip(((X - x0) * dx + (Y - y0) * dy) / max(dx * dx + dy * dy, 1e-9), 0.0, 1.0)
+        np.minimum(sdf, np.hypot(X - x0 - t * dx, Y - y0 - t * dy) - thickness / 2.0, out=sdf)
+    for cx, cy, radius in track['posts']:
+        np.minimum(sdf, np.hypot(X - cx, Y - cy) - radius, out=sdf)
+    for left, top, w, h in track['blocks']:
+        qx = np.abs(X - (left + w / 2.0)) - w / 2.0
+        qy = np.abs(Y - (top + h / 2.0)) - h / 2.0
+        box = np.hypot(np.maximum(qx, 0.0), np.maximum(qy, 0.0)) + np.minimum(np.maximum(qx, qy), 0.0)
+        np.minimum(sdf, box, out=sdf)
+    return sdf.astype(np.float32)
+
+# Does segment a->b cross segment c->d
+def segments_cross(ax, ay, bx, by, cx, cy, dx, dy):
+    d1 = (dx - cx) * (ay - cy) - (dy - cy) * (ax - cx)
+    d2 = (dx - cx) * (by - cy) - (dy - cy) * (bx - cx)
+    d3 = (bx - ax) * (cy - ay) - (by - ay) * (cx - ax)
+    d4 = (bx - ax) * (dy - ay) - (by - ay) * (dx - ax)
+    return (d1 > 0) != (d2 > 0) and (d3 > 0) != (d4 > 0)
+
+
+# Loaded track: distance field, wall normals, gates and a pre-drawn background
+class Track:
+    def __init__(self, track, sdf, width, height, scale=SDF_SCALE):
+        self.name = track['name']
+        self.gates = track['gates']
+        self.start = track['start']
+        self.width, self.height = width, height
+        self.scale = scale
+        self.sdf = sdf
+        self.rows, self.cols = sdf.shape
+
+        # Unit normals pointing away from the nearest wall (field gradient)
+        gy, gx = np.gradient(sdf)
+        length = np.maximum(np.hypot(gx, gy), 1e-6)
+        self.nx = (gx / length).astype(np.float32)
+        self.ny = (gy / length).astype(np.float32)
+        self.surface = None
+
+    def _cell(self, x, y):
+        col = min(max(int(x) // self.scale, 0), self.cols - 1)
+        row = min(max(int(y) // self.scale, 0), self.rows - 1)
+        return row, col
+
+    # Distance from (x, y) to the nearest wall (negative inside a wall)
+    def distance(self, x, y):
+        return float(self.sdf[self._cell(x, y)])
+
+    # Unit direction away from the nearest wall at (x, y)
+    def normal(self, x, y):
+        cell = self._cell(x, y)
+        return float(self.nx[cell]), float(self.ny[cell])
+
+    # True if the move from (x0, y0) to (x1, y1) flies through gate `index`
+    def crosses_gate(self, index, x0, y0, x1, y1):
+        gx0, gy0, gx1, gy1 = self.gates[index]
+        return segments_cross(x0, y0, x1, y1, gx0, gy0, gx1, gy1)
+
+    # Floor and walls drawn once from the field (edges where the distance is near 0)
+    def background(self):
+        if self.surface is None:
+            d = self.sdf.T
+            rgb = np.empty(d.shape + (3,), dtype=np.uint8)
+            rgb[...] = FLOOR_COLOR
+            rgb[d < 0] = WALL_COLOR
+            rgb[np.abs(d) < self.scale] = EDGE_COLOR
+            small = pygame.surfarray.make_surface(rgb)
+            self.surface = pygame.transform.scale(small, (self.width, self.height))
+            if pygame.display.get_surface():
+                self.surface = self.surface.convert()
+        return self.surface
+
+    # Gates as lines, the next one to fly through highlighted
+    def draw_gates(self, surface, next_gate):
+        for i, (x0, y0, x1, y1) in enumerate(self.gates):
+            color = NEXT_GATE_COLOR if i == next_gate else GATE_COLOR
+            pygame.draw.line(surface, color, (x0, y0), (x1, y1), 3 if i == next_gate else 1)
+
+
+# Load a track file for a width x height screen (built field comes from the memory or disk cache when possible)
+def load_track(path, width, height, scale=SDF_SCALE):
+    if path in _tracks:
+        return _tracks[path]
+
+    with open(path, 'rb') as f:
+        data = f.read()
+    track = parse_track(data.decode('utf-8'))
+    key = hashlib.sha1(data + f"{width}x{height}/{scale}".encode()).hexdigest()[:16]
+    cache_path = os.path.join(CACHE_DIR, f"palm_track_{key}.npy")
+    try:
+        sdf = np.load(cache_path)
+    except (OSError, ValueError):
+        t0 = time.perf_counter()
+        sdf = build_sdf(track, width, height, scale)
+        print(f"Built track field for {track['name']} ({sdf.shape[1]}x{sdf.shape[0]}) in {(time.perf_counter() - t0) * 1000:.0f} ms")
+        try:
+            np.save(cache_path, sdf)
+        except OSError:
+            pass
+
+    _tracks[path] = Track(track, sdf, width, height, scale)
+    return _tracks[path]
@@ -0,0 +1,108 @@
+# Malik F (mhf68) & Hetao Y (hy668)
+# World Chunk Streaming v1
+# The 3D world is split into square chunks generated from (seed, chunk x, chunk z) when the camera gets close.
+# Chunks live in a bounded LRU cache, so flying forever never grows memory and the world never repeats.
+# October 19, 2026
+
+import math
+import random
+import time
+from collections import OrderedDict
+import numpy as np
+import scene3d_v1 as scene3d
+
+# Chunk settings
+CHUNK_SIZE = 600        # World units per chunk side
+VIEW_RADIUS = 3         # Chunks loaded around the camera in each direction
+MAX_CHUNKS = 64         # LRU capacity, at least (2 * VIEW_RADIUS + 1)^2
+GRASS_PER_CHUNK = 32
+
+
+# Deterministic 32-bit seed for one chunk
+def chunk_seed(seed, cx, cz):
+    return (seed * 73856093 ^ cx * 19349663 ^ cz * 83492791) & 0xFFFFFFFF
+
+
+# Contents of one chunk in world coordinates
+class Chunk:
+    def __init__(self, cx, cz, grass_x, grass_z, objects):
+        self.cx, self.cz = cx, cz
+        self.grass_x = grass_x
+        self.grass_z = grass_z
+        self.objects = objects
+
+
+# Streams chunks around the camera
+class ChunkWorld:
+    # populate(rng, x0, z0, size) returns a list of scene nodes for the chunk
+    def __init__(self, seed, populate=None, chunk_size=CHUNK_SIZE, view_radius=VIEW_RADIUS, max_chunks=MAX_CHUNKS):
+        self.seed = seed
+        self.populate = populate
+        self.chunk_size = chunk_size
+        self.view_radius = view_radius
+        self.max_chunks = max(max_chunks, (2 * view_radius + 1) ** 2)
+        self.cache = OrderedDict()
+
+        # Visible set, rebuilt only when the camera crosses a chunk border
+        self.center = None
+        self.visible = []
+        self.grass_x = np.zeros(0)
+        self.grass_z = np.zeros(0)
+        self.scene = scene3d.Scene()
+
+        self.stats = {'hits': 0, 'generated': 0, 'evicted': 0, 'gen_ms_total': 0.0, 'gen_ms_last': 0.0}
+
+    # Build one chunk from its seed
+    def _generate(self, cx, cz):
+        start = time.perf_counter()
+        x0, z0 = cx * self.chunk_size, cz * self.chunk_size
+        s = chunk_seed(self.seed, cx, cz)
+
+        np_rng = np.random.default_rng(s)
+        grass_x = x0 + np_rng.random(GRASS_PER_CHUNK) * self.chunk_size
+        grass_z = z0 + np_rng.random(GRASS_PER_CHUNK) * self.chunk_size
+        objects = self.populate(random.Random(s), x0, z0, self.chunk_size) if self.populate else []
+
+        ms = (time.perf_counter() - start) * 1000.0
+        self.stats['generated'] += 1
+        self.stats['gen_ms_total'] += ms
+        self.stats['gen_ms_last'] = ms
+        return Chunk(cx, cz, grass_x, grass_z, objects)
+
+    # LRU lookup, generates on miss and evicts the least recently used chunk
+    def get_chunk(self, cx, cz):
+        key = (cx, cz)
+        chunk = self.cache.get(key)
+        if chunk is not None:
+            self.cache.move_to_end(key)
+            self.stats['hits'] += 1
+            return chunk
+
+        chunk = self._generate(cx, cz)
+        self.cache[key] = chunk
+        while len(self.cache) > self.max_chunks:
+            self.cache.popitem(last=False)
+            self.stats['evicted'] += 1
+        return chunk
+
+    # Drop every cached chunk (e.g. when the ground under the objects changes)
+    def reset(self):
+        self.cache.clear()
+        self.center = None
+
+    # Load chunks around the camera. Returns True if the visible set changed.
+    def update(self, cam_x, cam_z):
+        center = (int(math.floor(cam_x / self.chunk_size)), int(math.floor(cam_z / self.chunk_size)))
+        if center == self.center:
+            return False
+        self.center = center
+
+        r = self.view_radius
+        self.visible = [self.get_chunk(center[0] + dx, center[1] + dz)
+                        for dz in range(-r, r + 1) for dx in range(-r, r + 1)]
+
+        # One array for all visible grass and one scene for all visible objects
+        self.grass_x = np.concatenate([c.grass_x for c in self.visible])
+        self.grass_z = np.concatenate([c.grass_z for c in self.visible])
+        self.scene.set_nodes([node for c in self.visible for node in c.objects])
+        return True